@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time spent building the items of the XML iterator, with the field-selective materializers of the mapping functions
+declared with 'reads' against the previous generic elem2dict, which built every field of every item.
+
+    python benchmarks/elem2dict.py path_to_file.spold path_to_process.xml ...
+
+The items are verified to be the same as the ones of the previous elem2dict (restricted to the declared fields).
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from Lavoisier.formats import XMLStreamIterable
+from xml_stream import mapping_keys, run
+
+class ReferenceIterable(XMLStreamIterable):
+    # Previous implementation, with all the items built by elem2dict
+
+    def __init__(self, file, keys):
+        super().__init__(file, keys)
+        self._materializers = dict.fromkeys(keys, self.elem2dict)
+
+    def elem2dict(self, e):
+
+        result = {
+            **{("@"+x.rpartition("}")[-1] if '}' in x else "@"+x): y for x, y in e.attrib.items()},
+            **({'#text': e.text} if e.text and not e.text.isspace() else {}),
+        }
+
+        if len(e) == 0 and '@lang' in result and '#text' not in result:
+            result["#text"] = ''
+
+        for t in e:
+            n = t.tag.rpartition("}")[-1] if '}' in t.tag else t.tag
+            if n in result:
+                ln = result[n]
+                result[n] = (ln if isinstance(ln, list)
+                             else [ln]) + [self.elem2dict(t)]
+            else:
+                result[n] = self.elem2dict(t)
+
+        if list(result) == ['#text']:
+            result = result['#text']
+
+        return result
+
+def verify(path, keys):
+    with open(path, 'r') as f, open(path, 'r') as g:
+        for (key, item), (_, reference) in zip(XMLStreamIterable(f, keys), ReferenceIterable(g, keys), strict=True):
+            fields = getattr(keys[key], 'fields', None)
+            if fields is not None and isinstance(reference, dict):
+                reference = {k: v for k, v in reference.items() if k in fields}
+            assert item == reference, key
+    return sum(getattr(func, 'fields', None) is not None for func in keys.values())
+
+if __name__ == '__main__':
+    repeat = 3
+    for path in sys.argv[1:]:
+        keys = mapping_keys(path)
+        selective = verify(path, keys)
+        print(f"{Path(path).name}: {len(keys)} keys, {selective} with declared fields")
+        for iterator in (ReferenceIterable, XMLStreamIterable):
+            print(f"\t{iterator.__name__}: {run(iterator, path, keys, repeat):.2f} s")
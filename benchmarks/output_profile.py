@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Size and write time of the output packages with each output profile (XML indentation and compression). The process
+of the conversion of the given file, whose lists of DotDicts are repeated, is written several times in a package.
+
+    python benchmarks/output_profile.py path_to_file.spold repetitions members [elementary_flow_mapping.json]
+
+See 'benchmarks/xml_writer.py' for the conversions of each type of file.
+"""
+
+import sys
+import time
+import zipfile
+import tempfile
+from pathlib import Path
+
+from xml_writer import get_tree, repeat_lists
+from Lavoisier.formats import OutputProfile, OUTPUT_PROFILES, FileSink
+from Lavoisier.formats.utils import ZipPackage
+
+PROFILES = {**{f'{name} ({"pretty" if p.pretty else "compact"})': p for name, p in OUTPUT_PROFILES.items()},
+            'pretty, deflate 6': OutputProfile(compression=zipfile.ZIP_DEFLATED),
+            **{f'compact, deflate {i}': OutputProfile(pretty=False, compression=zipfile.ZIP_DEFLATED, compresslevel=i)
+               for i in range(1, 10)}}
+
+def run(tree, profile, members):
+    with tempfile.TemporaryDirectory() as tempdir:
+        start = time.perf_counter()
+        sink = FileSink(tempdir)
+        package = ZipPackage(sink.create(), profile=profile)
+        for i in range(members):
+            package.write_xml(f'processes/{i}.xml', tree)
+        package.save(sink, 'ILCD.zip')
+        elapsed = time.perf_counter() - start
+        return elapsed, Path(tempdir, 'ILCD.zip').stat().st_size
+
+if __name__ == '__main__':
+    tree = get_tree(sys.argv[1], sys.argv[4] if len(sys.argv) > 4 else None)
+    repeat_lists(tree, int(sys.argv[2]) if len(sys.argv) > 2 else 100)
+    members = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    results = {name: run(tree, profile, members) for name, profile in PROFILES.items()}
+    base = results['default (pretty)']
+    print(f"{Path(sys.argv[1]).name}: {members} processes")
+    for name, (elapsed, size) in results.items():
+        print(f"\t{name:<20} {elapsed:6.2f} s ({elapsed / base[0]:4.2f}x) {size / 2**20:8.1f} MB ({size / base[1]:5.1%})")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Parsing speed of the XML iterators (xml.etree, expat and lxml parsers) with the keys of the mappings, in XML events
+(element starts and ends) per second. The fastest installed one can be set as the iterator of the converter.
+
+    python benchmarks/xml_stream.py path_to_file.spold path_to_process.xml ...
+
+EcoSpold2 files (.spold) are read with the EcoSpold2 to ILCD1 mapping keys and ILCD1 processes (.xml) with the
+ILCD1 to EcoSpold2 ones. The lxml iterator is skipped if lxml is not installed.
+"""
+
+import sys
+import time
+from pathlib import Path
+import xml.etree.ElementTree as etree
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from Lavoisier.conversions import MappingFactory
+from Lavoisier.formats import DefaultMappingConfig, XMLStreamIterable, ExpatStreamIterable, LXMLStreamIterable
+
+MAPPINGS = {'.spold': (('EcoSpold2', 'ILCD1'), ('2', '0')),
+            '.xml': (('ILCD1', 'EcoSpold2'), ('1', '1'))}
+ITERATORS = (XMLStreamIterable, ExpatStreamIterable, LXMLStreamIterable)
+
+def mapping_keys(path):
+    names, version = MAPPINGS[Path(path).suffix.lower()]
+    return MappingFactory(names, (None, None)).get_mapping(DefaultMappingConfig, version).mapping()
+
+def run(iterator, path, keys, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        with open(path, 'r') as f:
+            for _ in iterator(f, keys):
+                pass
+        best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == '__main__':
+    repeat = 3
+    for path in sys.argv[1:]:
+        keys = mapping_keys(path)
+        events = sum(1 for _ in etree.iterparse(path, events=('start', 'end')))
+        print(f"{Path(path).name}: {Path(path).stat().st_size / 2**20:.1f} MB, {events} events")
+        for iterator in ITERATORS:
+            try:
+                elapsed = run(iterator, path, keys, repeat)
+            except ImportError as e:
+                print(f"\t{iterator.__name__}: {e}")
+                continue
+            print(f"\t{iterator.__name__}: {elapsed:.2f} s, {events / elapsed:,.0f} events/s")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Time and peak memory of the output serialization, with the XMLWriter streaming the structure against the previous
+xmltodict.unparse of the whole dict. The structure is the output of the conversion of the given file, whose lists of
+DotDicts (e.g. exchanges) are repeated to get a large dataset.
+
+    python benchmarks/xml_writer.py path_to_file.spold repetitions [elementary_flow_mapping.json]
+
+EcoSpold2 files (.spold) are converted to ILCD1 and ILCD1 packages (.zip) to EcoSpold2. The outputs of both
+serializers are verified to be the same.
+"""
+
+import sys
+import time
+import tempfile
+import tracemalloc
+from pathlib import Path
+import xmltodict
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+from Lavoisier import get_converter
+from Lavoisier.data_structures import DotDict
+from Lavoisier.data_structures.main import to_dict
+from Lavoisier.data_structures.writer import XMLWriter
+
+CONVERSIONS = {'.spold': (("EcoSpold2", "ecoinvent3.7"), ("ILCD1", "EF3.0")),
+               '.zip': (("ILCD1", "EF3.0"), ("EcoSpold2", "ecoinvent3.7"))}
+
+def get_tree(path, elem_flow_mapping=None):
+    # Tree of the last structure written by the conversion (the process, after its additional datasets)
+    trees, write = [], XMLWriter.write
+    def capture(self, tree, stream):
+        trees.append(tree)
+        write(self, tree, stream)
+    XMLWriter.write = capture
+    try:
+        with tempfile.TemporaryDirectory() as save_path:
+            converter = get_converter(*CONVERSIONS[Path(path).suffix.lower()], path, save_path)
+            if elem_flow_mapping is not None:
+                converter.elem_flow_mapping = elem_flow_mapping
+            converter.convert('to_file')
+    finally:
+        XMLWriter.write = write
+    return trees[-1]
+
+def repeat_lists(tree, n):
+    for value in tree.values():
+        if isinstance(value, DotDict):
+            for key, v in value.items():
+                if isinstance(v, list) and v and isinstance(v[0], DotDict):
+                    dict.__setitem__(value, key, v * n)
+        elif isinstance(value, dict):
+            repeat_lists(value, n)
+
+def unparse(tree, f):
+    f.write(xmltodict.unparse(to_dict(tree), pretty=True, newl='\n', indent="  "))
+
+def stream(tree, f):
+    XMLWriter().write(tree, f)
+
+def run(func, tree):
+    # Time and peak memory are measured in different runs, as tracing the memory slows the serialization
+    with tempfile.TemporaryFile('w+') as f:
+        start = time.perf_counter()
+        func(tree, f)
+        elapsed = time.perf_counter() - start
+        f.seek(0)
+        output = f.read()
+    with tempfile.TemporaryFile('w') as f:
+        tracemalloc.start()
+        func(tree, f)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, peak, output
+
+if __name__ == '__main__':
+    tree = get_tree(sys.argv[1], sys.argv[3] if len(sys.argv) > 3 else None)
+    repeat_lists(tree, int(sys.argv[2]) if len(sys.argv) > 2 else 1000)
+    results = {func.__name__: run(func, tree) for func in (unparse, stream)}
+    assert results['unparse'][2] == results['stream'][2]
+    print(f"{Path(sys.argv[1]).name}: {len(results['stream'][2]) / 2**20:.1f} MB of XML")
+    for name, (elapsed, peak, _) in results.items():
+        print(f"\t{name}: {elapsed:.2f} s, peak of {peak / 2**20:.1f} MB")
@@ -15,6 +15,29 @@ from .converter import (
     # MultipleDatasetConverter,
     ConverterFactory
 )
+from .formats import (
+    OutputProfile,
+    OUTPUT_PROFILES,
+    OutputSink,
+    FileSink,
+    MemorySink,
+    TarSink,
+    SQLiteSink
+)
+from .manifest import (
+    ConversionManifest,
+    ManifestRunner,
+    run_manifest
+)
+from .fanout import (
+    FanOutConverter,
+    get_fanout_converter
+)
+from .catalog import (
+    CatalogScanner,
+    CatalogEntry,
+    scan_catalog
+)
 
 # from .download_external_files import (
 #     download
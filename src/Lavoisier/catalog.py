@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import csv
+import sqlite3
+import zipfile
+from copy import copy
+from pathlib import Path
+from itertools import repeat
+from dataclasses import dataclass, fields, astuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .formats import ECS2InputConfig, ILCD1InputConfig, OLCAILCD1InputConfig, XMLStreamIterable, reads
+
+@dataclass
+class CatalogEntry:
+    input_path: str         # Standalone input (file or compressed package)
+    file: str               # Dataset inside the compressed package ('' if the input is the dataset)
+    uuid: str = None
+    name: str = None
+    version: str = None
+    geography: str = None
+    start: str = None       # Time period of the dataset
+    end: str = None
+    exchanges: int = None   # None if the exchanges are not counted
+    size: int = 0           # Bytes of the dataset (uncompressed)
+
+def _text(x):
+    return x if isinstance(x, str) else x.get('#text')
+
+_count = reads()(lambda x: 1) # Only the number of elements is needed
+
+# Field of the entry and function of each key. The first item of a key is kept, except for the 'exchanges' ones,
+# which are counted
+ECS2_CATALOG_KEYS = {path.format(dataset): value for dataset in ('activityDataset', 'childActivityDataset') for path, value in {
+    "/ecoSpold/{}/activityDescription/activity/@id": ('uuid', str),
+    "/ecoSpold/{}/activityDescription/activity/activityName": ('name', reads('#text')(_text)),
+    "/ecoSpold/{}/activityDescription/geography/shortname": ('geography', reads('#text')(_text)),
+    "/ecoSpold/{}/activityDescription/timePeriod/@startDate": ('start', str),
+    "/ecoSpold/{}/activityDescription/timePeriod/@endDate": ('end', str),
+    "/ecoSpold/{}/flowData/intermediateExchange": ('exchanges', _count),
+    "/ecoSpold/{}/flowData/elementaryExchange": ('exchanges', _count),
+    "/ecoSpold/{}/administrativeInformation/fileAttributes":
+        ('version', reads('@majorRelease', '@minorRelease')(lambda x: f"{x.get('@majorRelease')}.{x.get('@minorRelease')}"))
+    }.items()}
+
+ILCD1_CATALOG_KEYS = {
+    "/processDataSet/processInformation/dataSetInformation/UUID": ('uuid', reads('#text')(_text)),
+    "/processDataSet/processInformation/dataSetInformation/name/baseName": ('name', reads('#text')(_text)),
+    "/processDataSet/processInformation/geography/locationOfOperationSupplyOrProduction/@location": ('geography', str),
+    "/processDataSet/processInformation/time/referenceYear": ('start', reads('#text')(_text)),
+    "/processDataSet/processInformation/time/dataSetValidUntil": ('end', reads('#text')(_text)),
+    "/processDataSet/administrativeInformation/publicationAndOwnership/dataSetVersion": ('version', reads('#text')(_text)),
+    "/processDataSet/exchanges/exchange": ('exchanges', _count)
+    }
+
+class CatalogScanner:
+    # Inventory of the datasets of an input (UUID, name, version, geography, time period, number of exchanges and
+    # size), read from their headers without converting them. The parsing of a dataset stops as soon as its fields
+    # are found, so only at its end if the exchanges are counted. The datasets of compressed ILCD packages are read
+    # without extracting them
+
+    formats = {
+        'EcoSpold2': (ECS2InputConfig, ECS2_CATALOG_KEYS),
+        'ILCD1': (ILCD1InputConfig, ILCD1_CATALOG_KEYS),
+        'OLCAILCD1': (OLCAILCD1InputConfig, ILCD1_CATALOG_KEYS)
+        }
+    chunk_size = 256 # Datasets of a compressed package scanned by a worker at a time
+
+    def __init__(self, format_, path, count_exchanges=True):
+        if format_ not in self.formats:
+            raise ValueError(f"Invalid catalog format '{format_}'. Must be one of {', '.join(self.formats)}")
+        self.format_ = format_
+        self.path = Path(path)
+        self.count_exchanges = count_exchanges
+        self.iterator = XMLStreamIterable
+        self.inputs = sorted(self.formats[format_][0].input_manager(self.path).get_inputs()) # Standalone inputs to scan
+
+    @property
+    def keys(self):
+        keys = self.formats[self.format_][1]
+        return keys if self.count_exchanges else {k: v for k, v in keys.items() if v[0] != 'exchanges'}
+
+    def _get_tasks(self):
+        # Standalone inputs, the compressed packages being split in chunks of datasets
+        for input_ in self.inputs:
+            if not zipfile.is_zipfile(input_):
+                yield input_, None
+                continue
+            with zipfile.ZipFile(input_) as f:
+                members = [x for x in f.namelist() if (x.startswith("processes/") or x.find("/processes/") != -1) and x.endswith(".xml")]
+            for i in range(0, len(members), self.chunk_size):
+                yield input_, members[i:i+self.chunk_size]
+
+    def _scan_stream(self, entry, stream):
+        keys = self.keys
+        needed = {field for field, _ in keys.values() if field != 'exchanges'}
+        if self.count_exchanges:
+            entry.exchanges = 0
+        for path, t in self.iterator(stream, {path: func for path, (_, func) in keys.items()}):
+            field, func = keys[path]
+            if field == 'exchanges':
+                entry.exchanges += 1
+            elif field in needed:
+                setattr(entry, field, func(t))
+                needed.discard(field)
+                if not needed and not self.count_exchanges: # The rest of the file is not parsed
+                    break
+        return entry
+
+    def _scan_task(self, input_, members):
+        if members is None:
+            with open(input_, 'rb') as f:
+                return [self._scan_stream(CatalogEntry(str(input_), '', size=Path(input_).stat().st_size), f)]
+        with zipfile.ZipFile(input_) as z:
+            entries = []
+            for member in members:
+                with z.open(member) as f:
+                    entries.append(self._scan_stream(CatalogEntry(str(input_), member, size=z.getinfo(member).file_size), f))
+            return entries
+
+    def scan(self, workers=1):
+        # Entries of all the datasets, in the order of the inputs
+        tasks = list(self._get_tasks())
+        if workers > 1 and tasks:
+            # Each worker receives the scanner once, without its inputs, and the tasks in chunks
+            scanner = copy(self)
+            scanner.inputs = []
+            with ProcessPoolExecutor(max_workers=workers, initializer=_start_worker, initargs=(scanner,)) as executor:
+                results = executor.map(_scan_in_worker, *zip(*tasks), chunksize=max(1, len(tasks) // (workers * 8)))
+                return [entry for entries in results for entry in entries]
+        return [entry for input_, members in tasks for entry in self._scan_task(input_, members)]
+
+    @staticmethod
+    def to_csv(entries, path):
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow([x.name for x in fields(CatalogEntry)])
+            writer.writerows(astuple(entry) for entry in entries)
+
+    @staticmethod
+    def to_sqlite(entries, path, table='catalog'):
+        # The table is replaced if it exists
+        names = [x.name for x in fields(CatalogEntry)]
+        with sqlite3.connect(path) as db:
+            db.execute(f"DROP TABLE IF EXISTS {table}")
+            db.execute(f"CREATE TABLE {table} ({', '.join(x + (' INTEGER' if x in ('exchanges', 'size') else ' TEXT') for x in names)})")
+            db.executemany(f"INSERT INTO {table} VALUES ({', '.join(repeat('?', len(names)))})", (astuple(entry) for entry in entries))
+        db.close()
+
+    def write(self, path, workers=1):
+        # Writes the catalog as CSV (.csv) or SQLite (.db, .sqlite, .sqlite3) and returns its entries
+        suffix = Path(path).suffix.lower()
+        if suffix not in ('.csv', '.db', '.sqlite', '.sqlite3'):
+            raise ValueError(f"{path} is not a valid catalog path. Must be a .csv, .db, .sqlite or .sqlite3")
+        entries = self.scan(workers)
+        if suffix == '.csv':
+            self.to_csv(entries, path)
+        else:
+            self.to_sqlite(entries, path)
+        return entries
+
+
+_worker_scanner = None
+
+def _start_worker(scanner):
+    global _worker_scanner
+    _worker_scanner = scanner
+
+def _scan_in_worker(input_, members):
+    return _worker_scanner._scan_task(input_, members)
+
+def scan_catalog(format_: str, path: str, save_path: str, workers: int = 1, count_exchanges: bool = True):
+    return CatalogScanner(format_, path, count_exchanges).write(save_path, workers)
@@ -29,8 +29,11 @@ from .utils import (
     copy_file,
     correct_dimensionality,
     FieldMapping,
+    ConversionContext,
+    state_holder,
     Print
 )
+from ..formats.utils import reads
 from .units import (
     pint_to_ilcd_def,
     pint_to_ilcd_fp,
@@ -361,13 +364,13 @@ class ECS2ToILCD1VariableConversion:
         _math = self.get_math(amount, self._math) if self._math else None
         _name = self.get_str(amount, self._name)
         _name = _name if len(_name) <= 50 else _name.split('__from')[0]+'__uc'
-        return ECS2ToILCD1VariableConversion(_name, _math, convert_unit)
+        return type(self)(_name, _math, convert_unit)
 
-    @staticmethod
-    def unit_conversion_var(amount):
+    @classmethod
+    def unit_conversion_var(cls, amount):
         _math = None
         _name = amount.get_conversion_str()
-        return ECS2ToILCD1VariableConversion(_name, _math)
+        return cls(_name, _math)
 
 
 class AmountWithVariable(Amount, ABC):
@@ -486,7 +489,7 @@ class ECS2ToILCD1Amount(AmountWithVariable):
                 field.variableParameter = x
 
             # Conversion
-            amount = ECS2ToILCD1Amount.from_single_init(
+            amount = type(self).from_single_init(
                 self.f, 'dimensionless')
             var_c = self._var.unit_conversion_var(self)
             c = [ILCD1Helper.text_dict_from_text(-1, f"\nConversion from {self.get_original_unit_str()} to {self.get_final_unit_str()}")]
@@ -973,7 +976,7 @@ class ECS2ToILCD1FlowConversion(ECS2ToILCD1QuantitativeObject):
                                                              x.get('@pageNumbers')))
 
         # Append self
-        ECS2ToILCD1FlowConversion._all_flows.append(self)
+        state_holder(self, ECS2ToILCD1FlowConversion)._all_flows.append(self)
 
     def basic_initialization(self, x):
         self.id_ = x['@id']
@@ -1009,7 +1012,7 @@ class ECS2ToILCD1FlowConversion(ECS2ToILCD1QuantitativeObject):
                 self.ftype = "Elementary flow" if self.direction_type == '4' else "Product flow"
 
         # Due to inheritance, type(self) is not the ideal here since a call from Elementary would reset the counter
-        cls = ECS2ToILCD1FlowConversion
+        cls = state_holder(self, ECS2ToILCD1FlowConversion)
         self.field.dataSetInternalID = cls._flow_internal_id_counter
         if self.direction == "Output" and self.direction_type == "0":
             setattr(cls.quantity_holder, 'referenceToReferenceFlow', cls._flow_internal_id_counter)
@@ -1022,7 +1025,7 @@ class ECS2ToILCD1FlowConversion(ECS2ToILCD1QuantitativeObject):
         cls._flow_internal_id_counter += 1
 
     def get_allocation(self):
-        cls = ECS2ToILCD1FlowConversion
+        cls = state_holder(self, ECS2ToILCD1FlowConversion)
         if self.id_ in cls._allocation_properties.keys():
             n = sum([x for x in cls._allocation_properties.values()])
             s = self.field.allocations.get_class('allocation')
@@ -1040,7 +1043,7 @@ class ECS2ToILCD1FlowConversion(ECS2ToILCD1QuantitativeObject):
             if hasattr(self, 'allocation_property') and prop['@propertyId'] == self.allocation_property:
                 logging.info(
                     f"\tAllocated flow by property {ILCD1Helper.return_text(prop['name'])}")
-                ECS2ToILCD1FlowConversion._allocation_properties.update(
+                state_holder(self, ECS2ToILCD1FlowConversion)._allocation_properties.update(
                     {self.id_: p.amount.o.m * self.amount.o.m})
             if p.is_considered:
                 self.properties[ILCD1Helper.return_text(prop['name'])] = p
@@ -1419,11 +1422,13 @@ class ECS2ToILCD1ReferenceConversion:
     class AdditionalDataset(ABC):  # [!] Maybe make them DotDicts
 
         def __init__(self, ref, info, output_name_with_version=False):
+            self._ref_class = type(ref)
             self.name = ref.type_
             self.uuid = ref.uuid
             self.version = ref.version
             self.output_name_with_version = output_name_with_version
-            self._folder_path = Path(ref.save_dir, ref._options.get(self.name))
+            self._package = ref.save_dir
+            self._folder = ref._options.get(self.name)
             self.info = info
 
         def check(self, field, info_name, return_func=lambda x: x):
@@ -1443,7 +1448,7 @@ class ECS2ToILCD1ReferenceConversion:
                 "administrativeInformation": {
                     "dataEntryBy": {
                         "common:timeStamp": str(time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())),
-                        "common:referenceToDataSetFormat": ECS2ToILCD1ReferenceConversion(
+                        "common:referenceToDataSetFormat": self._ref_class(
                             'source',
                             (False, 'a97a0155-0234-4b87-b4ce-a45da52f2a40'),
                             'ILCD Format',
@@ -1456,11 +1461,8 @@ class ECS2ToILCD1ReferenceConversion:
             return self
 
         def make_dataset(self):
-            self._folder_path.mkdir(exist_ok=True)
             filename = self.uuid + ('_'+self.version if self.output_name_with_version else '') 
-            with open(str(Path(self._folder_path, filename+".xml")), 'w') as f:
-                f.write(xmltodict.unparse(self.structure,
-                                          pretty=True, newl='\n', indent="  "))
+            self._package.write_xml(self._folder+'/'+filename+".xml", self.structure)
 
     class SourceDataSet(AdditionalDataset):
 
@@ -1850,17 +1852,18 @@ class ECS2ToILCD1BasicFieldMapping(FieldMapping, ABC):
 
     def __init__(self):
 
-        self.Amount = ECS2ToILCD1Amount
-        self.UncertaintyConversion = ECS2ToILCD1UncertaintyConversion
-        self.VariableConversion = ECS2ToILCD1VariableConversion
-        self.QuantitativeObject = ECS2ToILCD1QuantitativeObject
-        self.FlowConversion = ECS2ToILCD1FlowConversion
-        self.IntermediateFlowConversion = ECS2ToILCD1IntermediateFlowConversion
-        self.ElementaryFlowConversion = ECS2ToILCD1ElementaryFlowConversion
-        self.ParameterConversion = ECS2ToILCD1ParameterConversion
-        self.ReferenceConversion = ECS2ToILCD1ReferenceConversion
-        self.ReviewConversion = ECS2ToILCD1ReviewConversion
-        self.ClassificationConversion = ECS2ToILCD1ClassificationConversion
+        context = ConversionContext()
+        self.Amount = context(ECS2ToILCD1Amount)
+        self.UncertaintyConversion = context(ECS2ToILCD1UncertaintyConversion)
+        self.VariableConversion = context(ECS2ToILCD1VariableConversion)
+        self.QuantitativeObject = context(ECS2ToILCD1QuantitativeObject)
+        self.FlowConversion = context(ECS2ToILCD1FlowConversion)
+        self.IntermediateFlowConversion = context(ECS2ToILCD1IntermediateFlowConversion)
+        self.ElementaryFlowConversion = context(ECS2ToILCD1ElementaryFlowConversion)
+        self.ParameterConversion = context(ECS2ToILCD1ParameterConversion)
+        self.ReferenceConversion = context(ECS2ToILCD1ReferenceConversion)
+        self.ReviewConversion = context(ECS2ToILCD1ReviewConversion)
+        self.ClassificationConversion = context(ECS2ToILCD1ClassificationConversion)
         self.NotConverted = ECS2ToILCD1DataNotConverted()
 
     def start_conversion(self):
@@ -1897,7 +1900,7 @@ class ECS2ToILCD1BasicFieldMapping(FieldMapping, ABC):
             'contact': []
         }
         
-        self.get_statistics()
+        self.statistics = self.get_statistics()
 
         type(self).unc_stat = 0
         self.UncertaintyConversion.statistics = 0
@@ -1938,9 +1941,9 @@ class ECS2ToILCD1BasicFieldMapping(FieldMapping, ABC):
         self.IntermediateFlowConversion.ProductionVolume._prod_v_number = -1000
 
     def set_file_info(self, path, save_path):
-        # Attributions
-        self.ReferenceConversion.save_dir = Path(save_path)
-        self.ElementaryFlowConversion.save_dir = Path(save_path)
+        # Attributions (save_path is the package of the output)
+        self.ReferenceConversion.save_dir = save_path
+        self.ElementaryFlowConversion.save_dir = save_path
 
     def set_output_class_defaults(self, cl_struct):
         self.ECS2TTextAndImage.ref_field = cl_struct.dataSetInformation
@@ -1976,28 +1979,23 @@ class ECS2ToILCD1FieldMapping(ECS2ToILCD1BasicFieldMapping):
     cls_stat = 0
 
     def get_statistics(self):
-        logging.info(
-            f"Intermediate Flow: {self.IntermediateFlowConversion.statistics}/{type(self).inf_stat}")
-        logging.info(
-            f"Elementary Flow: {self.ElementaryFlowConversion.statistics}/{type(self).elf_stat}")
-        logging.info(
-            f"Property: {self.FlowConversion.Property.statistics}/{type(self).prp_stat}")
-        logging.info(
-            f"Uncertainty: {self.UncertaintyConversion.statistics}/{type(self).unc_stat}")
-        logging.info(
-            f"Variable: {self.VariableConversion.statistics}/{type(self).var_stat}")
-        logging.info(
-            f"ProductionVolume: {self.IntermediateFlowConversion.ProductionVolume.statistics}/{type(self).pvl_stat}")
-        logging.info(
-            f"Parameter: {self.ParameterConversion.statistics}/{type(self).par_stat}")
-        logging.info(
-            f"Source: {self.ReferenceConversion.source_statistics}/{type(self).src_stat}")
-        logging.info(
-            f"Contact: {self.ReferenceConversion.contact_statistics}/{type(self).cnt_stat}")
-        logging.info(
-            f"Review: {self.ReviewConversion.statistics}/{type(self).rev_stat}")
-        logging.info(
-            f"Classification: {self.ClassificationConversion.statistics}/{type(self).cls_stat}")
+        # Number of converted and found fields of each type
+        statistics = {
+            'Intermediate Flow': (self.IntermediateFlowConversion.statistics, type(self).inf_stat),
+            'Elementary Flow': (self.ElementaryFlowConversion.statistics, type(self).elf_stat),
+            'Property': (self.FlowConversion.Property.statistics, type(self).prp_stat),
+            'Uncertainty': (self.UncertaintyConversion.statistics, type(self).unc_stat),
+            'Variable': (self.VariableConversion.statistics, type(self).var_stat),
+            'ProductionVolume': (self.IntermediateFlowConversion.ProductionVolume.statistics, type(self).pvl_stat),
+            'Parameter': (self.ParameterConversion.statistics, type(self).par_stat),
+            'Source': (self.ReferenceConversion.source_statistics, type(self).src_stat),
+            'Contact': (self.ReferenceConversion.contact_statistics, type(self).cnt_stat),
+            'Review': (self.ReviewConversion.statistics, type(self).rev_stat),
+            'Classification': (self.ClassificationConversion.statistics, type(self).cls_stat)
+        }
+        for name, (converted, found) in statistics.items():
+            logging.info(f"{name}: {converted}/{found}")
+        return statistics
 
     def delete(self):
         super().delete()
@@ -2314,16 +2312,16 @@ class ECS2ToILCD1FieldMapping(ECS2ToILCD1BasicFieldMapping):
             "/ecoSpold/activityDataset/flowData/intermediateExchange/property/@sourceId":\
             lambda cl_struct, x: self.add_stat('src_stat'),
             "/ecoSpold/activityDataset/flowData/intermediateExchange/uncertainty":\
-            lambda cl_struct, x: self.add_stat('unc_stat'),
+            reads()(lambda cl_struct, x: self.add_stat('unc_stat')),
             "/ecoSpold/activityDataset/flowData/intermediateExchange/productionVolumeUncertainty":\
-            lambda cl_struct, x: self.add_stat('unc_stat'),
+            reads()(lambda cl_struct, x: self.add_stat('unc_stat')),
             "/ecoSpold/activityDataset/flowData/intermediateExchange/property/uncertainty":\
-            lambda cl_struct, x: self.add_stat('unc_stat'),
+            reads()(lambda cl_struct, x: self.add_stat('unc_stat')),
             "/ecoSpold/activityDataset/flowData/intermediateExchange/classification":\
-            lambda cl_struct, x: self.add_stat('cls_stat'),
+            reads()(lambda cl_struct, x: self.add_stat('cls_stat')),
             "/ecoSpold/activityDataset/flowData/intermediateExchange/property":\
-            lambda cl_struct, x: (self.add_stat('prp_stat'), self.add_stat('var_stat') if x.get(
-                '@variableName') or x.get('@mathematicalRelation') else None),
+            reads('@variableName', '@mathematicalRelation')(lambda cl_struct, x: (self.add_stat('prp_stat'), self.add_stat('var_stat') if x.get(
+                '@variableName') or x.get('@mathematicalRelation') else None)),
             "/ecoSpold/activityDataset/flowData/elementaryExchange":\
             lambda cl_struct, x: (self.add_stat('elf_stat'), self.ElementaryFlowConversion(x, self.NotConverted).set_field(cl_struct.exchanges),
                                   self.add_stat('var_stat') if x.get('@variableName') or x.get('@mathematicalRelation') else None),
@@ -2332,17 +2330,17 @@ class ECS2ToILCD1FieldMapping(ECS2ToILCD1BasicFieldMapping):
             "/ecoSpold/activityDataset/flowData/elementaryExchange/property/@sourceId":\
             lambda cl_struct, x: self.add_stat('src_stat'),
             "/ecoSpold/activityDataset/flowData/elementaryExchange/uncertainty":\
-            lambda cl_struct, x: self.add_stat('unc_stat'),
+            reads()(lambda cl_struct, x: self.add_stat('unc_stat')),
             "/ecoSpold/activityDataset/flowData/elementaryExchange/property/uncertainty":\
-            lambda cl_struct, x: self.add_stat('unc_stat'),
+            reads()(lambda cl_struct, x: self.add_stat('unc_stat')),
             "/ecoSpold/activityDataset/flowData/elementaryExchange/property":\
-            lambda cl_struct, x: (self.add_stat('prp_stat'), self.add_stat('var_stat') if x.get(
-                '@variableName') or x.get('@mathematicalRelation') else None),
+            reads('@variableName', '@mathematicalRelation')(lambda cl_struct, x: (self.add_stat('prp_stat'), self.add_stat('var_stat') if x.get(
+                '@variableName') or x.get('@mathematicalRelation') else None)),
             "/ecoSpold/activityDataset/flowData/parameter": lambda cl_struct, x:
                 (self.add_stat('par_stat'), self.ParameterConversion(x, self.NotConverted), 
                  self.add_stat('var_stat') if x.get('@variableName') or x.get('@mathematicalRelation') else None),
             "/ecoSpold/activityDataset/flowData/parameter/uncertainty":\
-            lambda cl_struct, x: self.add_stat('unc_stat'),
+            reads()(lambda cl_struct, x: self.add_stat('unc_stat')),
             "/ecoSpold/activityDataset/modellingAndValidation/representativeness/@percent":\
             lambda cl_struct, x: setattr(
                 cl_struct.modellingAndValidation.dataSourcesTreatmentAndRepresentativeness, "percentageSupplyOrProductionCovered", x),
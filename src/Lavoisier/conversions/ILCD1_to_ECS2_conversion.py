@@ -19,6 +19,7 @@ from .utils import (
     uuid_from_string,
     ensure_list,
     FieldMapping,
+    ConversionContext,
     Print
 )
 from .units import (
@@ -304,7 +305,7 @@ class ILCD1ToECS2VariableConversion:
             'used?': False, 'self': self}
 
     def __copy__(self):
-        return ILCD1ToECS2VariableConversion(self.__x, self.not_converted)
+        return type(self)(self.__x, self.not_converted)
 
     @classmethod
     def change_formula(cls, instance, factor = '1.0'):
@@ -1293,16 +1294,17 @@ class ILCD1ToECS2BasicFieldMapping(FieldMapping, ABC):
 
     def __init__(self):
 
-        self.Amount = ILCD1ToECS2Amount
-        self.UncertaintyConversion = ILCD1ToECS2UncertaintyConversion
-        self.SourceReferenceConversion = ILCD1ToECS2SourceReferenceConversion
-        self.ContactReferenceConversion = ILCD1ToECS2ContactReferenceConversion
-        self.FlowReferenceConversion = ILCD1ToECS2FlowReferenceConversion
-        self.ReferenceConversion = ILCD1ToECS2ReferenceConversion
-        self.FlowConversion = ILCD1ToECS2FlowConversion
-        self.VariableConversion = ILCD1ToECS2VariableConversion
-        self.ClassificationConversion = ILCD1ToECS2ClassificationConversion
-        self.ReviewConversion = ILCD1ToECS2ReviewConversion
+        context = ConversionContext()
+        self.Amount = context(ILCD1ToECS2Amount)
+        self.UncertaintyConversion = context(ILCD1ToECS2UncertaintyConversion)
+        self.SourceReferenceConversion = context(ILCD1ToECS2SourceReferenceConversion)
+        self.ContactReferenceConversion = context(ILCD1ToECS2ContactReferenceConversion)
+        self.FlowReferenceConversion = context(ILCD1ToECS2FlowReferenceConversion)
+        self.ReferenceConversion = context(ILCD1ToECS2ReferenceConversion)
+        self.FlowConversion = context(ILCD1ToECS2FlowConversion)
+        self.VariableConversion = context(ILCD1ToECS2VariableConversion)
+        self.ClassificationConversion = context(ILCD1ToECS2ClassificationConversion)
+        self.ReviewConversion = context(ILCD1ToECS2ReviewConversion)
         self.NotConverted = ILCD1ToECS2DataNotConverted()
 
     def start_conversion(self):
@@ -1327,7 +1329,7 @@ class ILCD1ToECS2BasicFieldMapping(FieldMapping, ABC):
 
     def end_conversion(self):
         ILCD1ToECS2BasicFieldMapping.reset_conversion(self)
-        self.get_statistics()
+        self.statistics = self.get_statistics()
 
     def reset_conversion(self):
         ILCD1Helper.number = 1000
@@ -1381,7 +1383,7 @@ class ILCD1ToECS2FieldMapping(ILCD1ToECS2BasicFieldMapping):
         super().delete()
 
     def get_statistics(self):
-        pass
+        return {}
 
     def set_file_info(self, *args):
         ref = type(self)._flow_internal_refs
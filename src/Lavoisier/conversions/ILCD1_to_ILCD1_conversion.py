@@ -7,7 +7,8 @@ Created on Sat Dec  3 22:46:15 2022
 """
 from abc import ABC
 from .utils import (
-    FieldMapping
+    FieldMapping,
+    ConversionContext
 )
 from .units import ilcd_unit_to_fp, olcailcd_unit_to_fp
 from .utils import ensure_list
@@ -322,9 +323,8 @@ class ILCD1ToILCD1ElementaryFlowConversion:
 
     def save_file(self, type_='flows'):
         # print('--->', Path(type(self).ilcd_extracted_dir, self.uri), Path(type(self).save_dir, type_))
-        Path(type(self).save_dir, type_).mkdir(exist_ok=True)
-        shutil.copy(Path(type(self).ilcd_extracted_dir, self.uri),
-                    Path(type(self).save_dir, type_))
+        type(self).save_dir.copy(type_+'/'+Path(self.uri).name,
+                                 Path(type(self).ilcd_extracted_dir, self.uri))
         
     def save_original(self, id_, dir_='flows', type_='elementary flow'):
         # if dir_ != 'flows':
@@ -335,12 +335,11 @@ class ILCD1ToILCD1ElementaryFlowConversion:
             # print(Path(Path(__file__).parent.parent.resolve(),
             #      type(self).default_files[type_],
             #      id_), Path(type(self).save_dir, dir_))
-        Path(type(self).save_dir, dir_).mkdir(exist_ok=True)
-        shutil.copy(
+        type(self).save_dir.copy(
+            dir_+'/'+Path(id_).name,
             Path(Path(__file__).parent.parent.resolve(),
                  type(self).default_files[type_],
-                 id_),
-            Path(type(self).save_dir, dir_))
+                 id_))
 
 class ILCD1ToILCD1BasicFieldMapping(FieldMapping, ABC):
 
@@ -362,26 +361,26 @@ class ILCD1ToILCD1BasicFieldMapping(FieldMapping, ABC):
         self.ElementaryFlowConversion.elem_flow_mapping = self._elem_mapping
     
     def __init__(self):
-        self.ElementaryFlowConversion = ILCD1ToILCD1ElementaryFlowConversion
+        context = ConversionContext()
+        self.ElementaryFlowConversion = context(ILCD1ToILCD1ElementaryFlowConversion)
         
     def start_conversion(self):
         self.ElementaryFlowConversion.default_files = type(self)._default_files
 
     def end_conversion(self):
-        self.get_statistics()
+        self.statistics = self.get_statistics()
 
     def reset_conversion(self):
         pass
 
     def set_file_info(self, path, save_path):
-        self.ElementaryFlowConversion.save_dir = Path(save_path)
+        self.ElementaryFlowConversion.save_dir = save_path # Package of the output
         self.ElementaryFlowConversion.ilcd_extracted_dir = path
         
         # TODO place this code in other place where it suits the code better
         for type_ in ('sources', 'contacts'):
             for file in Path(path, type_).iterdir():
-                shutil.copy(file,
-                            Path(save_path, type_))
+                save_path.copy(type_+'/'+file.name, file)
 
     def set_output_class_defaults(self, cl_struct):
         self.ElementaryFlowConversion.exc_holder = cl_struct.exchanges
@@ -395,7 +394,7 @@ class ILCD1ToILCD1FieldMapping(ILCD1ToILCD1BasicFieldMapping):
     _flow_internal_refs = None
 
     def get_statistics(self):
-        pass
+        return {}
 
     def set_file_info(self, *args):
         super().set_file_info(*args)
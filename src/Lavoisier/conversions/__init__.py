@@ -13,6 +13,7 @@ from .utils import (
     ensure_list,
     copy_file,
     FieldMapping,
+    ConversionContext,
     Print
 )
 from .ILCD1_to_ILCD1_conversion import (
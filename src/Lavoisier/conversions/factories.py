@@ -8,6 +8,9 @@ Created on Sat Oct 15 12:36:09 2022
 
 from pathlib import Path
 
+from .utils import ConversionContext
+from ..formats.utils import merge_keys
+
 from .ILCD1_to_ILCD1_conversion import (
     ILCD1ToILCD1FieldMapping
     )
@@ -69,13 +72,31 @@ class MappingFactory:
         if config.mapping_class is None:
             if self._mapping_dict is None:
                 raise ValueError(f"Default mapping does not exist for {self.__names[0]} to {self.__names[1]} conversion")
-            self._mapping = self._mapping_dict[version]()
+            mapping_class = self._mapping_dict[version]
         else:
-            self._mapping = config.mapping_class()
+            mapping_class = config.mapping_class
+        # The mapping class receives the configurations of this conversion, so each mapping has its own
+        self._mapping = ConversionContext()(mapping_class)()
         
         if config.transfer_defaults:
             type(self._mapping)._default_elem_mapping = self._ef_mapping
             type(self._mapping)._default_files = self._ef_file_defaults
         
         return self._mapping
+
+    def get_mapping_keys(self, config):
+        # Keys of all the mappings that can be used, before the version of a file is known, with one of their functions
+        # (None if the mappings read different fields of the same key). The mappings are initialized as in a
+        # conversion. None is returned if the keys of one of them can't be known before its conversion (e.g. its
+        # 'mapping' reads the file information), so that the file is read twice
+        if config.mapping_class is None:
+            if self._mapping_dict is None:
+                raise ValueError(f"Default mapping does not exist for {self.__names[0]} to {self.__names[1]} conversion")
+            classes = set(self._mapping_dict.values())
+        else:
+            classes = {config.mapping_class}
+        try:
+            return merge_keys(*(ConversionContext()(mapping_class)().mapping() for mapping_class in classes))
+        except Exception: # Raised again by the conversion if it is not due to the missing information
+            return None
     
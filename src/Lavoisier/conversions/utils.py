@@ -11,10 +11,13 @@ import uuid
 import csv
 import json
 import shutil
+from copy import deepcopy
 from abc import ABC
 from pathlib import Path
 from Crypto.Cipher import AES
 from binascii import unhexlify, hexlify
+from ..formats.helpers import ThreadLocalMeta
+from ..data_structures.main import DotDict
 
 def uuid_from_uuid(u, key, type_):
     
@@ -64,13 +67,42 @@ def ensure_list(x, ensure_text=False):
             return [n for n in x if n['#text'] and n['#text'] != '']
         return x
 
-class Print:
+class Print(metaclass=ThreadLocalMeta):
+    _thread_local = ('quiet',)
     quiet = None
     @classmethod
     def output(cls, x):
         if not cls.quiet:
             print(x)
 
+class ConversionContext:
+    # Conversion classes keep their counters and registries (as well as the configurations passed by the mapping) as
+    # class attributes. The context creates, for one conversion, subclasses holding their own copy of this state,
+    # so that many conversions can run at the same time in one process without sharing it
+
+    def __init__(self):
+        self._classes = {}
+
+    def __call__(self, cls):
+        if cls not in self._classes:
+            # Bases from the conversions are isolated too, so the state shared by a class hierarchy stays shared
+            bases = (cls,) + tuple(self(b) for b in cls.__bases__ if b.__module__.startswith(__package__))
+            namespace = {'__module__': cls.__module__, '__qualname__': cls.__qualname__, '_isolated_from': cls}
+            for name, value in vars(cls).items():
+                if isinstance(value, (list, dict, set)) and not isinstance(value, DotDict): # Fields of a structure are kept
+                    namespace[name] = deepcopy(value)
+                elif isinstance(value, type) and value.__qualname__ == cls.__qualname__ + '.' + name:
+                    namespace[name] = self(value) # Nested classes
+            self._classes[cls] = type(cls)(cls.__name__, bases, namespace)
+        return self._classes[cls]
+
+def state_holder(obj, base):
+    # Returns the class of the hierarchy of obj which holds the state of 'base' (its isolated copy, if any)
+    for cls in type(obj).__mro__:
+        if cls.__dict__.get('_isolated_from') is base:
+            return cls
+    return base
+
 # Credits for Michael for the idea of that function
 # https://blogs.blumetech.com/blumetechs-tech-blog/2011/05/faster-python-file-copy.html
 def _copy_file(src, dst, buffer_size=10485760):
@@ -82,11 +114,9 @@ def _copy_file(src, dst, buffer_size=10485760):
         with open(dst, 'wb') as fdst:
             shutil.copyfileobj(fsrc, fdst, buffer_size)
 
-def copy_file(save_path, default_files_path, folder, id_):
-    path = Path(Path(__file__).parent.parent.resolve(), default_files_path, id_+".xml")
-    folder_path = Path(save_path, folder)
-    folder_path.mkdir(exist_ok=True)
-    _copy_file(str(path), str(folder_path)+'/'+id_+".xml")
+def copy_file(package, default_files_path, folder, id_):
+    # Copies a default dataset to the output package (formats.utils.DirectoryPackage or ZipPackage)
+    package.copy(folder+'/'+id_+".xml", Path(Path(__file__).parent.parent.resolve(), default_files_path, id_+".xml"))
 
 def correct_dimensionality(dim):
     # Dimensionality now can vary with pint
@@ -113,6 +143,8 @@ class FieldMapping(ABC):
     _elem_mapping = None
     _class_mapping = None
 
+    statistics = {} # Converted and found fields of each type, gathered at the end of the conversion
+
     @staticmethod
     def _dict_from_file(filepath, id_=None):
         if filepath.suffix == '.csv':
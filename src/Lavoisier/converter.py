@@ -1,10 +1,19 @@
 
 from pathlib import Path, PosixPath
 from collections.abc import Iterator
-
-from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat, takewhile
+from copy import deepcopy
+from functools import partial
+import tempfile
+import hashlib
+import json
+import asyncio
+
+from dataclasses import dataclass, asdict
 import warnings
 import inspect
+import time
 
 from .formats import (
     ECS2InputConfig,
@@ -13,18 +22,91 @@ from .formats import (
     ECS2OutputConfig,
     ILCD1InputConfig,
     OLCAILCD1InputConfig,
+    OLCAJSONInputConfig,
     DefaultMappingConfig,
     InputTemplate,
-    OutputTemplate
+    OutputTemplate,
+    OutputProfile,
+    OutputSink,
+    FileSink
 )
 from .conversions import (
     MappingFactory,
+    ConversionContext,
     Print
     )
 from .data_structures import (
     StructureFactory,
     StructureTemplate
     )
+@dataclass
+class ConversionResult:
+    input_path: Path        # Dataset file converted
+    output_path: str        # Output written after the dataset, None while the database output is not finished
+    elapsed: float          # Time in seconds spent on the dataset (its output being written during the next one)
+    not_converted: dict     # Number of fields not converted by type, for the output written
+
+class ConversionJournal:
+    # JSON-lines record of the outputs written for each input and of the inputs fully converted, so that a conversion
+    # restarted after an error skips the inputs already done. Lines are only appended, the last ones being the valid ones
+    
+    def __init__(self, path):
+        self.path = Path(path)
+        self._hashes = {}
+    
+    def _hash(self, input_):
+        input_ = str(input_)
+        if input_ not in self._hashes:
+            h = hashlib.sha256()
+            with open(input_, 'rb') as f:
+                for chunk in iter(lambda: f.read(1048576), b''):
+                    h.update(chunk)
+            self._hashes[input_] = h.hexdigest()
+        return self._hashes[input_]
+    
+    def _write(self, entry):
+        with open(self.path, 'a') as f:
+            f.write((json.dumps(entry) if entry else '') + '\n')
+    
+    def _read(self):
+        records = {}
+        if self.path.is_file():
+            with open(self.path, 'r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError: # Line cut by the interruption of the conversion
+                        if not line.endswith('\n'):
+                            self._write({}) # The next entries would be written after it otherwise
+                        continue
+                    record = records.setdefault(entry['input'], {'outputs': [], 'completed': False})
+                    if entry['hash'] != record.get('hash'):
+                        record.update(hash=entry['hash'], completed=False)
+                    if 'output' in entry:
+                        record['outputs'].append(entry['output'])
+                    record['completed'] |= entry.get('completed', False)
+        return records
+    
+    def pending(self, inputs):
+        # Returns the inputs still to be converted and the outputs of the ones already done. The outputs of inputs
+        # converted in part (or changed since their conversion) are removed, as these inputs are converted again
+        records, pending, done = self._read(), [], []
+        for input_ in inputs:
+            record = records.get(str(input_))
+            if record is not None and record['completed'] and record['hash'] == self._hash(input_):
+                done.extend(record['outputs'])
+            else:
+                for output in (record['outputs'] if record is not None else ()):
+                    Path(output).unlink(missing_ok=True)
+                pending.append(input_)
+        return pending, done
+    
+    def add_output(self, input_, output):
+        self._write({'input': str(input_), 'hash': self._hash(input_), 'output': output})
+    
+    def complete(self, input_):
+        self._write({'input': str(input_), 'hash': self._hash(input_), 'completed': True})
+
 class Converter:
 
     def __init__(self,
@@ -55,6 +137,8 @@ class Converter:
         self._output_struct = output_config.output_structure
         self._output_manager = output_config.output_manager
         self._initial_info = input_config.initial_info
+        self._mapping_keys = (None, None) # Mapping configuration and keys of its mappings
+        self._shared_items = None # Items of the file parsed once for all the converters of a fan-out conversion
 
         # Public paths
         self.path = path  # CHANGE
@@ -63,6 +147,10 @@ class Converter:
         # Public options for conversion
         self.convert_additional_fields = False # CHANGE
         self.quiet = True
+        self.journal = None # Path of a ConversionJournal, to resume an interrupted conversion in the 'to_file' mode
+        # Each file is parsed once, keeping the items of its mapping until the mapping is set, instead of being read again
+        # by the mapping. Faster for small files, but the items of a file are all kept in memory (several times its size)
+        self.single_pass = False
         self._start_configurations(input_config, output_config)
     
     ### Information for the user
@@ -103,7 +191,8 @@ class Converter:
 
     @iterator.setter
     def iterator(self, iter_):
-        if isinstance(iter_, Iterator):
+        # The iterator class (as XMLStreamIterable and its parser alternatives) is instantiated for each file
+        if inspect.isclass(iter_) and issubclass(iter_, Iterator):
             self._iterator = iter_
         else:
             raise TypeError('Iterator must inherit from the Iterator class')
@@ -164,24 +253,28 @@ class Converter:
     
     def __setattr__(self, key, value):
         if hasattr(self, '_options'):
-            if (key in [x[1] for x in self._options] or key in ('quiet', 'convert_additional_fields')) and value not in (True, False):
+            if key == 'output_profile': # Also given by the name of a preset or a dict (e.g. from a manifest)
+                value = OutputProfile.get(value)
+            elif (key in [x[1] for x in self._options] or key in ('quiet', 'convert_additional_fields')) and value not in (True, False):
                 raise TypeError(f"Option '{key}' only accepts booleans (True or False). Received '{value}' of type {type(value)}")
         super().__setattr__(key, value)
 
-    def _apply_configurations(self, conf_type):
+    def _apply_configurations(self, conf_type, output=None):
         for _, name, (type_, func) in self._options:
             if type_ == conf_type:
                 if type_ == 'general_option':
                     func(getattr(self, name))
                 elif type_ == 'mapping_option':
                     func(type(self._field_mapping), getattr(self, name))
+                elif type_ == 'output_option': # Output of the conversion, if another one is not given
+                    func(self._data if output is None else output, getattr(self, name))
 
     ### Information setting to mapping and data format
 
     def _set_format(self):
         if self._names[0] == self._names[1]:
-            type(self._data).only_elem_flows = True
-        type(self._data)._hash = self.__hash
+            self._data.only_elem_flows = True
+        self._data._hash = self.__hash
 
     def _set_field_mapping(self, file): # Set fields relative to the overall conversion
         type(self._field_mapping)._convert_additional_fields = self.convert_additional_fields
@@ -190,16 +283,38 @@ class Converter:
     
     ### Gathering of information from file to populate variables in mapping and data
     
+    def _get_mapping_keys(self):
+        if self._mapping_keys[0] is not self._mapping_config:
+            self._mapping_keys = (self._mapping_config, self._mfactory.get_mapping_keys(self._mapping_config))
+        return self._mapping_keys[1]
+
+    def _parse(self, file, keys):
+        with self._input_manager.open_file(file) as f:
+            yield from self.iterator(f, keys)
+
+    def _read(self, file, keys):
+        if self._shared_items is not None: # Read by the other converters too, so only copies are given to the mapping
+            return ((path, deepcopy(t)) for path, t in self._shared_items if path in keys)
+        return self._parse(file, keys)
+
     def _get_pre_instance_file_information(self, file):
         self.file_info = {}
         self._o_version = getattr(self, '_version', None)
-        with open(file, 'r') as f:
-            for i, (path, t) in enumerate(self.iterator(f, self._initial_info)):
-                gmp = self._initial_info[path]
-                if gmp[0] not in self.file_info:
-                    self.file_info[gmp[0]] = gmp[1](t) if 'list' not in gmp[0] else [gmp[1](t)]
-                elif 'list' in gmp[0]: # This verification takes into account fields that can have many languages but only 'one' data
-                    self.file_info[gmp[0]].append(gmp[1](t))
+        # In a single pass, the items of the keys of all the possible mappings are kept for the iteration
+        keys, self._items = self._initial_info, None
+        mapping_keys = self._get_mapping_keys() if self.single_pass and self._shared_items is None else None
+        if mapping_keys is not None: # Otherwise the file is read again by the mapping
+            keys, self._items = mapping_keys | self._initial_info, (mapping_keys.keys(), [])
+        for path, t in self._read(file, keys):
+            if self._items is not None and path in self._items[0]:
+                self._items[1].append((path, t))
+            if path not in self._initial_info:
+                continue
+            gmp = self._initial_info[path]
+            if gmp[0] not in self.file_info:
+                self.file_info[gmp[0]] = gmp[1](t) if 'list' not in gmp[0] else [gmp[1](t)]
+            elif 'list' in gmp[0]: # This verification takes into account fields that can have many languages but only 'one' data
+                self.file_info[gmp[0]].append(gmp[1](t))
         self._version = self.file_info.pop('version', None)
         self._filename = self.file_info.pop('filename', None)
         
@@ -218,8 +333,10 @@ class Converter:
         self._apply_configurations('general_option')
         self._get_pre_instance_file_information(file)
         if not hasattr(self, '_data'):
-            self._data = self._output_manager(self.save_path, self.save_path, self._sfactory.get_structure(self._output_struct, self._output_version))
+            # The structure class is isolated as mappings can set configurations on it
+            self._data = self._output_manager(self.save_path, self.save_path, ConversionContext()(self._sfactory.get_structure(self._output_struct, self._output_version)))
             self._set_format()
+        self._apply_configurations('output_option')
         if (self._o_version != self._version) or (self._o_version is None and self._version is None):
             # self._data.struct = self._sfactory.get_structure(self._output_struct, self._version)()
             self._field_mapping = self._mfactory.get_mapping(self._mapping_config, self._version)
@@ -234,6 +351,7 @@ class Converter:
         self._field_mapping.start_conversion()
         
     def reset_conversion(self):
+        self._items = None
         self._field_mapping.reset_conversion()
         self._data.reset_conversion()
 
@@ -241,43 +359,299 @@ class Converter:
         self._field_mapping.end_conversion()
         self._filenames.append(self._data.end_conversion())
 
+    def _iter_items(self, file):
+        items, self._items = getattr(self, '_items', None), None
+        if items is not None and self.__mapping.keys() <= items[0]: # Kept from the single pass
+            yield from ((path, t) for path, t in items[1] if path in self.__mapping)
+            return
+        yield from self._read(file, self.__mapping)
+
     def iterate(self, file):
-        with open(file, 'r') as f:
-            print(f"\tConverting {str(file).rpartition('/')[-1]}")
-            for i, (path, t) in enumerate(self.iterator(f, self.__mapping)):
-                if i == 0:
-                    self._field_mapping.default(self._data.struct) # Struct has to be a class
-                self.__mapping[path](self._data.struct, t)
+        print(f"\tConverting {str(file).rpartition('/')[-1]}")
+        for i, (path, t) in enumerate(self._iter_items(file)):
+            if i == 0:
+                self._field_mapping.default(self._data.struct) # Struct has to be a class
+            self.__mapping[path](self._data.struct, t)
     
-    def convert(self, type_):
+    def _get_journal(self, type_):
+        if self.journal is None:
+            return None
+        if type_ != 'to_file':
+            raise ValueError("The conversion journal is only available in the 'to_file' mode, as a database is only written at the end")
+        if isinstance(self.save_path, OutputSink):
+            raise ValueError("The conversion journal is only available with a save directory, in which the outputs are checked")
+        return ConversionJournal(self.journal)
+
+    def iter_convert(self, type_):
         
         self._filenames = []
+        journal = self._get_journal(type_)
+        if journal is None:
+            yield from self._iter_convert(type_)
+            return
+        
+        selected = self._input_manager._selected_inputs
+        inputs, self._filenames = journal.pending(self._input_manager.get_inputs())
+        if inputs:
+            self._input_manager.select_inputs(inputs)
+            try:
+                yield from self._iter_convert(type_, journal)
+            finally:
+                self._input_manager.select_inputs(selected)
+
+    def _iter_convert(self, type_, journal=None):
         
         if type_ == 'to_database' and self._names[0] == 'EcoSpold2' and self._names[1] in ('ILCD1', 'OLCAILCD1'):
             warnings.warn('Conversion of EcoSpold2 to ILCD1 in database mode: different sets of property values for the same flow are converted to different versions of the same flow (and named as such). This is an ILCD1 feature not easily recognized by softwares, so this type of conversion is not recommended. It is recommended to use the mode "to file" or change the Converter attribute "convert_properties" to False', UserWarning)
-    
+
         try:
+            input_, pending = None, []
             for file, is_last in self._input_manager.get_files():
-                self.start_conversion(file)
-                self.iterate(file)
-                if is_last or type_ == "to_file":
-                    self.end_conversion()
-                else:
-                    self.reset_conversion()
-            return self._filenames
-        except Exception as e:
+                if journal is not None and input_ != self._input_manager.current_input:
+                    if input_ is not None: # All the files of the previous input were converted
+                        pending.append((None, input_))
+                    input_ = self._input_manager.current_input
+                # Outputs are written while the next dataset is converted, each one after the previous. So the
+                # results of the previous datasets are only given now, when their outputs are written
+                ready, pending = pending, [(self._convert_file(file, is_last, type_), input_)]
+                yield from self._publish(ready, journal)
+            if hasattr(self, '_data'):
+                self._data.flush()
+            if input_ is not None:
+                pending.append((None, input_))
+            yield from self._publish(pending, journal)
+        except (Exception, GeneratorExit) as e: # GeneratorExit: the iteration was stopped before the end
             if 'file' in locals():
                 if not isinstance(file, PosixPath):
                     file.close()
-            for name in ('_input_manager', '_data'):
-                if hasattr(self, name):
-                    inst = getattr(self, name)
-                    inst.handle_error()
-                    del inst
-            if hasattr(self, '_field_mapping'):
-                self._field_mapping.delete()
-                del self._field_mapping
+            self._input_manager.handle_error()
+            self._clean_conversion()
+            if journal is not None and 'pending' in locals(): # Outputs written before the error
+                for _ in self._publish(takewhile(lambda p: p[0] is None or p[0].output_path is None or Path(p[0].output_path).exists(), pending), journal):
+                    pass
             raise e
+
+    def _convert_file(self, file, is_last, type_):
+        start = time.perf_counter()
+        self.start_conversion(file)
+        self.iterate(file)
+        if is_last or type_ == "to_file":
+            self.end_conversion()
+            output, statistics = self._filenames[-1], self._field_mapping.statistics
+        else:
+            self.reset_conversion()
+            output, statistics = None, {}
+        return ConversionResult(file, output, time.perf_counter() - start,
+                                {k: max(found - converted, 0) for k, (converted, found) in statistics.items()})
+
+    def _clean_conversion(self):
+        # After an error, so that the converter can be used again
+        if hasattr(self, '_field_mapping'): # Before the output, so its statistics still go to the log
+            try:
+                self._field_mapping.delete()
+            except Exception: # The mapping stopped in the middle of a dataset, the error raised is the one that stopped it
+                pass
+            del self._field_mapping, self._version # A new mapping is created if the converter is used again
+        if hasattr(self, '_data'):
+            self._data.handle_error()
+            del self._data
+
+    @staticmethod
+    def _publish(results, journal):
+        # Gives the results of outputs already written, recording them (and the inputs completed) in the journal
+        for result, input_ in results:
+            if result is None:
+                journal.complete(input_)
+                continue
+            if journal is not None and result.output_path is not None:
+                journal.add_output(input_, result.output_path)
+            yield result
+
+    def convert(self, type_, workers=1):
+        if workers > 1:
+            if isinstance(self.save_path, OutputSink):
+                raise ValueError(f"Conversion with {workers} workers is only available with a save directory, shared by the processes")
+            if type_ == 'to_database' and getattr(self._output_manager, 'merge', None) is None:
+                raise ValueError(f"Conversion with {workers} workers in the 'to_database' mode is not available for {self._names[1]} outputs")
+            return self._convert_parallel(type_, workers)
+        for _ in self.iter_convert(type_):
+            pass
+        return self._filenames
+
+    ### Asynchronous conversion
+
+    async def iter_convert_async(self, type_, concurrency=1):
+        # Asynchronous version of iter_convert: the conversions run in threads, so the event loop is not blocked by
+        # their parsing and file handling. Only 'concurrency' results are kept waiting to be taken, the conversions
+        # being paused until then. Closing the iteration (or cancelling its task) stops and cleans the conversions
+        results = asyncio.Queue(maxsize=concurrency)
+        if concurrency > 1:
+            if type_ != 'to_file':
+                raise ValueError(f"Conversion with concurrency {concurrency} is only available in the 'to_file' mode")
+            inputs = list(self._input_manager.get_inputs())
+            self._filenames = []
+            journal = self._get_journal(type_)
+            if journal is not None:
+                inputs, self._filenames = journal.pending(inputs)
+            state, pending = self._get_state(), iter(enumerate(inputs))
+            # Each concurrent conversion is done by a converter of its own, which converts the next pending input
+            lanes = [self._convert_lane(partial(_converter_from_state, state, self.path, self.save_path),
+                                        pending, type_, results) for _ in range(min(concurrency, len(inputs)))]
+        else:
+            lanes = [self._convert_lane(lambda: self, iter([(0, None)]), type_, results)]
+        
+        tasks = [asyncio.ensure_future(lane) for lane in lanes]
+        finished = asyncio.gather(*tasks)
+        outputs = {}
+        try:
+            while not finished.done() or not results.empty():
+                get = asyncio.ensure_future(results.get())
+                await asyncio.wait((get, finished), return_when=asyncio.FIRST_COMPLETED)
+                if not get.done():
+                    get.cancel()
+                    continue
+                index, result = get.result()
+                if result.output_path is not None:
+                    outputs.setdefault(index, []).append(result.output_path)
+                yield result
+            finished.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        if concurrency > 1:
+            self._filenames += [output for index in sorted(outputs) for output in outputs[index]]
+
+    async def convert_async(self, type_, concurrency=1):
+        async for _ in self.iter_convert_async(type_, concurrency):
+            pass
+        return self._filenames
+
+    async def _convert_lane(self, get_converter, inputs, type_, results):
+        # Steps the conversions in a thread of their own, as conversion state and logs are kept by thread
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=1) as thread:
+            converter = await loop.run_in_executor(thread, get_converter)
+            for index, input_ in inputs:
+                conversion = converter.iter_convert(type_) if input_ is None else converter._iter_input(input_, type_)
+                try:
+                    while (result := await loop.run_in_executor(thread, next, conversion, None)) is not None:
+                        await results.put((index, result))
+                finally:
+                    await loop.run_in_executor(thread, conversion.close)
+
+    ### Parallel conversion
+
+    def _get_state(self):
+        # Picklable description of the converter so it can be rebuilt in other processes
+        return {
+            'input_': (self.__input_config.name, getattr(self.__input_config, 'ef_mapping', None)),
+            'output': (self.__output_config.name, getattr(self.__output_config, 'ef_mapping', None)),
+            'hash_': self.__hash,
+            'attributes': {x: getattr(self, x) for x in ('_elem_flow_mapping', '_mapping_config', '_output_version',
+                                                         '_iterator', '_output_struct', '_output_manager',
+                                                         'quiet', 'convert_additional_fields', 'journal',
+                                                         'single_pass')} |\
+                          {x[1]: getattr(self, x[1]) for x in self._options}
+        }
+
+    def _iter_input(self, path, type_):
+        # Converts one standalone input of the original path, reusing the converter instance.
+        # Inputs already in the journal are not given here, so it is only written
+        self._input_manager = self.__input_config.input_manager(path)
+        self._filenames = []
+        yield from self._iter_convert(type_, self._get_journal(type_))
+
+    def _convert_input(self, path, type_):
+        for _ in self._iter_input(path, type_):
+            pass
+        return self._filenames
+
+    def _convert_shard(self, inputs, save_path):
+        # Converts part of the inputs of the original path to a partial database
+        self._input_manager = self.__input_config.input_manager(self.path)
+        self._input_manager.select_inputs(inputs)
+        self.save_path = save_path
+        if hasattr(self, '_data'): # The output manager is bound to the previous save path
+            del self._data
+        return self.convert('to_database')
+
+    def _map_in_workers(self, workers, func, *iterables):
+        # Each worker process builds its own converter once and reuses it for all the tasks it receives.
+        # Tasks are sent one at a time, so a worker takes the next pending task as soon as it is free
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_start_worker,
+                                 initargs=(self._get_state(), self.path, self.save_path)) as executor:
+            try:
+                return list(executor.map(func, *iterables))
+            except BaseException:
+                executor.shutdown(cancel_futures=True) # Pending tasks are not done after an error
+                raise
+
+    @staticmethod
+    def _split_by_cost(inputs, costs, n):
+        # Contiguous shards of about the same estimated cost
+        total, acc, shards = sum(costs), 0, [[]]
+        for i, (input_, cost) in enumerate(zip(inputs, costs)):
+            if shards[-1] and len(shards) < n and (acc + cost/2 > total * len(shards) / n or # Most of the input is after the shard limit
+                                                   len(inputs) - i <= n - len(shards)): # No empty shards
+                shards.append([])
+            shards[-1].append(input_)
+            acc += cost
+        return shards
+
+    def _convert_parallel(self, type_, workers):
+        inputs = list(self._input_manager.get_inputs())
+        self._filenames = []
+        journal = self._get_journal(type_)
+        if journal is not None:
+            inputs, self._filenames = journal.pending(inputs)
+        costs = [self._input_manager.estimate_cost(input_) for input_ in inputs]
+        if type_ == 'to_file':
+            # Largest inputs first, so that the longest conversions don't end up at the end of the batch
+            order = sorted(range(len(inputs)), key=lambda i: costs[i], reverse=True)
+            results = dict(zip(order, self._map_in_workers(workers, _convert_in_worker,
+                                                           [inputs[i] for i in order], repeat(type_))))
+            self._filenames += [filename for i in range(len(inputs)) for filename in results[i]]
+        elif inputs:
+            # The inputs are split in contiguous shards converted to partial databases, which are merged in order
+            shards = self._split_by_cost(inputs, costs, min(workers, len(inputs)))
+            with tempfile.TemporaryDirectory(dir=self.save_path) as tempdir:
+                save_paths = [Path(tempdir, str(i)) for i in range(len(shards))]
+                for save_path in save_paths:
+                    save_path.mkdir()
+                packages = self._map_in_workers(workers, _convert_shard_in_worker, shards, save_paths)
+                self._filenames = [self.merge([package for shard in packages for package in shard])]
+        return self._filenames
+
+    def merge(self, packages):
+        # Merges databases converted in parts (by the workers or by other nodes) into one database in the save path
+        if getattr(self._output_manager, 'merge', None) is None:
+            raise ValueError(f"Merge of databases is not available for {self._names[1]} outputs")
+        data = self._output_manager(self.save_path, self.save_path,
+                                    self._sfactory.get_structure(self._output_struct, self._output_version))
+        data._hash = self.__hash
+        self._apply_configurations('output_option', data)
+        return data.merge(packages)
+
+
+_worker_converter = None
+
+def _converter_from_state(state, path, save_path):
+    converter = ConverterFactory.get_converter(state['input_'], state['output'], path, save_path, state['hash_'])
+    for name, value in state['attributes'].items():
+        setattr(converter, name, value)
+    return converter
+
+def _start_worker(state, path, save_path):
+    global _worker_converter
+    _worker_converter = _converter_from_state(state, path, save_path)
+
+def _convert_in_worker(path, type_):
+    return _worker_converter._convert_input(path, type_)
+
+def _convert_shard_in_worker(inputs, save_path):
+    return _worker_converter._convert_shard(inputs, save_path)
             
     
 # class SingleDatasetConverter(Converter):
@@ -395,7 +769,8 @@ class ConverterFactory:
         InputConfig = {
             "EcoSpold2": ECS2InputConfig,
             "ILCD1": ILCD1InputConfig,
-            "OLCAILCD1": OLCAILCD1InputConfig
+            "OLCAILCD1": OLCAILCD1InputConfig,
+            "OLCAJSON": OLCAJSONInputConfig
             }.get(input_[0])
         InputConfig.ef_mapping = input_[1]
         
@@ -439,16 +814,19 @@ class ConverterFactory:
         #     return MultipleDatasetConverter(*args)
 
 
-def get_converter(input_: tuple, output: tuple, path: str, save_path: str, hash_ = ''):
+def get_converter(input_: tuple, output: tuple, path: str, save_path, hash_ = ''):
+    # save_path is a directory or an OutputSink (e.g. MemorySink, TarSink or SQLiteSink)
 
     VALID = {
         "type": {"EcoSpold2", "ILCD1", "OLCAILCD1"},
+        "input_type": {"EcoSpold2", "ILCD1", "OLCAILCD1", "OLCAJSON"}, # Formats that are only read
         "ef_type": {"EcoSpold2": {"ecoinvent3.7"},
                     "ILCD1": {"EF3.0"},
-                    "OLCAILCD1": {"EF3.0"}}
+                    "OLCAILCD1": {"EF3.0"},
+                    "OLCAJSON": {"OpenLCA"}}
     }
 
-    for x, n in ((input_[0], VALID['type']), 
+    for x, n in ((input_[0], VALID['input_type']), 
                  (output[0], VALID['type']), 
                  (input_[1], VALID['ef_type'][input_[0]]), 
                  (output[1], VALID['ef_type'][output[0]])):
@@ -468,8 +846,11 @@ def get_converter(input_: tuple, output: tuple, path: str, save_path: str, hash_
     if not path.exists():
         raise OSError(
             f'{path} is not a valid {"directory" if path.is_dir() else "file"} path')
-    save_path = Path(save_path)
-    if not save_path.is_dir():
-        raise OSError(f'{save_path} is not a valid directory path')
+    if isinstance(save_path, FileSink):
+        save_path = save_path.path
+    if not isinstance(save_path, OutputSink):
+        save_path = Path(save_path)
+        if not save_path.is_dir():
+            raise OSError(f'{save_path} is not a valid directory path')
 
     return ConverterFactory.get_converter(input_, output, path, save_path, hash_)
@@ -874,19 +874,19 @@ class ECS2Structure(StructureTemplate):
             f"{hash_}"
         return name.replace('/', ' per ')
         
-    def get_dict(self):
+    def get_tree(self):
         return {
             'ecoSpold': {
                 '@xmlns': 'http://www.EcoInvent.org/EcoSpold02',
                 'activityDataset': { # self.main_activity_type [child datasets are not accept by ecoeditor]
-                    'activityDescription': self.activityDescription.get_dict(),
-                    'flowData': self.flowData.get_dict(),
-                    'modellingAndValidation': self.modellingAndValidation.get_dict(),
-                    'administrativeInformation': self.administrativeInformation.get_dict()
+                    'activityDescription': self.activityDescription,
+                    'flowData': self.flowData,
+                    'modellingAndValidation': self.modellingAndValidation,
+                    'administrativeInformation': self.administrativeInformation
                     },
                 **({'usedUserMasterData': {
                     '@xmlns': 'http://www.EcoInvent.org/UsedUserMasterData',
-                    **self.userMaster.get_dict()
+                    **dict(self.userMaster._xml_items())
                     }} if type(self).convert_user_data else {})
                 }
             }
@@ -510,7 +510,7 @@ class ILCD1Structure(StructureTemplate):
             f"{hash_}"
         return name.replace('/', ' per ')
         
-    def get_dict(self):
+    def get_tree(self):
         return {
             'processDataSet': {
                 '@xmlns': 'http://lca.jrc.it/ILCD/Process',
@@ -519,16 +519,16 @@ class ILCD1Structure(StructureTemplate):
                 '@locations': '../ILCDLocations.xml',
                 '@metaDataOnly': "false",
                 'processInformation': {
-                    'dataSetInformation': self.dataSetInformation.get_dict(),
-                    'quantitativeReference': self.quantitativeReference.get_dict(),
-                    'time': self.time.get_dict(),
-                    'geography': self.geography.get_dict(),
-                    'technology': self.technology.get_dict(),
-                    'mathematicalRelations': self.mathematicalRelations.get_dict()
+                    'dataSetInformation': self.dataSetInformation,
+                    'quantitativeReference': self.quantitativeReference,
+                    'time': self.time,
+                    'geography': self.geography,
+                    'technology': self.technology,
+                    'mathematicalRelations': self.mathematicalRelations
                     },
-                'modellingAndValidation': self.modellingAndValidation.get_dict(),
-                'administrativeInformation': self.administrativeInformation.get_dict(),
-                'exchanges': self.exchanges.get_dict()
+                'modellingAndValidation': self.modellingAndValidation,
+                'administrativeInformation': self.administrativeInformation,
+                'exchanges': self.exchanges
                 }
             }
 
@@ -550,8 +550,8 @@ class OLCAILCD1Structure(ILCD1Structure):
         self.mathematicalRelations = OLCAMathematicalRelations()
         self.time = OLCATime()
     
-    def get_dict(self):
-        p = super().get_dict()
+    def get_tree(self):
+        p = super().get_tree()
         p['processDataSet']['@xmlns:olca'] = 'http://openlca.org/ilcd-extensions'
         return p
 
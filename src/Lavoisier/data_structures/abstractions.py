@@ -15,5 +15,10 @@ class StructureTemplate(ABC):
         pass
     
     @abstractmethod
-    def get_dict(self):
+    def get_tree(self):
+        # Content of the output in the xmltodict format, with its DotDicts only read when written
         pass
+    
+    def get_dict(self):
+        from .main import to_dict
+        return to_dict(self.get_tree())
@@ -119,29 +119,50 @@ class DotDict(dict):
         else:
             raise KeyError(f"{key} is a List of DotDicts and can only be assigned to. Use method 'get({key})' to return its value or use the method 'get_class({key})' to return its class")
         
-    def get_dict(self):
+    @classmethod
+    def _xml_fields(cls):
+        # XML names, order and type (text or not) of the fields and the mandatory fields, computed once for each class
+        if '_xml_fields_cache' not in cls.__dict__:
+            
+            def get_name(k, valid):
+                pr = {'attribute': '@', 'nms:common': 'common:', 'text': '#'}
+                k = k if 'xml_nms' not in valid else valid['xml_nms']+':'+k
+                return k if 'xml_type' not in valid else pr.get(valid['xml_type'], valid['xml_type'].replace('nms:', '')+':')+k
+            
+            cls._xml_fields_cache = ({k: (get_name(k, v), v['order'], v.get('xml_type') == 'text') for k, v in cls.VALID.items()},
+                                     tuple(k for k, v in cls.VALID.items() if v['mandatory']))
+        return cls._xml_fields_cache
+        
+    def _xml_items(self):
+        # Names and values of the fields in the XML order, with the DotDicts kept (in lists) to be read when needed
+        fields, mandatory = self._xml_fields()
         
         # Mandatory fields
-        for key in {k: v for k, v in self.VALID.items() if v['mandatory']}:
+        for key in mandatory:
             if key not in self:
                 raise AttributeError(f'class {self.__class__.__name__} missing mandatory attribute {key}')
-            
-        def get_name(k, valid):
-            pr = {'attribute': '@', 'nms:common': 'common:', 'text': '#'}
-            k = k if 'xml_nms' not in valid else valid['xml_nms']+':'+k
-            return k if 'xml_type' not in valid else pr.get(valid['xml_type'], valid['xml_type'].replace('nms:', '')+':')+k
         
-        def get_value(valid, v):
-            if isinstance(v, dict):
-                return v.get_dict()
-            elif isinstance(v, list):
-                return list(map(lambda x: x.get_dict(), v))
+        def get_value(k, v):
+            if isinstance(v, (dict, list)):
+                return v
             else:
-                return v.end()
+                return v.end() if not fields[k][2] else str(v.end())
                 
         # Ordering
-        new = {get_name(k,self.VALID[k]):(v if self.VALID[k].get('xml_type')!='text' else str(v)) for k,v in sorted({k:get_value(self.VALID[k],v) for k,v in self.items()}.items(), key=lambda n:self.VALID[n[0]]['order'])}
+        return [(fields[k][0], get_value(k, v)) for k, v in sorted(self.items(), key=lambda n: fields[n[0]][1])]
         
-        return new
+    def get_dict(self):
+        return {k: (list(map(lambda x: x.get_dict(), v)) if isinstance(v, list) and v and isinstance(v[0], DotDict) else v)
+                for k, v in self._xml_items()}
 
     __setattr__, __getattr__ = __setitem__, __getitem__
+
+def to_dict(value):
+    # Content of a structure with its DotDicts read as dicts, as given to xmltodict
+    if isinstance(value, DotDict):
+        return value.get_dict()
+    elif isinstance(value, list):
+        return [to_dict(x) for x in value]
+    elif isinstance(value, dict):
+        return {k: to_dict(v) for k, v in value.items()}
+    return value
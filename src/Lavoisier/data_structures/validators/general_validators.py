@@ -8,6 +8,7 @@ Created on Sun Jan 29 15:36:20 2023
 
 import re
 import datetime
+from contextvars import ContextVar
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from copy import deepcopy
@@ -141,11 +142,16 @@ class Str(Validator):
             raise TypeError(f'{self.__class__.__name__}: Expected a string, received {x} of type {type(x)}')
         return x
 
+# The option is set by each conversion for its own thread (and copied to the tasks it runs in other threads)
+_ignore_limits = ContextVar('ignore_limits', default=False)
+
 class _LimStr(Str):
-    ignore_limit = False
+    @property
+    def ignore_limit(self):
+        return _ignore_limits.get()
     
 def ignore_limits(value):
-    _LimStr.ignore_limit = value
+    _ignore_limits.set(value)
     
 def return_limited_string(_limit, add_func=separator_add, _sep='; '):
     class LimitedString(_LimStr):
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import re
+from .main import DotDict
+
+class XMLWriter:
+    # Writes the content of a structure (xmltodict format, with DotDicts) as XML directly to a stream, reading each
+    # DotDict only when its element is written. The output is the same as xmltodict.unparse (with the 'pretty',
+    # 'newl' and 'indent' options below), without building the whole dict and XML string before writing
+
+    pretty = True
+    newl = '\n'
+    indent = '  '
+    encoding = 'utf-8' # Only declared in the XML header, the stream being already open
+
+    @staticmethod
+    def _str(value):
+        if isinstance(value, str):
+            return value
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return bytes(value).decode('utf-8', errors='replace')
+        return str(value)
+
+    @staticmethod
+    def _escape(data, special=re.compile('[&<>]').search):
+        if special(data) is None:
+            return data
+        return data.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+
+    @classmethod
+    def _quoteattr(cls, data, special=re.compile('[&<>\n\r\t"]').search):
+        if special(data) is None:
+            return '"' + data + '"'
+        data = cls._escape(data).replace("\n", "&#10;").replace("\r", "&#13;").replace("\t", "&#9;")
+        if '"' in data:
+            if "'" in data:
+                return '"%s"' % data.replace('"', "&quot;")
+            return "'%s'" % data
+        return '"%s"' % data
+
+    def write(self, tree, stream):
+        stream.write('<?xml version="1.0" encoding="%s"?>\n' % self.encoding)
+        for key, value in tree.items():
+            self._element(stream.write, key, value, 0)
+
+    def _element(self, write, key, value, depth):
+        if not hasattr(value, '__iter__') or isinstance(value, (str, bytes, bytearray, memoryview, dict)):
+            value = [value]
+        indent = depth * self.indent if self.pretty else ''
+        end = '</' + key + '>' + (self.newl if self.pretty and depth else '')
+        for v in value:
+            if v is None:
+                v = {}
+            elif not isinstance(v, (dict, str)):
+                v = self._str(v)
+            if isinstance(v, str):
+                write(indent + '<' + key + '>' + self._escape(v) + end)
+                continue
+            cdata, attrs, children = None, {}, []
+            # The fields of a DotDict are read only now, as a dict so that repeated names are kept once as in get_dict
+            for ik, iv in (dict(v._xml_items()) if isinstance(v, DotDict) else v).items():
+                if ik == '#text':
+                    cdata = None if iv is None else self._str(iv)
+                elif ik[:1] == '@':
+                    if ik == '@xmlns' and isinstance(iv, dict):
+                        for k, x in iv.items():
+                            attrs['xmlns{}'.format(f':{k}' if k else '')] = '' if x is None else self._str(x)
+                    else:
+                        attrs[ik[1:]] = '' if iv is None else self._str(iv)
+                elif not (isinstance(iv, list) and not iv): # Empty lists are not written
+                    children.append((ik, iv))
+            start = indent + '<' + key + (''.join([' ' + n + '=' + self._quoteattr(x) for n, x in attrs.items()]) if attrs else '') + '>'
+            if children:
+                write(start + self.newl if self.pretty else start)
+                for child_key, child_value in children:
+                    self._element(write, child_key, child_value, depth+1)
+                write((self._escape(cdata) if cdata else '') + indent + end)
+            else:
+                write(start + (self._escape(cdata) if cdata else '') + end)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import contextvars
+from pathlib import Path, PosixPath
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from .converter import Converter, get_converter
+from .formats.utils import merge_keys
+
+class FanOutConverter:
+    # Conversion of the same inputs to several outputs (formats, elementary flow mappings or save paths) parsing each
+    # file once. Each converter keeps its own mapping and output manager and reads the items of the shared parse that
+    # its mapping uses, copied one at a time (the mappings change the items they convert), so their options are set as
+    # in a single conversion. The input manager of the first converter is used by all.
+    # The converters run together, each one in its own thread, as their state and logs are kept per thread
+
+    def __init__(self, converters):
+        self.converters = list(converters)
+        if not self.converters:
+            raise ValueError("A fan-out conversion requires at least one converter")
+        if len({c._names[0] for c in self.converters}) > 1 or len({Path(c.path) for c in self.converters}) > 1:
+            raise ValueError("The converters of a fan-out conversion must have the same input format and path")
+        for converter in self.converters[1:]:
+            converter.input_manager = self.converters[0].input_manager
+
+    @property
+    def input_manager(self): return self.converters[0].input_manager
+
+    def _get_keys(self):
+        # Keys of the mappings of all the converters (and of their file information), as in their single pass, and
+        # the converters receiving the items. The ones whose mapping keys are only known in the conversion read the
+        # files themselves
+        keys = [c._get_mapping_keys() for c in self.converters]
+        shared = [k is not None for k in keys]
+        return merge_keys(*(k | c._initial_info for k, c in zip(keys, self.converters) if k is not None)), shared
+
+    def _convert_file(self, converter, items, shared, file, is_last, type_):
+        converter._shared_items = items if shared[self.converters.index(converter)] else None
+        try:
+            return converter._convert_file(file, is_last, type_)
+        finally:
+            converter._shared_items = None
+
+    def _run(self, threads, func, *args):
+        # Runs func(converter, *args) for all the converters, each one in its thread (and context), raising the
+        # first error only when all of them end
+        futures = [executor.submit(context.run, func, converter, *args)
+                   for converter, (executor, context) in zip(self.converters, threads)]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def iter_convert(self, type_):
+        # Yields the results of each dataset for each converter, in the order of the converters. As in the
+        # Converter.iter_convert, the results of a dataset are given when the next one is converted
+        for converter in self.converters:
+            converter._filenames = []
+        threads = [(ThreadPoolExecutor(max_workers=1), contextvars.copy_context()) for _ in self.converters]
+        try:
+            (keys, shared), pending = self._get_keys(), []
+            for file, is_last in self.input_manager.get_files():
+                items = list(self.converters[0]._parse(file, keys)) if any(shared) else None
+                ready, pending = pending, self._run(threads, self._convert_file, items, shared, file, is_last, type_)
+                yield from ready
+            self._run(threads, lambda converter: converter._data.flush() if hasattr(converter, '_data') else None)
+            yield from pending
+        except (Exception, GeneratorExit) as e: # GeneratorExit: the iteration was stopped before the end
+            if 'file' in locals():
+                if not isinstance(file, PosixPath):
+                    file.close()
+            self.input_manager.handle_error()
+            self._run(threads, Converter._clean_conversion)
+            raise e
+        finally:
+            for executor, _ in threads:
+                executor.shutdown()
+
+    def convert(self, type_):
+        # Returns the outputs of each converter, in their order
+        for _ in self.iter_convert(type_):
+            pass
+        return [converter._filenames for converter in self.converters]
+
+
+def get_fanout_converter(input_: tuple, outputs: list, path: str, hash_ = ''):
+    # 'outputs' has the output format and elementary flow mapping of each converter with its save path, as in
+    # get_converter: [(("ILCD1", "EF3.0"), "path_to_save_directory"), ...]
+    return FanOutConverter([get_converter(input_, output, path, save_path, hash_) for output, save_path in outputs])
@@ -6,8 +6,6 @@ Created on Sat Oct 15 11:37:05 2022
 @author: jotape42p
 """
 
-import xmltodict
-
 from pathlib import Path
 from .abstractions import InputTemplate, OutputTemplate
 
@@ -16,29 +14,34 @@ class ECS2Input(InputTemplate):
     _valid_extensions = (".spold", ".SPOLD")
     
     def _single_file_input(self):
+        self.current_input = self.path
         yield (self.path, True)
     
     def _multiple_file_input(self):
-        yield from self._yield_files(list(self._get_files_of_extension(self.path,
-                                                                       self._valid_extensions)))
+        for file, is_last in self._yield_files(list(self.get_inputs())):
+            self.current_input = file
+            yield file, is_last
+
+    def get_inputs(self):
+        if self.path.is_dir():
+            if self._selected_inputs is not None:
+                return self._selected_inputs
+            return self._get_files_of_extension(self.path, self._valid_extensions)
+        return super().get_inputs()
 
 class ECS2Output(OutputTemplate):
     
     def start_conversion(self):
-        self.log_path = Path(self.path, f"{self.filename.replace('/', '_per_')}.log")
+        self.log_path = Path(self.get_log_dir(), f"{self.filename.replace('/', '_per_')}.log")
         self.log.start_log(self.log_path)
 
     def write_process(self):
-        process_dict = self.struct.get_dict()
         self.name = self.struct.get_filename(self._hash)
         self.name = self.check_name_for_existence(self.name, '.spold')
-        
-        with open(Path(self.path, self.name+'.spold'), 'w') as c:
-            c.write(xmltodict.unparse(process_dict,
-                    pretty=True, newl='\n', indent="  "))
+        self.write_struct(self.name+'.spold')
 
     def end_conversion(self):
         self.end_single_output_file()
-        self.log.end_log(self.log_path)
-        return str(Path(self.path, self.name+'.spold'))
+        self.end_log(self.log_path)
+        return self.sink.get_location(self.name+'.spold')
         
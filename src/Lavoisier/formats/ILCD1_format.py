@@ -6,49 +6,85 @@ Created on Sat Oct 15 11:30:02 2022
 @author: jotape42p
 """
 
-import shutil
-import xmltodict
 import zipfile
 from pathlib import Path
-from .utils import zipdir
+from .utils import PackageTemplate, DirectoryPackage, ZipPackage
 from .abstractions import InputTemplate, OutputTemplate
 import tempfile
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
 class ILCD1Input(InputTemplate):
     
     _valid_extensions = (".zip",".ZIP",".xml")
+    _prefetch = 1 # Number of compressed files extracted in background while the current one is converted
     
     # Includes path correction to the process folder
+    # Doesn't change the input, so that the extraction can be done in background
     def _extract(self, file):
-        self.file = zipfile.ZipFile(file)
-        for x in self.file.namelist():
-            if (x.startswith("processes/") or x.find("/processes/") != -1) and x.endswith(".xml"):
-                name = '.'.join(str(self.path).split('.')[:-1]).split('/')[-1]
-                self._tempdir = tempfile.TemporaryDirectory() # Has to be closed after
-                self._extracted_path = Path(self._tempdir.name, name)
-                _path = Path(self._extracted_path, x.split("processes/")[0])
-                self._input_file = _path
-                self._extracted_path.mkdir(exist_ok=True)
-                self.file.extractall(str(self._extracted_path))
-                break
-        return _path
+        with zipfile.ZipFile(file) as f:
+            for x in f.namelist():
+                if (x.startswith("processes/") or x.find("/processes/") != -1) and x.endswith(".xml"):
+                    name = '.'.join(str(self.path).split('.')[:-1]).split('/')[-1]
+                    tempdir = tempfile.TemporaryDirectory() # Has to be closed after
+                    extracted_path = Path(tempdir.name, name)
+                    extracted_path.mkdir(exist_ok=True)
+                    f.extractall(str(extracted_path))
+                    return tempdir, Path(extracted_path, x.split("processes/")[0])
+        raise Exception(f"ILCD 'process' folder not found or empty inside compressed file {file}. File not considered as a valid ILCD file")
+    
+    def _set_extracted(self, extracted):
+        self._tempdir, self._input_file = extracted
+        return self._input_file
     
     def _single_file_input(self): # This covers the case where there are multiple processes
-        path = self._extract(self.path)
+        self.current_input = self.path
+        path = self._set_extracted(self._extract(self.path))
         yield from self._yield_files(list(self._get_files_of_extension(Path(path, 'processes'),
                                                                        self._valid_extensions[2:])))
         self._tempdir.cleanup()
     
     def _multiple_file_input(self):
-        for i, zip_file in enumerate(self._get_files_of_extension(self.path,
-                                                                  self._valid_extensions[:2])):
-            path = self._extract(zip_file)
-            yield from self._yield_files(list(self._get_files_of_extension(Path(path, 'processes'),
-                                                                           self._valid_extensions[2:])))
-            self._tempdir.cleanup()
+        zip_files = iter(self.get_inputs())
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self._prefetched = deque((zip_file, executor.submit(self._extract, zip_file)) for zip_file in islice(zip_files, 1))
+            try:
+                while self._prefetched:
+                    self.current_input, future = self._prefetched.popleft()
+                    # The next compressed files are extracted while the current one is converted
+                    self._prefetched.extend((zip_file, executor.submit(self._extract, zip_file))
+                                            for zip_file in islice(zip_files, self._prefetch - len(self._prefetched)))
+                    path = self._set_extracted(future.result())
+                    yield from self._yield_files(list(self._get_files_of_extension(Path(path, 'processes'),
+                                                                                   self._valid_extensions[2:])))
+                    self._tempdir.cleanup()
+            finally:
+                self._discard_prefetched()
+
+    def _discard_prefetched(self):
+        while getattr(self, '_prefetched', None):
+            _, future = self._prefetched.popleft()
+            if not future.cancel() and future.exception() is None:
+                future.result()[0].cleanup()
+
+    def get_inputs(self):
+        if self.path.is_dir():
+            if self._selected_inputs is not None:
+                return self._selected_inputs
+            return self._get_files_of_extension(self.path, self._valid_extensions[:2])
+        return super().get_inputs()
         
+    def estimate_cost(self, input_):
+        # Uncompressed size of the processes, which take most of the conversion time
+        with zipfile.ZipFile(input_) as f:
+            return sum(info.file_size for info in f.infolist()
+                       if (info.filename.startswith("processes/") or info.filename.find("/processes/") != -1))
+
     def handle_error(self):
-        self._tempdir.cleanup()
+        self._discard_prefetched()
+        if hasattr(self, '_tempdir'):
+            self._tempdir.cleanup()
 
     
 class ILCD1Output(OutputTemplate):
@@ -77,31 +113,58 @@ class ILCD1Output(OutputTemplate):
              "ILCD-Data-Network_Compliance-Entry-level_Version1.1_Jan2012.pdf")
     }
     converted_files = []
+    write_package_directly = False # Datasets are written as members of the final zip file, without a directory tree
     
     def start_conversion(self):
         self._tempdir = tempfile.TemporaryDirectory() # Has to be closed after
-        self._output_file = self._tempdir.name
-
-        for dir_ in ("", "processes", "external_docs", "sources", "contacts", "flowproperties", "unitgroups"):
-            p = Path(self._tempdir.name, dir_)
-            p.mkdir(exist_ok=True)
-            
-        for (orig_dir, to_save_dir), files in self._additional_files.items():
-            for file in files:
-                shutil.copy(Path(Path(__file__).parent.parent.resolve(), orig_dir, file),
-                            Path(self._tempdir.name, to_save_dir))
+        if self.write_package_directly: # Stored in the sink at the end
+            self._package = ZipPackage(self.sink.create(), self._get_template(), self.profile)
+        else:
+            self._package = DirectoryPackage(Path(self._tempdir.name, 'package'), self._get_template(), self.profile)
+            for dir_ in ("", "processes", "external_docs", "sources", "contacts", "flowproperties", "unitgroups"):
+                p = Path(self._package.path, dir_)
+                p.mkdir(exist_ok=True)
+        self._output_file = self._package
 
+        # The logs are added to the package at the end
         self.log_path = Path(self._tempdir.name, "lavoisier.log")
         self.log.start_log(self.log_path)
     
+    @classmethod
+    def _get_template(cls):
+        # The additional files are zipped once for all the packages of the class
+        if '_template' not in cls.__dict__:
+            cls._template = PackageTemplate({'/'.join(filter(None, (to_save_dir, file))):
+                                             Path(Path(__file__).parent.parent.resolve(), orig_dir, file)
+                                             for (orig_dir, to_save_dir), files in cls._additional_files.items()
+                                             for file in files})
+        return cls._template
+    
+    @classmethod
+    def _write_member(cls, package, member, struct):
+        package.write_xml(member, struct.get_tree(), cls.xml_writer)
+    
     def write_process(self):
-        process_dict = self.struct.get_dict()
         dsi = self.struct.dataSetInformation
-        self.process_path = Path(
-            self._tempdir.name, 'processes', dsi.get('c_UUID', dsi.get('UUID'))+'.xml')
-        with open(self.process_path, 'w') as c:
-            c.write(xmltodict.unparse(process_dict,
-                    pretty=True, newl='\n', indent="  "))
+        self.process_path = 'processes/' + dsi.get('c_UUID', dsi.get('UUID')) + '.xml' # Member of the package
+        if self.write_in_background:
+            self._writer.submit(self._write_member, self._package, self.process_path, self.struct)
+        else:
+            self._write_member(self._package, self.process_path, self.struct)
+    
+    @staticmethod
+    def _write_package(sink, filename, package, tempdir):
+        try:
+            for file in Path(tempdir.name).iterdir():
+                if file.is_file():
+                    package.copy(file.name, file)
+            package.save(sink, filename)
+        except BaseException:
+            package.discard(sink)
+            sink.release(filename)
+            raise
+        finally:
+            tempdir.cleanup()
     
     def end_conversion(self):
         name = 'ILCD'+self._hash if self.multi_files else self.struct.get_filename(self._hash)
@@ -109,14 +172,38 @@ class ILCD1Output(OutputTemplate):
         name = self.check_name_for_existence(name, '.zip')
         
         self.log.end_log(self.log_path)
-        ilcd_zipfile = zipfile.ZipFile(Path(self.path, name+'.zip'), 'w')
-        zipdir(self._tempdir.name, ilcd_zipfile)
-        ilcd_zipfile.close()
-        self._tempdir.cleanup()
+        self._write(self._write_package, name+'.zip', self._package, self._tempdir)
+        
+        return self.sink.get_location(name+'.zip')
+    
+    def merge(self, packages):
+        # Merges packages of one database converted in parts. Datasets present in more than one package are kept as in
+        # a single conversion: sources and contacts are written once (from the first package), other datasets are
+        # rewritten (from the last package). Logs are joined
+        members = {}
+        files = [zipfile.ZipFile(package) for package in packages]
+        try:
+            for f in files:
+                for info in f.infolist():
+                    if info.filename.endswith('.log'):
+                        members.setdefault(info.filename, []).append((f, info))
+                    elif info.filename not in members or info.filename.strip('/').split('/')[0] not in ('sources', 'contacts'):
+                        members[info.filename] = [(f, info)]
+            
+            name = self.check_name_for_existence('ILCD'+self._hash, '.zip')
+            with self.sink.open(name+'.zip') as buffer, self.profile.open_zip(buffer) as ilcd_zipfile:
+                for member in members.values():
+                    ilcd_zipfile.writestr(member[0][1], b''.join(f.read(info) for f, info in member),
+                                          self.profile.compression, self.profile.compresslevel)
+        finally:
+            for f in files:
+                f.close()
         
-        return str(Path(self.path, name+'.zip'))
+        return self.sink.get_location(name+'.zip')
         
     def handle_error(self):
         super().handle_error()
+        if hasattr(self, '_package'):
+            self._package.discard(self.sink)
         if hasattr(self, '_tempdir'):
             self._tempdir.cleanup()
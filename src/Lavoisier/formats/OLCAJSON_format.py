@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import zipfile
+from pathlib import Path
+from .abstractions import InputTemplate
+
+class OLCAJSONPackage(zipfile.ZipFile):
+    # openLCA JSON-LD package, whose documents are opened as streams by their type and id
+
+    _folders = {'process': 'processes', 'flow': 'flows', 'flow property': 'flow_properties', 'unit group': 'unit_groups'}
+    root = '' # Folder of the package inside the compressed file, if any
+
+    def open_document(self, type_, id_):
+        return self.open(f"{self.root}{self._folders[type_]}/{id_}.json")
+
+class OLCAJSONInput(InputTemplate):
+    # openLCA JSON-LD packages, read without extracting them. The files given are paths of the processes inside the
+    # package ('package.zip/processes/id.json'), and the mapping receives the open package (as '_input_file') to read
+    # the flows, flow properties and unit groups they reference
+
+    _valid_extensions = (".zip", ".ZIP")
+
+    def _open_package(self, file):
+        package = OLCAJSONPackage(file)
+        for name in package.namelist():
+            if (name.startswith("processes/") or name.find("/processes/") != -1) and name.endswith(".json"):
+                package.root = name.split("processes/")[0]
+                return package
+        package.close()
+        raise Exception(f"openLCA 'processes' folder not found or empty inside compressed file {file}. File not considered as a valid JSON-LD file")
+
+    def _package_files(self, file):
+        self.current_input = file
+        self._input_file = self._open_package(file)
+        try:
+            processes = sorted(name for name in self._input_file.namelist()
+                               if name.startswith(self._input_file.root+"processes/") and name.endswith(".json"))
+            yield from self._yield_files([Path(file, name) for name in processes])
+        finally:
+            self._input_file.close()
+
+    def _single_file_input(self):
+        yield from self._package_files(self.path)
+
+    def _multiple_file_input(self):
+        for file in self.get_inputs():
+            yield from self._package_files(file)
+
+    def get_inputs(self):
+        if self.path.is_dir():
+            if self._selected_inputs is not None:
+                return self._selected_inputs
+            return self._get_files_of_extension(self.path, self._valid_extensions)
+        return super().get_inputs()
+
+    def estimate_cost(self, input_):
+        # Uncompressed size of the processes, which take most of the conversion time
+        with zipfile.ZipFile(input_) as f:
+            return sum(info.file_size for info in f.infolist()
+                       if (info.filename.startswith("processes/") or info.filename.find("/processes/") != -1))
+
+    def open_file(self, file):
+        return self._input_file.open(str(Path(file).relative_to(self.current_input)))
+
+    def handle_error(self):
+        if isinstance(getattr(self, '_input_file', None), OLCAJSONPackage): # Not set if the error is raised before
+            self._input_file.close()
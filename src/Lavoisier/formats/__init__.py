@@ -8,14 +8,18 @@ Created on Sat Oct 15 11:35:16 2022
 
 from .abstractions import InputTemplate, OutputTemplate, AbstractDataclass
 from .helpers import ILCD1Helper, ECS2Helper
-from .utils import XMLStreamIterable
+from .utils import XMLStreamIterable, LXMLStreamIterable, ExpatStreamIterable, JSONStreamIterable, reads, merge_keys
+from .utils import OutputProfile, OUTPUT_PROFILES
+from .sinks import OutputSink, FileSink, MemorySink, TarSink, SQLiteSink
 from .ILCD1_format import ILCD1Input, ILCD1Output
 from .ECS2_format import ECS2Input, ECS2Output
+from .OLCAJSON_format import OLCAJSONInput, OLCAJSONPackage
 from .configurations import (
     DefaultMappingConfig,
     ECS2InputConfig,
     ILCD1InputConfig,
     OLCAILCD1InputConfig,
+    OLCAJSONInputConfig,
     ECS2OutputConfig,
     ILCD1OutputConfig,
     OLCAILCD1OutputConfig
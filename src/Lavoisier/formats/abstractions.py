@@ -67,6 +67,8 @@ class InputTemplate(PathVerifier, ABC):
     # Create and make available a stream of files that shall be used in conversion
     
     _valid_extensions = tuple()
+    _selected_inputs = None
+    current_input = None # Standalone input of the last file given by 'get_files'
     
     def __init__(self, path):
         super().__init__(path)
@@ -95,13 +97,33 @@ class InputTemplate(PathVerifier, ABC):
     def get_files(self):
         pass
 
+    def get_inputs(self):
+        # Standalone inputs (files or compressed packages) that can be converted independently of each other
+        return [self.path]
+
+    def estimate_cost(self, input_):
+        # Estimated work to convert one of the standalone inputs, used to schedule parallel conversions
+        return Path(input_).stat().st_size
+
+    def select_inputs(self, inputs):
+        # Restricts a directory input to some of its standalone inputs (all of them again if None)
+        self._selected_inputs = list(inputs) if inputs is not None else None
+
+    def open_file(self, file):
+        # Stream of one of the files given by 'get_files', read by the iterator
+        return open(file, 'r')
+
     def handle_error(self):
         pass
 
     
 from copy import deepcopy
 from pathlib import Path
-from .utils import DefaultLog
+import io
+import tempfile
+from .utils import DefaultLog, BackgroundWriter, OutputProfile
+from .sinks import OutputSink, FileSink
+from ..data_structures.writer import XMLWriter
         
 class OutputTemplate(PathVerifier, ABC):
     
@@ -114,28 +136,71 @@ class OutputTemplate(PathVerifier, ABC):
     _hash = ''
     
     only_elem_flows = False # Conversion only for elementary flows
+    write_in_background = True # Outputs are serialized and written while the next dataset is converted
+    xml_writer = XMLWriter # Streams the structure to the output file
+    profile = OutputProfile() # Indentation of the XML and compression of the packages
     
     def __init__(self, path, of, structure):
-        super().__init__(path)
+        # 'path' is the save directory or an OutputSink
+        self.sink = path if isinstance(path, OutputSink) else FileSink(self._verify_path(path).resolve())
+        self.path = self.sink.path if self.sink.local else None
         self._output_file = deepcopy(of) # Used in start conversion to pass to mapping
-        self.path = self.path.resolve()
         self.struct = structure() # structure is a class
         self.log = DefaultLog()
         self.multi_files = False
+        self._writer = getattr(self, '_writer', None) or BackgroundWriter() # Kept between the files of the output
+    
+    def _write(self, func, filename, *args):
+        # Writes the output 'filename' (reserved in the sink) with func(sink, filename, *args), in background if
+        # possible. The name is released if the output can't be written
+        try:
+            if self.write_in_background:
+                self._writer.submit(func, self.sink, filename, *args)
+            else:
+                func(self.sink, filename, *args)
+        except BaseException:
+            self.sink.release(filename)
+            raise
+    
+    @staticmethod
+    def _write_struct(sink, filename, struct, writer):
+        with sink.open(filename) as buffer:
+            c = io.TextIOWrapper(buffer, encoding='utf-8')
+            writer.write(struct.get_tree(), c)
+            c.detach()
+    
+    def write_struct(self, filename):
+        # The structure is handed to the writer, as a new one is created for the next file
+        self._write(self._write_struct, filename, self.struct, self.profile.get_xml_writer(self.xml_writer))
+    
+    def get_log_dir(self):
+        # Logs are written in the save directory or, if the outputs are not files, in a temporary directory and stored
+        # in the sink at the end of the conversion
+        if self.sink.local:
+            return self.path
+        if getattr(self, '_log_dir', None) is None:
+            self._log_dir = tempfile.TemporaryDirectory()
+        return Path(self._log_dir.name)
+    
+    def end_log(self, log_path):
+        self.log.end_log(log_path)
+        if not self.sink.local and log_path is not None:
+            for file in list(Path(log_path).parent.iterdir()):
+                self.sink.add_file(file.name, file)
+                file.unlink()
+    
+    def flush(self):
+        # Waits for the outputs being written
+        self._writer.close()
         
     def end_single_output_file(self):
         self.write_process()
         self.log.reset_log(self.filename)
-        self.__init__(self.path, self._output_file, self.struct.__class__)
+        self.__init__(self.sink, self._output_file, self.struct.__class__)
         
     def check_name_for_existence(self, name, extension):
-        name_ = deepcopy(name)
-        if Path(self.path, name_+extension).is_file():
-            i = 1
-            while Path(self.path, name_+extension).is_file():
-                name_ = name + ' (' + str(i) + ')'
-                i += 1
-        return name_
+        # The name (with a suffix if it exists) is reserved in the sink
+        return self.sink.reserve(name, extension)
         
     @abstractmethod
     def write_process(self):
@@ -154,4 +219,8 @@ class OutputTemplate(PathVerifier, ABC):
         pass
     
     def handle_error(self):
+        try:
+            self.flush()
+        except Exception: # The error being handled is the one raised
+            pass
         self.log.end_log(None)
@@ -7,11 +7,13 @@ Created on Sat Oct 15 12:14:49 2022
 """
 
 from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import Any, Optional
 from .abstractions import InputTemplate, OutputTemplate, AbstractDataclass
 from .ILCD1_format import ILCD1Input, ILCD1Output
 from .ECS2_format import ECS2Input, ECS2Output
-from .utils import XMLStreamIterable
+from .OLCAJSON_format import OLCAJSONInput
+from .utils import XMLStreamIterable, JSONStreamIterable, OutputProfile
 from ..data_structures import (
     ignore_limits,
     ILCD1Structure,
@@ -24,9 +26,10 @@ class MappingConfig(AbstractDataclass):
     mapping_class: Any | None
     transfer_defaults: bool
 
+@dataclass # Instances are the configurations set in the converter, as the class is the default one
 class DefaultMappingConfig(MappingConfig):
-    mapping_class = None # None = default used
-    transfer_defaults = True
+    mapping_class: Any | None = None # None = default used
+    transfer_defaults: bool = True
 
 class InputConfig(AbstractDataclass):
     name: str
@@ -71,6 +74,18 @@ class ECS2InputConfig(InputConfig):
 class OLCAILCD1InputConfig(ILCD1InputConfig):
     name = 'OLCAILCD1'
 
+class OLCAJSONInputConfig(InputConfig):
+    # Processes of openLCA JSON-LD packages. There is no default mapping from them, the mapping class is set in the
+    # mapping configuration of the converter
+    name = 'OLCAJSON'
+    iterator = JSONStreamIterable
+    input_manager = OLCAJSONInput
+    initial_info = {
+        "name": ('filename', lambda x: x),
+        "exchanges.item": (('mapping','_flow_internal_refs', 'list'), lambda x: (x.get('internalId'), x['flow'].get('name')))
+        }
+    add_options = {}
+
 
 class OutputConfig(AbstractDataclass):
     name: str
@@ -89,7 +104,9 @@ class ILCD1OutputConfig(OutputConfig):
     add_options = {
         "ignore_string_length_restrictions": (True, 'general_option', ignore_limits),
         "sum_same_elementary_amounts": (False, 'mapping_option', lambda mapping, x: setattr(mapping, 'sum_same_elementary_amounts', x)),
-        "convert_parameterization": (True, 'mapping_option', lambda mapping, x: setattr(mapping, 'convert_parameterization', x))
+        "convert_parameterization": (True, 'mapping_option', lambda mapping, x: setattr(mapping, 'convert_parameterization', x)),
+        "write_package_directly": (False, 'output_option', lambda output, x: setattr(output, 'write_package_directly', x)),
+        "output_profile": (OutputProfile(), 'output_option', lambda output, x: setattr(output, 'profile', x))
         }
 
 class ECS2OutputConfig(OutputConfig):
@@ -101,7 +118,8 @@ class ECS2OutputConfig(OutputConfig):
         "ignore_string_length_restrictions": (True, 'general_option', ignore_limits),
         "sum_same_elementary_amounts": (False, 'mapping_option', lambda mapping, x: setattr(mapping, 'sum_same_elementary_amounts', x)),
         "convert_user_data": (True, "mapping_option", lambda mapping, x: setattr(mapping, 'convert_user_data', x)),
-        "use_master_data_properties": (True, "mapping_option", lambda mapping, x: setattr(mapping, 'use_master_data_properties', x))
+        "use_master_data_properties": (True, "mapping_option", lambda mapping, x: setattr(mapping, 'use_master_data_properties', x)),
+        "output_profile": (OutputProfile(), 'output_option', lambda output, x: setattr(output, 'profile', x)) # Only the XML indentation
         }
 
 class OLCAILCD1OutputConfig(ILCD1OutputConfig):
@@ -11,9 +11,34 @@ import uuid
 import time
 import random
 import zipfile
+import threading
 rdn = random.Random()
 
-class ILCD1Helper:
+class ThreadLocalMeta(type):
+    # Class attributes named in '_thread_local' are kept per thread, so concurrent conversions don't share them
+
+    def __new__(mcs, name, bases, namespace):
+        defaults = {k: namespace.pop(k, None) for k in namespace.get('_thread_local', ())}
+        cls = super().__new__(mcs, name, bases, namespace)
+        if defaults:
+            type.__setattr__(cls, '_local', threading.local())
+            type.__setattr__(cls, '_local_defaults', defaults)
+        return cls
+
+    def __getattr__(cls, name):
+        if name != '_thread_local' and name in getattr(cls, '_thread_local', ()):
+            return getattr(cls._local, name, cls._local_defaults[name])
+        raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+    def __setattr__(cls, name, value):
+        if name in getattr(cls, '_thread_local', ()):
+            setattr(cls._local, name, value)
+        else:
+            super().__setattr__(name, value)
+
+class ILCD1Helper(metaclass=ThreadLocalMeta):
+    
+    _thread_local = ('number', 'default_language')
     
     @staticmethod
     def is_valid(path):
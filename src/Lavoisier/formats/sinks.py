@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import io
+import time
+import sqlite3
+import tarfile
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from contextlib import contextmanager
+from .utils import NameRegistry
+
+class OutputSink(ABC):
+    # Destination of the outputs of a conversion. Each output is written in a buffer given by the sink ('create') and
+    # stored with its reserved name when complete ('commit'), so that outputs are never read back from a file. The
+    # sinks are shared by the threads of a conversion (background writer, fan-out and asyncio lanes)
+
+    local = False # Outputs are files of the directory 'path' (needed by the parallel processes and the journal)
+    spool_size = 2**24 # Bytes of a buffer kept in memory before it is written to a temporary file
+
+    def __init__(self, names=()):
+        self.names = NameRegistry(names=names)
+        self._lock = threading.Lock()
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def reserve(self, name, extension):
+        # The name (with a suffix if it is already used) is reserved for an output
+        return self.names.reserve(name, extension)
+
+    def release(self, filename):
+        # Reserved name not used by an output
+        self.names.release(filename)
+
+    def create(self):
+        # Binary buffer of a new output
+        return tempfile.SpooledTemporaryFile(self.spool_size)
+
+    def commit(self, buffer, filename):
+        # Stores the buffer as the output 'filename'
+        try:
+            buffer.seek(0)
+            with self._lock:
+                self._store(buffer, filename)
+        finally:
+            buffer.close()
+
+    def discard(self, buffer, filename=None):
+        # Buffer of an output that could not be written (and the name reserved for it)
+        buffer.close()
+        if filename is not None:
+            self.release(filename)
+
+    @contextmanager
+    def open(self, filename):
+        # Buffer stored as the output 'filename' if no error is raised
+        buffer = self.create()
+        try:
+            yield buffer
+        except BaseException:
+            self.discard(buffer, filename)
+            raise
+        self.commit(buffer, filename)
+
+    def add_file(self, filename, path):
+        # Stores a file written outside of the sink (e.g. a log), replacing the output 'filename' if it exists
+        with open(path, 'rb') as f, self._lock:
+            self._store(f, filename)
+
+    def get_location(self, filename):
+        # Returned by the conversion for each output
+        return filename
+
+    @abstractmethod
+    def _store(self, buffer, filename):
+        pass
+
+    def close(self):
+        pass
+
+class FileSink(OutputSink):
+    # Outputs as files of a directory. A buffer is a temporary file of the directory, renamed to its output when
+    # complete. The names are reserved by creating their files (see NameRegistry)
+
+    local = True
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = Path(path)
+        self.names = NameRegistry(self.path)
+
+    def release(self, filename):
+        Path(self.path, filename).unlink(missing_ok=True)
+        super().release(filename)
+
+    def create(self):
+        return tempfile.NamedTemporaryFile(dir=self.path, suffix='.part', delete=False)
+
+    def commit(self, buffer, filename):
+        buffer.close()
+        os.replace(buffer.name, Path(self.path, filename))
+
+    def discard(self, buffer, filename=None):
+        buffer.close()
+        Path(buffer.name).unlink(missing_ok=True)
+        super().discard(buffer, filename)
+
+    def add_file(self, filename, path):
+        if Path(path).resolve() != Path(self.path, filename).resolve():
+            super().add_file(filename, path)
+
+    def _store(self, buffer, filename):
+        with open(Path(self.path, filename), 'wb') as f:
+            f.write(buffer.read())
+
+    def get_location(self, filename):
+        return str(Path(self.path, filename))
+
+class MemorySink(OutputSink):
+    # Outputs kept in memory as bytes, in 'outputs' by filename
+
+    def __init__(self):
+        super().__init__()
+        self.outputs = {}
+
+    def create(self):
+        return io.BytesIO()
+
+    def _store(self, buffer, filename):
+        self.outputs[filename] = buffer.getvalue() if isinstance(buffer, io.BytesIO) else buffer.read()
+
+class TarSink(OutputSink):
+    # Outputs as members of a tar archive, given as a path or a binary stream ('w|' mode to write a stream that can't
+    # be seeked, e.g. a pipe or a socket, and 'w:gz' or 'w|gz' to compress it). The archive is complete when the sink
+    # is closed
+
+    def __init__(self, file, mode='w'):
+        super().__init__()
+        if isinstance(file, (str, os.PathLike)):
+            self._tar = tarfile.open(file, mode)
+        else:
+            self._tar = tarfile.open(fileobj=file, mode=mode)
+
+    def _store(self, buffer, filename):
+        info = tarfile.TarInfo(filename)
+        info.size = buffer.seek(0, os.SEEK_END)
+        info.mtime = int(time.time())
+        buffer.seek(0)
+        self._tar.addfile(info, buffer)
+
+    def close(self):
+        with self._lock:
+            self._tar.close()
+
+class SQLiteSink(OutputSink):
+    # Outputs as rows (name, data) of a table of a SQLite database. The names of the rows already in the table are not
+    # used again
+
+    def __init__(self, path, table='outputs'):
+        self.table = table
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute(f'CREATE TABLE IF NOT EXISTS "{table}" (name TEXT PRIMARY KEY, data BLOB)')
+        super().__init__(name for name, in self._connection.execute(f'SELECT name FROM "{table}"'))
+
+    def _store(self, buffer, filename):
+        with self._connection:
+            self._connection.execute(f'INSERT OR REPLACE INTO "{self.table}" (name, data) VALUES (?, ?)',
+                                     (filename, buffer.read()))
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
@@ -7,6 +7,15 @@ Created on Sat Oct 15 12:08:41 2022
 """
 
 import os
+import io
+import threading
+import shutil
+import zipfile
+import tempfile
+from pathlib import Path
+from dataclasses import dataclass
+from contextlib import contextmanager
+from ..data_structures.writer import XMLWriter
 
 def zipdir(path, ziph):
 
@@ -16,19 +25,306 @@ def zipdir(path, ziph):
             filepath = os.path.join(root, file)
             ziph.write(filepath, filepath[len_path:])
 
+@dataclass(frozen=True)
+class OutputProfile:
+    # Serialization of the outputs: indented or compact XML (without whitespace between the elements) and compression
+    # of the zip packages (zipfile.ZIP_STORED, or ZIP_DEFLATED with a level from 1 to 9, 6 if None). The compression
+    # does not apply to the outputs that are not packages (EcoSpold2 files)
+    pretty: bool = True
+    compression: int = zipfile.ZIP_STORED
+    compresslevel: int = None
+
+    def __post_init__(self):
+        if self.compression not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise ValueError(f"Invalid compression '{self.compression}'. Must be zipfile.ZIP_STORED or zipfile.ZIP_DEFLATED")
+        if self.compresslevel is not None and (self.compression != zipfile.ZIP_DEFLATED or self.compresslevel not in range(1, 10)):
+            raise ValueError(f"Invalid compression level '{self.compresslevel}'. Must be from 1 to 9, with zipfile.ZIP_DEFLATED")
+
+    @classmethod
+    def get(cls, profile):
+        # Profile given as a profile, the name of one of the OUTPUT_PROFILES or a dict of its fields
+        if isinstance(profile, cls):
+            return profile
+        if isinstance(profile, str):
+            if profile not in OUTPUT_PROFILES:
+                raise ValueError(f"Invalid output profile '{profile}'. Must be one of {', '.join(OUTPUT_PROFILES)}")
+            return OUTPUT_PROFILES[profile]
+        if isinstance(profile, dict):
+            return cls(**profile)
+        raise TypeError(f"Output profile must be an OutputProfile, a name or a dict. Received '{profile}' of type {type(profile)}")
+
+    def get_xml_writer(self, writer=XMLWriter):
+        writer = writer()
+        writer.pretty = self.pretty
+        return writer
+
+    def open_zip(self, path, mode='w'):
+        return zipfile.ZipFile(path, mode, self.compression, allowZip64=True, compresslevel=self.compresslevel)
+
+# Presets, measured with 'benchmarks/output_profile.py'
+OUTPUT_PROFILES = {
+    'default': OutputProfile(),
+    'compact': OutputProfile(pretty=False), # For I/O bound jobs
+    'fast': OutputProfile(pretty=False, compression=zipfile.ZIP_DEFLATED, compresslevel=1),
+    'small': OutputProfile(pretty=False, compression=zipfile.ZIP_DEFLATED, compresslevel=9)
+    }
+
+class PackageTemplate:
+    # Zip file with the datasets common to all the packages of an output ({member: source file}), built once per
+    # process. Packages start as a copy of it, reusing its members instead of copying and compressing their files again
+
+    def __init__(self, files):
+        self.files = files
+        self._lock = threading.Lock()
+        self._built = {} # Temporary directory of the zip file of each process and compression
+
+    def get_path(self, profile):
+        key = (os.getpid(), profile.compression, profile.compresslevel)
+        with self._lock:
+            if key not in self._built:
+                for (pid, *_), tempdir in self._built.items():
+                    if pid != os.getpid(): # Inherited from the parent process (fork), which still uses and removes them
+                        tempdir._finalizer.detach()
+                tempdir = tempfile.TemporaryDirectory()
+                with profile.open_zip(Path(tempdir.name, 'template.zip')) as z:
+                    for member, file in self.files.items():
+                        z.write(file, member)
+                self._built[key] = tempdir
+            return Path(self._built[key].name, 'template.zip')
+
+class DirectoryPackage:
+    # Datasets of a package written as files of a directory ('processes/<uuid>.xml' members), compressed at the end.
+    # A member written again replaces the previous one (also the ones of the template)
+
+    def __init__(self, path, template=None, profile=OutputProfile()):
+        self.path = Path(path)
+        self.template = template
+        self.profile = profile
+
+    def __deepcopy__(self, memo):
+        return self # The package is shared by the output and the mapping, not copied
+
+    def __contains__(self, member):
+        return (self.template is not None and member in self.template.files) or Path(self.path, member).is_file()
+
+    def _get_path(self, member):
+        path = Path(self.path, member)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def open(self, member):
+        # Text stream to write a member
+        return open(self._get_path(member), 'w')
+
+    def write_xml(self, member, tree, writer=XMLWriter):
+        # Writes the tree of a structure (or its xmltodict dict) as XML, following the profile of the package
+        with self.open(member) as f:
+            self.profile.get_xml_writer(writer).write(tree, f)
+
+    def copy(self, member, src):
+        shutil.copyfile(src, self._get_path(member))
+
+    def save(self, sink, filename):
+        # Writes the package as the output 'filename' of the sink
+        files = {Path(root, file).relative_to(self.path).as_posix(): Path(root, file)
+                 for root, _, names in os.walk(self.path) for file in names}
+        template = self.template.files if self.template is not None else {}
+        mode = 'w'
+        with sink.open(filename) as buffer:
+            if template and not template.keys() & files.keys():
+                with open(self.template.get_path(self.profile), 'rb') as f:
+                    shutil.copyfileobj(f, buffer)
+                mode = 'a'
+            else: # The template is written again, as some of its members are replaced
+                files = template | files
+            with self.profile.open_zip(buffer, mode) as ilcd_zipfile:
+                for member, file in files.items():
+                    ilcd_zipfile.write(file, member)
+
+    def discard(self, sink):
+        pass # The directory is temporary
+
+class ZipPackage(DirectoryPackage):
+    # Datasets of a package written directly as members of a zip file, without a directory tree. The zip is written in
+    # a buffer of the output sink (e.g. a temporary file in the save directory), whose name is only given at the end.
+    # As in a directory, a member written again replaces the previous one: its last version is kept in a temporary
+    # directory and the zip is written again without the replaced members when saved. Zip64 extensions are used
+    # when the package has more than 65535 members or 4 GiB. Members can be written by several threads (e.g. the
+    # background writer)
+
+    def __init__(self, buffer, template=None, profile=OutputProfile()):
+        self.template = template
+        self.profile = profile
+        self._buffer = buffer
+        if template is not None:
+            with open(template.get_path(profile), 'rb') as f:
+                shutil.copyfileobj(f, buffer)
+        self._zip = profile.open_zip(buffer, 'w' if template is None else 'a')
+        self._members = set(self._zip.namelist())
+        self._replaced = None # Temporary directory with the members written again
+        self._lock = threading.Lock()
+
+    def __contains__(self, member):
+        return member in self._members
+
+    def _get_replaced_path(self, member):
+        if self._replaced is None:
+            self._replaced = tempfile.TemporaryDirectory()
+        path = Path(self._replaced.name, member)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    @contextmanager
+    def open(self, member):
+        with self._lock:
+            if member in self._members:
+                with open(self._get_replaced_path(member), 'w', encoding='utf-8') as f:
+                    yield f
+                return
+            self._members.add(member)
+            with io.TextIOWrapper(self._zip.open(member, 'w'), encoding='utf-8') as f:
+                yield f
+
+    def copy(self, member, src):
+        with self._lock:
+            if member in self._members:
+                shutil.copyfile(src, self._get_replaced_path(member))
+            else:
+                self._members.add(member)
+                self._zip.write(src, member)
+
+    def save(self, sink, filename):
+        # The package is closed and its buffer stored as the output 'filename' of the sink
+        with self._lock:
+            self._zip.close()
+        if self._replaced is None:
+            sink.commit(self._buffer, filename)
+            return
+        replaced = {Path(root, file).relative_to(self._replaced.name).as_posix(): Path(root, file)
+                    for root, _, names in os.walk(self._replaced.name) for file in names}
+        try:
+            with sink.open(filename) as buffer, self.profile.open_zip(buffer) as new, zipfile.ZipFile(self._buffer) as old:
+                for info in old.infolist():
+                    if info.filename not in replaced:
+                        new.writestr(info, old.read(info), self.profile.compression, self.profile.compresslevel)
+                for member, file in replaced.items():
+                    new.write(file, member)
+        finally:
+            sink.discard(self._buffer)
+            self._replaced.cleanup()
+
+    def discard(self, sink):
+        try:
+            self._zip.close()
+        except Exception: # The package is removed anyway
+            pass
+        sink.discard(self._buffer)
+        if self._replaced is not None:
+            self._replaced.cleanup()
+
+class NameRegistry:
+    # Names of the files of a directory, read once and updated as names are reserved, so that a free name is found
+    # without checking the files. A name is reserved by creating its file exclusively, so that other processes
+    # writing in the directory can't reserve it too (their names are found then). Without a directory, the names are
+    # only kept in memory (starting with 'names')
+
+    def __init__(self, path=None, names=()):
+        self.path = None if path is None else Path(path)
+        self._names = None if path is not None else set(names) # Read at the first reservation
+        self._next = {} # Next suffix to try for each name and extension
+        self._reserved = {} # Name and suffix of the files reserved
+        self._lock = threading.Lock()
+
+    def reserve(self, name, extension):
+        # Reserves 'name' or the first 'name (i)' free and returns it
+        with self._lock:
+            if self._names is None:
+                self._names = {x.name for x in os.scandir(self.path) if x.is_file()}
+            key = (name, extension)
+            i = self._next.get(key, 0)
+            while True:
+                name_ = name + ' (' + str(i) + ')' if i else name
+                if name_+extension not in self._names:
+                    self._names.add(name_+extension)
+                    try:
+                        if self.path is not None:
+                            os.close(os.open(Path(self.path, name_+extension), os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    except FileExistsError: # Created after the directory was read
+                        i += 1
+                        continue
+                    self._next[key] = i + 1
+                    self._reserved[name_+extension] = (key, i)
+                    return name_
+                i += 1
+
+    def release(self, filename):
+        # The name of a file reserved (and removed) can be reserved again
+        with self._lock:
+            if filename in self._reserved:
+                key, i = self._reserved.pop(filename)
+                self._names.discard(filename)
+                self._next[key] = min(self._next[key], i)
+
 from .abstractions import LogTemplate
 import logging
 import time, re
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+
+class BackgroundWriter:
+    # Runs the writing of outputs in a thread while the next dataset is converted. Only one task is done at a time and
+    # a new task waits for the previous one, whose errors are raised to the caller
+    
+    def __init__(self):
+        self._executor = None
+        self._future = None
+    
+    def submit(self, func, *args):
+        self.wait()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1)
+        # The context is copied so that the conversion options (e.g. string limits) apply to the task
+        self._future = self._executor.submit(contextvars.copy_context().run, func, *args)
+    
+    def wait(self):
+        future, self._future = self._future, None
+        if future is not None:
+            future.result()
+    
+    def close(self):
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
 
 class DefaultLog(LogTemplate):
     # Make structure collect the file name
+    
+    # The root logger is shared, so each conversion thread writes only its own records to its log file
+    _handlers = {}
+    # Keeps the root logger configured between logs, otherwise logging calls would print to the console
+    _null_handler = logging.NullHandler()
+
+    @classmethod
+    def _close_handler(cls):
+        handler = cls._handlers.pop(threading.get_ident(), None)
+        if handler is not None:
+            logging.getLogger().removeHandler(handler)
+            handler.close()
 
     def start_log(self, log_path):
         from .. import __version__
-        logging.basicConfig(filename=str(log_path),
-                            format="%(levelname)s - %(message)s",
-                            force=True,
-                            level=logging.DEBUG)
+        self._close_handler()
+        thread = threading.get_ident()
+        handler = logging.FileHandler(str(log_path))
+        handler.setFormatter(logging.Formatter("%(levelname)s - %(message)s"))
+        handler.addFilter(lambda record: record.thread == thread)
+        logging.getLogger().addHandler(handler)
+        logging.getLogger().addHandler(self._null_handler)
+        logging.getLogger().setLevel(logging.DEBUG)
+        type(self)._handlers[thread] = handler
         logging.info(f"\n###\nLavoisier version: {__version__}\nConversion started at: {time.strftime('%d/%m/%Y %H:%M:%S', time.localtime())}"+\
                      "\nLavoisier, converter of LCI formats, powered by Gyro (UTFPR) and IBICT\nLicensed under GNU General Public License v3 (GPLv3)\n###\n")
 
@@ -37,7 +333,7 @@ class DefaultLog(LogTemplate):
 
     def end_log(self, log_path):
         logging.info("\nConversion ended")
-        logging.handlers = []
+        self._close_handler()
         
         if log_path is not None:
             with open(str(log_path), 'r') as f:
@@ -51,70 +347,168 @@ class DefaultLog(LogTemplate):
 
 from .abstractions import BasicIterable
 import xml.etree.cElementTree as etree
+from xml.parsers import expat
+from functools import lru_cache, partial
+try:
+    from lxml import etree as lxml_etree
+except ImportError: # Optional parser
+    lxml_etree = None
+
+def reads(*fields):
+    # Declares the fields of the items ('@attribute', '#text' or child tag) read by a mapping function, so that
+    # the XML iterators only build these fields of the elements given to it
+    def set_fields(func):
+        func.fields = frozenset(fields)
+        return func
+    return set_fields
+
+def merge_keys(*keys):
+    # Keys of several mappings with one of their functions, which is None if they read different fields of a key
+    merged = {}
+    for mapping in keys:
+        for key, func in mapping.items():
+            if key in merged and getattr(merged[key], 'fields', None) != getattr(func, 'fields', None):
+                func = None
+            merged[key] = func
+    return merged
 
 class XMLStreamIterable(BasicIterable):
 
+    release_elements = True # Parsed elements are freed when no element still to be yielded can contain them
+
     def __init__(self,
                  file,
                  keys: dict):
-        self._tree = etree.iterparse(file, events=["start", "end"])
+        self._file = file
+        self._tree = self._iterparse(file)
         self._keys = list(keys.keys())
-        self._path = ""
+        self._trie = self._compile(tuple(self._keys))
+        self._names = {} # Names of the tags and attributes without namespace
+        # Items of the keys whose function declares the fields it reads are built with these fields only
+        self._materializers = {key: self.elem2dict if getattr(func, 'fields', None) is None else partial(self.select, fields=func.fields)
+                               for key, func in keys.items()}
         self.gen = self.gen_return()
 
+    @staticmethod
+    def _iterparse(file):
+        return etree.iterparse(file, events=["start", "end"])
+
+    @staticmethod
+    @lru_cache(maxsize=64) # The same keys are used for all the files of a conversion
+    def _compile(keys):
+        # Trie of the key paths by tag. Each node is [children by tag, key of the element (None if it is not a key),
+        # keys of its attributes by attribute name]
+        root = [{}, None, {}]
+        for key in keys:
+            *tags, last = key.split("/")[1:]
+            node = root
+            for tag in tags if last.startswith("@") else tags + [last]:
+                node = node[0].setdefault(tag, [{}, None, {}])
+            if last.startswith("@"):
+                node[2][last[1:]] = key
+            else:
+                node[1] = key
+        return root
+
     def __iter__(self):
         return self
 
+    def _name(self, name):
+        try:
+            return self._names[name]
+        except KeyError:
+            self._names[name] = name.rpartition("}")[-1]
+            return self._names[name]
+
     def elem2dict(self, e):
 
-        result = {
-            **{("@"+x.rpartition("}")[-1] if '}' in x else "@"+x): y for x, y in e.attrib.items()},
-            **({'#text': e.text} if e.text and not e.text.isspace() else {}),
-        }
+        result = {"@"+self._name(x): y for x, y in e.attrib.items()} if e.attrib else {}
+        text = e.text
+        if text and not text.isspace():
+            result['#text'] = text
 
-        if len(e) == 0 and '@lang' in result and '#text' not in result:  # Maybe change
-            result["#text"] = ''
+        if len(e) == 0:
+            if '@lang' in result and '#text' not in result:  # Maybe change
+                result["#text"] = ''
+            elif len(result) == 1 and '#text' in result: # If its only a text, make it return only the text
+                return text
+            return result
 
         for t in e:
-            n = t.tag.rpartition("}")[-1] if '}' in t.tag else t.tag
+            n = self._name(t.tag)
             if n in result:
                 ln = result[n]
-                result[n] = (ln if isinstance(ln, list)
-                             else [ln]) + [self.elem2dict(t)]
+                if isinstance(ln, list): # Lists are only created here
+                    ln.append(self.elem2dict(t))
+                else:
+                    result[n] = [ln, self.elem2dict(t)]
             else:
                 result[n] = self.elem2dict(t)
 
-        if list(result) == ['#text']: # If its only a text, make it return only the text
-            result = result['#text']
+        return result
+
+    def select(self, e, fields):
+        # The given fields of elem2dict(e), built without the others
+        if len(e) == 0 and not e.attrib and e.text and not e.text.isspace():
+            return e.text # Same as elem2dict, whatever the fields
+
+        result = {}
+        for x, y in e.attrib.items():
+            n = "@"+self._name(x)
+            if n in fields:
+                result[n] = y
+        if '#text' in fields:
+            if e.text and not e.text.isspace():
+                result['#text'] = e.text
+            elif len(e) == 0 and any(self._name(x) == 'lang' for x in e.attrib):
+                result['#text'] = ''
+
+        for t in e:
+            n = self._name(t.tag)
+            if n in fields:
+                if n in result:
+                    ln = result[n]
+                    if isinstance(ln, list):
+                        ln.append(self.elem2dict(t))
+                    else:
+                        result[n] = [ln, self.elem2dict(t)]
+                else:
+                    result[n] = self.elem2dict(t)
 
         return result
 
     def gen_return(self):
-        try:
-            while 1:
-                event, n = next(self._tree)
-                if event == "start":
-                    self._path += "/" + n.tag.rpartition("}")[-1]
-                elif event == "end":
-                    if self._path in self._keys:
+        # Nodes of the trie for the elements being parsed, None for the elements no key can match (nor their children)
+        nodes = [self._trie]
+        parents, open_keys = [], 0 # Elements being parsed and how many of them will be yielded
+        for event, n in self._tree:
+            if event == "start":
+                node = nodes[-1]
+                if node is not None:
+                    node = node[0].get(n.tag.rpartition("}")[-1])
+                    open_keys += node is not None and node[1] is not None
+                nodes.append(node)
+                parents.append(n)
+            else:
+                node = nodes.pop()
+                parents.pop()
+                if node is not None:
+                    if node[1] is not None:
                         b = (bool(n.attrib), (n.text is not None or not str(
                             n.text).isspace()), len(n) != 0)
                         if any(b):
-                            # n.clear() # This makes the pointer go to the next element after the entire 'n'
-                            yield (self._path, self.elem2dict(n))
-                    # else: # This else makes the pointer pass the attributes to the next element
-                    for tag in n.attrib:
-                        t = self._path + "/@" + tag
-                        if t in self._keys:
-                            yield (t, n.attrib[tag])
-                            # self._keys.remove(t)
-                    # if self._path in self._keys:
-                        # n.clear()
-                    self._path = self._path.rpartition("/")[0]
-                    # n.clear()
-                
-        except StopIteration:
-            pass
+                            yield (node[1], self._materializers[node[1]](n))
+                        open_keys -= 1
+                    if node[2]:
+                        for tag in n.attrib:
+                            if tag in node[2]:
+                                yield (node[2][tag], n.attrib[tag])
+                if self.release_elements and not open_keys:
+                    # Already yielded (or skipped) and not part of an element to be yielded, so it is removed
+                    # from its parent (only the one being parsed is kept there)
+                    n.clear()
+                    if parents:
+                        parents[-1].remove(n)
 
     def __next__(self):
         try:
@@ -122,26 +516,128 @@ class XMLStreamIterable(BasicIterable):
         except StopIteration:
             raise StopIteration
 
+class LXMLStreamIterable(XMLStreamIterable):
+    # Same iteration with the lxml parser (optional dependency 'lxml')
+
+    @staticmethod
+    def _iterparse(file):
+        if lxml_etree is None:
+            raise ImportError("LXMLStreamIterable requires the 'lxml' package")
+        # Comments and processing instructions are not part of the elements, as in the xml.etree parser
+        return lxml_etree.iterparse(getattr(file, 'buffer', file), events=("start", "end"),
+                                    remove_comments=True, remove_pis=True, huge_tree=True)
+
+class _Element:
+    # Minimal element (with what elem2dict uses) built by the expat iterator
+
+    __slots__ = ('tag', 'attrib', 'text', 'children')
+
+    def __init__(self, tag, attrib):
+        self.tag, self.attrib, self.text, self.children = tag, attrib, None, []
+
+    def __len__(self):
+        return len(self.children)
+
+    def __iter__(self):
+        return iter(self.children)
+
+class ExpatStreamIterable(XMLStreamIterable):
+    # Same iteration with the expat parser handlers, without a tree: elements are only built inside the ones to be
+    # yielded (or to have their attributes yielded), the others being only followed by their trie nodes
+
+    _chunk_size = 65536
+
+    @staticmethod
+    def _iterparse(file):
+        return None
+
+    def gen_return(self):
+        parser = expat.ParserCreate(namespace_separator="}")
+        parser.buffer_text = True
+        nodes, elements, events = [self._trie], [None], []
+        empty, names = [{}, None, {}], {} # Node of the elements out of the keys, and local names of the tags
+        open_keys = 0
+
+        def start(tag, attrib):
+            nonlocal open_keys
+            try:
+                name = names[tag]
+            except KeyError:
+                name = names[tag] = tag.rpartition("}")[-1]
+            node = nodes[-1][0].get(name, empty)
+            is_key = node[1] is not None
+            if open_keys or is_key or node[2]:
+                # Namespaced names as in xml.etree ('{uri}name')
+                element = _Element(tag, {("{"+k if "}" in k else k): v for k, v in attrib.items()} if attrib else attrib)
+                if open_keys:
+                    elements[-1].children.append(element)
+            else:
+                element = None
+            open_keys += is_key
+            nodes.append(node)
+            elements.append(element)
+
+        def end(tag):
+            nonlocal open_keys
+            node, n = nodes.pop(), elements.pop()
+            if node[1] is not None:
+                b = (bool(n.attrib), (n.text is not None or not str(
+                    n.text).isspace()), len(n) != 0)
+                if any(b):
+                    events.append((node[1], self._materializers[node[1]](n)))
+                open_keys -= 1
+            if node[2]:
+                for tag in n.attrib:
+                    if tag in node[2]:
+                        events.append((node[2][tag], n.attrib[tag]))
+
+        def data(text):
+            n = elements[-1]
+            if n is not None and not n.children: # Text after a child is its tail, not used
+                n.text = text if n.text is None else n.text + text
+
+        parser.StartElementHandler, parser.EndElementHandler, parser.CharacterDataHandler = start, end, data
+        while True:
+            chunk = self._file.read(self._chunk_size)
+            parser.Parse(chunk, not chunk)
+            yield from events
+            events.clear()
+            if not chunk:
+                break
+
 import ijson
+from ijson.common import ObjectBuilder
 
-class JSONStreamIterablt(BasicIterable):
+class JSONStreamIterable(BasicIterable):
+    # Items of the keys (ijson prefixes, as 'exchanges.item.amount') in a single pass over the file. Each item is
+    # yielded once it ends, so items inside other items come first, as with the XML iterators
 
     def __init__(self, file, keys: dict): # 'keys' here is the mapping dictionary
         self._file = file
-        self._keys = list(keys.keys())
+        self._keys = frozenset(keys)
         self.gen = self.gen_return()
 
     def __iter__(self):
         return self
-    
+
     def gen_return(self):
-        try:
-            for key in self._keys:
-                res = list(ijson.items(self._file, key))
-                yield (key, (res[0] if len(res) == 1 else res))
-                self._file.seek(0) # Returns the pointer to 0 for a new query
-        except StopIteration:
-            pass
+        builders = [] # (key, builder) of the open items, inner last
+        for prefix, event, value in ijson.parse(getattr(self._file, 'buffer', self._file)): # ijson parses bytes
+            for _, builder in builders:
+                builder.event(event, value)
+            if event in ('end_map', 'end_array'):
+                if builders and prefix == builders[-1][0]:
+                    key, builder = builders.pop()
+                    yield (key, builder.value)
+            elif prefix in self._keys:
+                if event in ('start_map', 'start_array'):
+                    builder = ObjectBuilder()
+                    builder.event(event, value)
+                    builders.append((prefix, builder))
+                elif event != 'map_key':
+                    yield (prefix, value)
 
     def __next__(self):
         return next(self.gen)
+
+JSONStreamIterablt = JSONStreamIterable # Former name
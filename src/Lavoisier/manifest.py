@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import uuid
+import shutil
+import socket
+import threading
+from pathlib import Path
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from .converter import Converter, get_converter
+
+@dataclass
+class ConversionManifest:
+    # Conversion job which can be split in shards between nodes sharing a filesystem
+    input_: tuple               # Input format and elementary flow mapping, as in get_converter
+    output: tuple               # Output format and elementary flow mapping, as in get_converter
+    path: str                   # Input file or directory (same path for all the nodes)
+    save_path: str              # Output directory (same path for all the nodes)
+    mode: str = 'to_file'
+    shards: int = 1             # Number of parts in which the inputs are split
+    inputs: list = None         # Standalone inputs of the path to convert, relative to it (all of them if None)
+    hash_: str = ''
+    elem_flow_mapping: str = None
+    options: dict = field(default_factory=dict) # Converter options ('quiet', 'convert_properties', ...) to set
+    lock_dir: str = None        # Directory of the lock files of the job (a folder of the save path if None)
+    lock_timeout: float = None  # Seconds after which the shard of a node that stopped can be claimed by other nodes
+
+    @classmethod
+    def from_file(cls, path):
+        # JSON file with the fields above, 'input' and 'hash' being used for 'input_' and 'hash_'
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+        for key, name in (('input', 'input_'), ('hash', 'hash_')):
+            if key in manifest:
+                manifest[name] = manifest.pop(key)
+        try:
+            return cls(**manifest)
+        except TypeError as e:
+            raise ValueError(f"Invalid manifest {path}: {e}") from None
+
+    def get_converter(self, save_path=None):
+        converter = get_converter(tuple(self.input_), tuple(self.output), self.path,
+                                  save_path or self.save_path, self.hash_)
+        if self.elem_flow_mapping is not None:
+            converter.elem_flow_mapping = self.elem_flow_mapping
+        for name, value in self.options.items():
+            if name.startswith('_') or not hasattr(converter, name):
+                raise AttributeError(f"Invalid converter option '{name}' in manifest")
+            setattr(converter, name, value)
+        return converter
+
+    def get_shards(self, converter):
+        # Same split for every node: sorted inputs in contiguous shards of about the same estimated cost
+        if self.inputs is None:
+            inputs = sorted(converter.input_manager.get_inputs())
+        else:
+            inputs = [Path(self.path, input_) for input_ in self.inputs]
+        costs = [converter.input_manager.estimate_cost(input_) for input_ in inputs]
+        return Converter._split_by_cost(inputs, costs, min(self.shards, len(inputs))) if inputs else []
+
+
+class ManifestRunner:
+    # Converts the shards of a manifest not claimed by other nodes. A shard is claimed by the exclusive creation of its
+    # lock file and marked as done (or failed) in the same directory, so that no node converts it again. In the
+    # 'to_database' mode, the node finishing the last shard merges the partial databases. The lock is touched while the
+    # shard is converted, and holds a token of the claim, so that a node whose lock was taken over does not mark it
+
+    def __init__(self, manifest, node=None):
+        self.manifest = manifest if isinstance(manifest, ConversionManifest) else ConversionManifest.from_file(manifest)
+        self.node = node or f"{socket.gethostname()}:{os.getpid()}"
+        self.lock_dir = Path(self.manifest.lock_dir or Path(self.manifest.save_path, '.lavoisier_locks'))
+        self._tokens = {} # Token of the claim of each lock
+
+    def _marker(self, name, state):
+        return Path(self.lock_dir, f"{name}.{state}")
+
+    def _is_stale(self, lock):
+        if self.manifest.lock_timeout is None:
+            return False
+        try:
+            return time.time() - lock.stat().st_mtime > self.manifest.lock_timeout
+        except FileNotFoundError: # Released in the meantime
+            return True
+
+    def _claim(self, name, retry=True):
+        lock = self._marker(name, 'lock')
+        try:
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if not (retry and self._is_stale(lock)):
+                return False
+            # Only one of the nodes finding the stale lock can move it
+            stale = self._marker(name, f"{uuid.uuid4().hex}.stale")
+            try:
+                os.rename(lock, stale)
+            except FileNotFoundError:
+                return False
+            stale.unlink()
+            return self._claim(name, retry=False)
+        self._tokens[name] = uuid.uuid4().hex
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'node': self.node, 'time': time.time(), 'token': self._tokens[name]}, f)
+        # The shard may have been finished between the verification of its markers and the claim
+        if self._marker(name, 'done').exists() or self._marker(name, 'failed').exists():
+            lock.unlink()
+            return False
+        return True
+
+    def _owns(self, name):
+        try:
+            with open(self._marker(name, 'lock'), 'r') as f:
+                return json.load(f).get('token') == self._tokens.get(name)
+        except (FileNotFoundError, ValueError): # Released, or being written by the node claiming it
+            return False
+
+    @contextmanager
+    def _heartbeat(self, name):
+        # Touches the lock while it is held, so that the other nodes don't find it stale
+        if self.manifest.lock_timeout is None:
+            yield
+            return
+        stop = threading.Event()
+        def beat():
+            while not stop.wait(self.manifest.lock_timeout / 3) and self._owns(name):
+                try:
+                    os.utime(self._marker(name, 'lock'))
+                except FileNotFoundError:
+                    return
+        thread = threading.Thread(target=beat, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def _release(self, name, state, content):
+        # Returns False if the lock was claimed by another node in the meantime, which then writes the marker.
+        # The marker is written complete before being visible to the other nodes
+        if not self._owns(name):
+            return False
+        temp = self._marker(name, f"{uuid.uuid4().hex}.tmp")
+        with open(temp, 'w') as f:
+            json.dump({'node': self.node, 'time': time.time()} | content, f)
+        os.replace(temp, self._marker(name, state))
+        self._marker(name, 'lock').unlink(missing_ok=True)
+        return True
+
+    def _get_shards(self, converter):
+        # The first node writes the shards of the job, so all nodes convert the same ones even if the inputs change
+        shards = Path(self.lock_dir, 'shards.json')
+        if not shards.exists():
+            temp = self._marker('shards', f"{uuid.uuid4().hex}.tmp")
+            with open(temp, 'w') as f:
+                json.dump([[str(input_) for input_ in inputs] for inputs in self.manifest.get_shards(converter)], f)
+            try:
+                os.link(temp, shards) # Fails if another node wrote them first
+            except FileExistsError:
+                pass
+            finally:
+                temp.unlink()
+        with open(shards, 'r') as f:
+            return [[Path(input_) for input_ in inputs] for inputs in json.load(f)]
+
+    def _outputs(self, name):
+        with open(self._marker(name, 'done'), 'r') as f:
+            return json.load(f)['outputs']
+
+    def _convert_shard(self, name, inputs):
+        if self.manifest.mode == 'to_database':
+            # Partial database, restarted from the beginning if a node stopped while converting it
+            save_path = Path(self.lock_dir, name)
+            shutil.rmtree(save_path, ignore_errors=True)
+            save_path.mkdir()
+            converter = self.manifest.get_converter(save_path)
+        else:
+            converter = self.manifest.get_converter()
+            converter.journal = self._marker(name, 'jsonl') # Resumed if a node stopped while converting it
+        converter.input_manager.select_inputs(inputs)
+        return converter.convert(self.manifest.mode)
+
+    def _merge(self, names):
+        if not all(self._marker(name, 'done').exists() for name in names) or not self._claim('merge'):
+            return None
+        try:
+            with self._heartbeat('merge'):
+                output = self.manifest.get_converter().merge([p for name in names for p in self._outputs(name)])
+        except Exception as e:
+            self._release('merge', 'failed', {'error': repr(e)})
+            raise e
+        if not self._release('merge', 'done', {'outputs': [output]}):
+            return None
+        for name in names:
+            shutil.rmtree(Path(self.lock_dir, name), ignore_errors=True)
+        return output
+
+    def run(self):
+        # Returns the outputs of the shards converted by this node (and of the merge, if done by it)
+        converter = self.manifest.get_converter()
+        if self.manifest.mode not in ('to_file', 'to_database'):
+            raise ValueError(f"Invalid conversion mode '{self.manifest.mode}' in manifest")
+        if self.manifest.mode == 'to_database' and getattr(converter.output_manager, 'merge', None) is None:
+            raise ValueError(f"Manifest in the 'to_database' mode is not available for {self.manifest.output[0]} outputs")
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        shards = self._get_shards(converter)
+
+        names, outputs, errors = [f"shard_{i}" for i in range(len(shards))], {}, []
+        for name, inputs in zip(names, shards):
+            if self._marker(name, 'done').exists() or self._marker(name, 'failed').exists() or not self._claim(name):
+                continue
+            try:
+                with self._heartbeat(name):
+                    output = self._convert_shard(name, inputs)
+            except Exception as e: # The other shards are still converted, the failed ones need a new run
+                if self._release(name, 'failed', {'error': repr(e)}):
+                    errors.append((name, e))
+                continue
+            if self._release(name, 'done', {'outputs': output}):
+                outputs[name] = output
+
+        if errors:
+            raise RuntimeError(f"Shards {', '.join(name for name, _ in errors)} failed, see their '.failed' markers in {self.lock_dir}. "+\
+                               "Remove the markers to convert them again") from errors[0][1]
+        if self.manifest.mode == 'to_database' and names:
+            merged = self._merge(names)
+            if merged is not None:
+                outputs['merge'] = [merged]
+        return outputs
+
+
+def run_manifest(path, node=None):
+    return ManifestRunner(path, node).run()
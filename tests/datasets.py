@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Inputs and helpers shared by the conversion tests
+
+import re
+import zipfile
+import contextvars
+from pathlib import Path
+
+from src.Lavoisier.converter import get_converter
+
+DATASET = """<?xml version="1.0" encoding="UTF-8"?>
+<ecoSpold xmlns="http://www.EcoInvent.org/EcoSpold02">
+  <activityDataset>
+    <activityDescription>
+      <activity id="0a1b2c3d-0000-4000-8000-000000000001" activityNameId="0a1b2c3d-0000-4000-8000-000000000002" type="1" specialActivityType="0" inheritanceDepth="0">
+        <activityName xml:lang="en">test activity</activityName>
+        <generalComment><text xml:lang="en" index="1">A comment</text></generalComment>
+      </activity>
+      <classification classificationId="0a1b2c3d-0000-4000-8000-000000000003">
+        <classificationSystem xml:lang="en">ISIC rev.4 ecoinvent</classificationSystem>
+        <classificationValue xml:lang="en">0111:Growing of cereals</classificationValue>
+      </classification>
+      <geography geographyId="0a1b2c3d-0000-4000-8000-000000000004">
+        <shortname xml:lang="en">BR</shortname>
+      </geography>
+      <technology technologyLevel="3"/>
+      <timePeriod startDate="2010-01-01" endDate="2020-12-31" isDataValidForEntirePeriod="true"/>
+    </activityDescription>
+    <flowData>
+      <intermediateExchange id="0a1b2c3d-0000-4000-8000-000000000005" unitId="0a1b2c3d-0000-4000-8000-000000000006" amount="1" intermediateExchangeId="0a1b2c3d-0000-4000-8000-000000000007">
+        <name xml:lang="en">product</name>
+        <unitName xml:lang="en">kg</unitName>
+        <outputGroup>0</outputGroup>
+      </intermediateExchange>
+      <intermediateExchange id="0a1b2c3d-0000-4000-8000-000000000008" unitId="0a1b2c3d-0000-4000-8000-000000000006" amount="2.5" intermediateExchangeId="0a1b2c3d-0000-4000-8000-000000000009">
+        <name xml:lang="en">input &amp; stuff</name>
+        <unitName xml:lang="en">MJ</unitName>
+        <inputGroup>5</inputGroup>
+      </intermediateExchange>
+      <elementaryExchange id="0a1b2c3d-0000-4000-8000-00000000000a" unitId="0a1b2c3d-0000-4000-8000-000000000006" amount="0.1" elementaryExchangeId="0a1b2c3d-0000-4000-8000-00000000000b">
+        <name xml:lang="en">Carbon dioxide</name>
+        <unitName xml:lang="en">kg</unitName>
+        <compartment subcompartmentId="0a1b2c3d-0000-4000-8000-00000000000c"><compartment xml:lang="en">air</compartment><subcompartment xml:lang="en">unspecified</subcompartment></compartment>
+        <outputGroup>4</outputGroup>
+      </elementaryExchange>
+    </flowData>
+    <modellingAndValidation>
+      <representativeness systemModelId="06590a66-662a-4885-8494-ad0cf410f956">
+        <systemModelName xml:lang="en">Allocation, cut-off by classification</systemModelName>
+      </representativeness>
+      <review reviewerId="0a1b2c3d-0000-4000-8000-00000000000e" reviewerName="Reviewer" reviewerEmail="r@x.org" reviewDate="2020-01-01" reviewedMajorRelease="3" reviewedMinorRelease="1" reviewedMajorRevision="0" reviewedMinorRevision="0">
+        <details><text xml:lang="en" index="1">Fine</text></details>
+      </review>
+    </modellingAndValidation>
+    <administrativeInformation>
+      <dataEntryBy personId="0a1b2c3d-0000-4000-8000-00000000000d" personName="Someone" personEmail="a@b.c"/>
+      <dataGeneratorAndPublication personId="0a1b2c3d-0000-4000-8000-00000000000d" personName="Someone" personEmail="a@b.c" dataPublishedIn="0" isCopyrightProtected="true" accessRestrictedTo="0"/>
+      <fileAttributes majorRelease="3" minorRelease="0" majorRevision="1" minorRevision="0" internalSchemaVersion="2.0.10" defaultLanguage="en" creationTimestamp="2020-01-01T00:00:00" lastEditTimestamp="2020-01-01T00:00:00" fileGenerator="x" fileTimestamp="2020-01-01T00:00:00" contextId="de659012-50c4-4e96-b54a-fc781bf987ab">
+        <contextName xml:lang="en">ecoinvent</contextName>
+      </fileAttributes>
+    </administrativeInformation>
+  </activityDataset>
+</ecoSpold>"""
+
+def make_inputs(path, n, broken=()):
+    # EcoSpold2 files of n different activities. The ones in 'broken' are not valid XML, and are the largest, so
+    # that they are converted first by the workers
+    path.mkdir(exist_ok=True)
+    files = []
+    for i in range(n):
+        text = DATASET.replace('test activity', f'activity {i}').replace('0a1b2c3d-0000-4000-8000-000000000001', f'0a1b2c3d-0000-4000-8000-{i + 1000:012d}')
+        if i in broken:
+            text += '<broken>' * 1000
+        files.append(path / f'{i:02d}.spold')
+        files[-1].write_text(text)
+    return files
+
+def get_test_converter(path, save_path, input_=("EcoSpold2", "ecoinvent3.7"), output=("ILCD1", "EF3.0")):
+    save_path.mkdir(exist_ok=True)
+    mapping = Path(save_path.parent, 'mapping.json')
+    mapping.write_text('{}')
+    converter = get_converter(input_, output, path, save_path)
+    converter.elem_flow_mapping = mapping
+    return converter
+
+def convert(converter, type_='to_file', **kwargs):
+    # The options of the conversion (e.g. the string limits) are not kept for the other tests
+    return contextvars.copy_context().run(converter.convert, type_, **kwargs)
+
+def normalize(data):
+    # Without the timestamps of the conversion
+    return re.sub(rb'\d{4}-\d\d-\d\dT[\d:.+-]+|\d\d/\d\d/\d{4} \d\d:\d\d:\d\d[,.\d]*', b'', data)
+
+def read(path):
+    # Contents of an output, by member for the packages
+    if Path(path).suffix == '.zip':
+        with zipfile.ZipFile(path) as z:
+            return {x: normalize(z.read(x)) for x in z.namelist()}
+    return normalize(Path(path).read_bytes())
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import asyncio
+import zipfile
+import contextvars
+from pathlib import Path
+
+from .datasets import make_inputs, get_test_converter, convert, read
+
+def _run(coroutine):
+    return contextvars.copy_context().run(asyncio.run, coroutine)
+
+def test_same_as_serial(tmp_path):
+    make_inputs(tmp_path / 'in', 5)
+    serial = convert(get_test_converter(tmp_path / 'in', tmp_path / 'serial'))
+    concurrent = _run(get_test_converter(tmp_path / 'in', tmp_path / 'concurrent').convert_async('to_file', 2))
+    assert [Path(x).name for x in concurrent] == [Path(x).name for x in serial] # In the order of the inputs
+    assert all(read(a) == read(b) for a, b in zip(serial, concurrent))
+
+def test_backpressure(tmp_path):
+    # The conversions wait while the results are not taken
+    make_inputs(tmp_path / 'in', 10)
+    converter = get_test_converter(tmp_path / 'in', tmp_path / 'out')
+    async def iterate():
+        counts = []
+        async for _ in converter.iter_convert_async('to_file', 2):
+            if not counts:
+                await asyncio.sleep(1)
+            counts.append(len(list((tmp_path / 'out').glob('*.zip'))))
+        return counts
+    counts = _run(iterate())
+    assert counts[0] <= 5 and counts[-1] == len(counts) == 10 # Taken, waiting in the queue and waiting to be put
+
+def test_cancel(tmp_path):
+    make_inputs(tmp_path / 'in', 10)
+    converter = get_test_converter(tmp_path / 'in', tmp_path / 'out')
+    async def cancel():
+        first = asyncio.Event()
+        async def consume():
+            async for _ in converter.iter_convert_async('to_file', 2):
+                first.set()
+        task = asyncio.ensure_future(consume())
+        await first.wait()
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return task.cancelled()
+    assert _run(cancel())
+    outputs = list((tmp_path / 'out').iterdir())
+    assert 0 < len(outputs) < 10
+    assert all(zipfile.is_zipfile(x) and x.suffix == '.zip' for x in outputs) # Without partial packages
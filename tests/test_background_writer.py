@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import threading
+
+from src.Lavoisier.formats.utils import BackgroundWriter
+from src.Lavoisier.data_structures import ignore_limits
+from src.Lavoisier.data_structures.validators.general_validators import return_limited_string
+
+def test_writer_order_and_errors():
+    writer, done = BackgroundWriter(), []
+    def fail():
+        raise ValueError('write')
+    writer.submit(done.append, 1)
+    writer.submit(lambda: done.append(threading.current_thread() is not threading.main_thread()))
+    writer.submit(fail)
+    with pytest.raises(ValueError):
+        writer.submit(done.append, 2) # Raised to the caller on the next write
+    writer.close()
+    assert done == [1, True]
+
+def test_writer_context():
+    s = return_limited_string(3)()
+    s.add('long')
+    writer, ended = BackgroundWriter(), []
+    ignore_limits(True)
+    try:
+        writer.submit(lambda: ended.append(s.end()))
+        writer.close()
+    finally:
+        ignore_limits(False)
+    assert ended == ['long']
+    writer.submit(s.end)
+    with pytest.raises(ValueError):
+        writer.close()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import csv
+import sqlite3
+import zipfile
+
+from src.Lavoisier.catalog import CatalogScanner, CatalogEntry, scan_catalog
+
+SPOLD = '''<?xml version="1.0" encoding="UTF-8"?>
+<ecoSpold xmlns="http://www.EcoInvent.org/EcoSpold02"><activityDataset>
+<activityDescription><activity id="{0}"><activityName xml:lang="en">activity {0}</activityName></activity>
+<geography><shortname xml:lang="en">BR</shortname></geography><timePeriod startDate="2010-01-01" endDate="2020-12-31"/></activityDescription>
+<flowData><intermediateExchange id="a"><name>p</name></intermediateExchange><elementaryExchange id="b"/><elementaryExchange id="c"/></flowData>
+<administrativeInformation><fileAttributes majorRelease="3" minorRelease="1"><requiredContext/></fileAttributes></administrativeInformation>
+</activityDataset></ecoSpold>'''
+
+PROCESS = '''<?xml version="1.0" encoding="UTF-8"?>
+<processDataSet xmlns="http://lca.jrc.it/ILCD/Process" xmlns:common="http://lca.jrc.it/ILCD/Common" version="1.1">
+<processInformation><dataSetInformation><common:UUID>{0}</common:UUID><name><baseName xml:lang="en">process {0}</baseName></name></dataSetInformation>
+<time><common:referenceYear>2010</common:referenceYear></time><geography><locationOfOperationSupplyOrProduction location="GLO"/></geography></processInformation>
+<administrativeInformation><publicationAndOwnership><common:dataSetVersion>01.00.000</common:dataSetVersion></publicationAndOwnership></administrativeInformation>
+<exchanges><exchange dataSetInternalID="0"/><exchange dataSetInternalID="1"/></exchanges>
+</processDataSet>'''
+
+def test_ecs2(tmp_path):
+    for i in range(3):
+        (tmp_path / f'{i}.spold').write_text(SPOLD.format(i))
+    entries = CatalogScanner('EcoSpold2', tmp_path).scan()
+    assert entries[0] == CatalogEntry(str(tmp_path / '0.spold'), '', '0', 'activity 0', '3.1', 'BR', '2010-01-01', '2020-12-31',
+                                      3, (tmp_path / '0.spold').stat().st_size)
+    assert [e.uuid for e in entries] == ['0', '1', '2']
+    scan_catalog('EcoSpold2', tmp_path, tmp_path / 'catalog.csv', count_exchanges=False)
+    with open(tmp_path / 'catalog.csv', newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 3 and rows[2]['name'] == 'activity 2' and rows[2]['exchanges'] == ''
+
+def test_ilcd(tmp_path, monkeypatch):
+    monkeypatch.setattr(CatalogScanner, 'chunk_size', 2)
+    with zipfile.ZipFile(tmp_path / 'a.zip', 'w') as z:
+        for i in range(5):
+            z.writestr(f'ILCD/processes/{i}.xml', PROCESS.format(i))
+        z.writestr('ILCD/flows/0.xml', '<flowDataSet/>')
+    scanner = CatalogScanner('ILCD1', tmp_path)
+    assert len(list(scanner._get_tasks())) == 3
+    entries = scanner.scan()
+    assert [(e.file, e.uuid, e.name, e.version, e.geography, e.start, e.end, e.exchanges) for e in entries][0] == \
+        ('ILCD/processes/0.xml', '0', 'process 0', '01.00.000', 'GLO', '2010', None, 2)
+    assert len(entries) == 5
+    scanner.write(tmp_path / 'catalog.db')
+    with sqlite3.connect(tmp_path / 'catalog.db') as db:
+        assert db.execute("SELECT COUNT(*), SUM(exchanges) FROM catalog").fetchone() == (5, 10)
+    db.close()
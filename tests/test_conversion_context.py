@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import threading
+
+from src.Lavoisier.conversions.utils import ConversionContext, state_holder
+from src.Lavoisier.conversions import (
+    ECS2ToILCD1FlowConversion,
+    ECS2ToILCD1IntermediateFlowConversion,
+    ECS2ToILCD1ReferenceConversion
+    )
+from src.Lavoisier.formats import ILCD1Helper
+
+def test_isolated_state():
+    c1, c2 = ConversionContext(), ConversionContext()
+    f1, f2 = c1(ECS2ToILCD1FlowConversion), c2(ECS2ToILCD1FlowConversion)
+    f1._all_flows.append(1)
+    f1._flow_internal_id_counter = 10
+    assert f2._all_flows == [] and ECS2ToILCD1FlowConversion._all_flows == []
+    assert f2._flow_internal_id_counter == 1
+
+    r1, r2 = c1(ECS2ToILCD1ReferenceConversion), c2(ECS2ToILCD1ReferenceConversion)
+    r1.all_data['source'].append('id')
+    assert r2.all_data['source'] == [] and ECS2ToILCD1ReferenceConversion.all_data['source'] == []
+    assert r1.SourceDataSet is not ECS2ToILCD1ReferenceConversion.SourceDataSet
+    assert issubclass(r1.SourceDataSet, r1.AdditionalDataset)
+
+def test_isolated_hierarchy():
+    c = ConversionContext()
+    f, i = c(ECS2ToILCD1FlowConversion), c(ECS2ToILCD1IntermediateFlowConversion)
+    assert issubclass(i, f) and issubclass(i, ECS2ToILCD1IntermediateFlowConversion)
+    assert i.Property is f.Property
+    f.convert_properties = True
+    assert i.convert_properties is True
+    assert state_holder(i.__new__(i), ECS2ToILCD1FlowConversion) is f
+    assert state_holder(ECS2ToILCD1IntermediateFlowConversion.__new__(ECS2ToILCD1IntermediateFlowConversion),
+                        ECS2ToILCD1FlowConversion) is ECS2ToILCD1FlowConversion
+
+def test_thread_local_helper():
+    ILCD1Helper.number = 1000
+    def add():
+        ILCD1Helper.number = 5000
+        r.append(ILCD1Helper.add())
+    r = []
+    t = threading.Thread(target=add)
+    t.start()
+    t.join()
+    assert r == [5001]
+    assert ILCD1Helper.add() == 1001
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import zipfile
+from pathlib import Path
+
+from src.Lavoisier.converter import ConversionJournal
+from .datasets import make_inputs, get_test_converter, convert
+
+@pytest.fixture
+def inputs(tmp_path):
+    paths = []
+    for name in ('a', 'b', 'c'):
+        p = tmp_path / (name + '.spold')
+        p.write_text(name)
+        paths.append(p)
+    return paths
+
+def test_journal_resume(tmp_path, inputs):
+    outputs = [tmp_path / (p.stem + '.zip') for p in inputs]
+    journal = ConversionJournal(tmp_path / 'journal.jsonl')
+    for i, o in zip(inputs[:2], outputs):
+        o.write_text('')
+        journal.add_output(i, str(o))
+    journal.complete(inputs[0]) # 'b' is converted in part
+    with open(journal.path, 'a') as f:
+        f.write('{"input": ') # Line cut by an interruption
+
+    pending, done = ConversionJournal(journal.path).pending(inputs)
+    assert pending == inputs[1:]
+    assert done == [str(outputs[0])]
+    assert outputs[0].exists() and not outputs[1].exists()
+    journal.complete(inputs[1])
+    assert ConversionJournal(journal.path).pending(inputs)[0] == inputs[2:]
+
+def test_journal_changed_input(tmp_path, inputs):
+    journal = ConversionJournal(tmp_path / 'journal.jsonl')
+    journal.add_output(inputs[0], str(tmp_path / 'a.zip'))
+    journal.complete(inputs[0])
+    inputs[0].write_text('changed')
+    assert ConversionJournal(journal.path).pending(inputs[:1]) == (inputs[:1], [])
+
+def test_resume_conversion(tmp_path):
+    # The conversion of the second package stops at its broken last process. The conversion started again skips the
+    # first package and converts the second one again, removing the outputs written for it before the error
+    for name, n in (('a', 2), ('b', 3)):
+        make_inputs(tmp_path / name, n)
+        convert(get_test_converter(tmp_path / name, tmp_path / 'ilcd'), 'to_database')
+    converter = get_test_converter(tmp_path / 'ilcd', tmp_path / 'out', ("ILCD1", "EF3.0"), ("EcoSpold2", "ecoinvent3.7"))
+    converter.journal = tmp_path / 'journal.jsonl'
+    packages = list(converter.input_manager.get_inputs())
+    with zipfile.ZipFile(packages[1]) as z:
+        members = {x: z.read(x) for x in z.namelist()}
+    broken = [x for x in members if x.startswith('processes/')][-1]
+    with zipfile.ZipFile(packages[1], 'w') as z:
+        for member, data in members.items():
+            z.writestr(member, data[:100] if member == broken else data)
+    with pytest.raises(Exception):
+        convert(converter)
+    first = {x: x.stat().st_mtime_ns for x in (tmp_path / 'out').glob('*.spold')}
+    records = ConversionJournal(converter.journal)._read()
+    done, orphans = ([Path(x) for x in records[str(p)]['outputs']] for p in packages)
+    assert records[str(packages[0])]['completed'] and not records[str(packages[1])]['completed']
+    assert len(done) == 2 and orphans and set(done) | set(orphans) == set(first)
+
+    with zipfile.ZipFile(packages[1], 'w') as z:
+        for member, data in members.items():
+            z.writestr(member, data)
+    filenames = [Path(x) for x in convert(converter)]
+    assert filenames[:2] == done and all(first[x] == x.stat().st_mtime_ns for x in done) # Not converted again
+    assert sorted(filenames) == sorted((tmp_path / 'out').glob('*.spold')) # The orphaned outputs were removed
+    assert set(orphans) <= set(filenames[2:]) and all(first[x] != x.stat().st_mtime_ns for x in orphans)
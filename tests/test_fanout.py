@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import re
+import pytest
+import contextvars
+
+from src.Lavoisier.converter import get_converter
+from src.Lavoisier.fanout import get_fanout_converter
+from src.Lavoisier.fanout import FanOutConverter
+from src.Lavoisier.formats.utils import merge_keys, reads
+
+def test_merge_keys():
+    a, b, c = reads('@id')(lambda x: x), reads('@id')(lambda x: x), reads('#text')(lambda x: x)
+    merged = merge_keys({'/a': a, '/b': a, '/c': None}, {'/a': b, '/b': c, '/d': c})
+    assert merged['/a'].fields == {'@id'} and merged['/b'] is None and merged['/c'] is None and merged['/d'] is c
+
+def test_shared_input(tmp_path):
+    (tmp_path / 'a').mkdir(), (tmp_path / 'b').mkdir()
+    converters = [get_converter(("EcoSpold2", "ecoinvent3.7"), ("ILCD1", "EF3.0"), tmp_path, tmp_path / name)
+                  for name in ('a', 'b')]
+    fanout = FanOutConverter(converters)
+    assert all(c.input_manager is fanout.input_manager for c in converters)
+    with pytest.raises(ValueError):
+        FanOutConverter(converters + [get_converter(("ILCD1", "EF3.0"), ("EcoSpold2", "ecoinvent3.7"), tmp_path, tmp_path)])
+    assert fanout.convert('to_file') == [[], []] # No inputs
+
+DATASET = """<?xml version="1.0" encoding="UTF-8"?>
+<ecoSpold xmlns="http://www.EcoInvent.org/EcoSpold02">
+  <activityDataset>
+    <activityDescription>
+      <activity id="0a1b2c3d-0000-4000-8000-000000000001" activityNameId="0a1b2c3d-0000-4000-8000-000000000002" type="1" specialActivityType="0" inheritanceDepth="0">
+        <activityName xml:lang="en">test activity</activityName>
+        <generalComment><text xml:lang="en" index="1">A comment</text></generalComment>
+      </activity>
+      <classification classificationId="0a1b2c3d-0000-4000-8000-000000000003">
+        <classificationSystem xml:lang="en">ISIC rev.4 ecoinvent</classificationSystem>
+        <classificationValue xml:lang="en">0111:Growing of cereals</classificationValue>
+      </classification>
+      <geography geographyId="0a1b2c3d-0000-4000-8000-000000000004">
+        <shortname xml:lang="en">BR</shortname>
+      </geography>
+      <technology technologyLevel="3"/>
+      <timePeriod startDate="2010-01-01" endDate="2020-12-31" isDataValidForEntirePeriod="true"/>
+    </activityDescription>
+    <flowData>
+      <intermediateExchange id="0a1b2c3d-0000-4000-8000-000000000005" unitId="0a1b2c3d-0000-4000-8000-000000000006" amount="1" intermediateExchangeId="0a1b2c3d-0000-4000-8000-000000000007">
+        <name xml:lang="en">product</name>
+        <unitName xml:lang="en">kg</unitName>
+        <outputGroup>0</outputGroup>
+      </intermediateExchange>
+      <intermediateExchange id="0a1b2c3d-0000-4000-8000-000000000008" unitId="0a1b2c3d-0000-4000-8000-000000000006" amount="2.5" intermediateExchangeId="0a1b2c3d-0000-4000-8000-000000000009">
+        <name xml:lang="en">input &amp; stuff</name>
+        <unitName xml:lang="en">MJ</unitName>
+        <inputGroup>5</inputGroup>
+      </intermediateExchange>
+      <elementaryExchange id="0a1b2c3d-0000-4000-8000-00000000000a" unitId="0a1b2c3d-0000-4000-8000-000000000006" amount="0.1" elementaryExchangeId="0a1b2c3d-0000-4000-8000-00000000000b">
+        <name xml:lang="en">Carbon dioxide</name>
+        <unitName xml:lang="en">kg</unitName>
+        <compartment subcompartmentId="0a1b2c3d-0000-4000-8000-00000000000c"><compartment xml:lang="en">air</compartment><subcompartment xml:lang="en">unspecified</subcompartment></compartment>
+        <outputGroup>4</outputGroup>
+      </elementaryExchange>
+    </flowData>
+    <modellingAndValidation>
+      <representativeness systemModelId="06590a66-662a-4885-8494-ad0cf410f956">
+        <systemModelName xml:lang="en">Allocation, cut-off by classification</systemModelName>
+      </representativeness>
+      <review reviewerId="0a1b2c3d-0000-4000-8000-00000000000e" reviewerName="Reviewer" reviewerEmail="r@x.org" reviewDate="2020-01-01" reviewedMajorRelease="3" reviewedMinorRelease="1" reviewedMajorRevision="0" reviewedMinorRevision="0">
+        <details><text xml:lang="en" index="1">Fine</text></details>
+      </review>
+    </modellingAndValidation>
+    <administrativeInformation>
+      <dataEntryBy personId="0a1b2c3d-0000-4000-8000-00000000000d" personName="Someone" personEmail="a@b.c"/>
+      <dataGeneratorAndPublication personId="0a1b2c3d-0000-4000-8000-00000000000d" personName="Someone" personEmail="a@b.c" dataPublishedIn="0" isCopyrightProtected="true" accessRestrictedTo="0"/>
+      <fileAttributes majorRelease="3" minorRelease="0" majorRevision="1" minorRevision="0" internalSchemaVersion="2.0.10" defaultLanguage="en" creationTimestamp="2020-01-01T00:00:00" lastEditTimestamp="2020-01-01T00:00:00" fileGenerator="x" fileTimestamp="2020-01-01T00:00:00" contextId="de659012-50c4-4e96-b54a-fc781bf987ab">
+        <contextName xml:lang="en">ecoinvent</contextName>
+      </fileAttributes>
+    </administrativeInformation>
+  </activityDataset>
+</ecoSpold>"""
+
+def _read(path):
+    with open(path) as f: # Without the timestamps of the conversion
+        return re.sub(r'\d{4}-\d\d-\d\dT[\d:.+-]+', '', f.read())
+
+def _convert(converter, type_='to_file'):
+    # The options of the conversion (e.g. the string limits) are not kept for the other tests
+    return contextvars.copy_context().run(converter.convert, type_)
+
+def test_same_as_single(tmp_path):
+    # The items changed by the mapping of a converter (e.g. the review comments) are not seen by the others
+    for name in ('ecs2', 'ilcd', 'a', 'b', 'single'):
+        (tmp_path / name).mkdir()
+    (tmp_path / 'ecs2' / 'a.spold').write_text(DATASET)
+    (tmp_path / 'mapping.json').write_text('{}')
+    converter = get_converter(("EcoSpold2", "ecoinvent3.7"), ("ILCD1", "EF3.0"), tmp_path / 'ecs2', tmp_path / 'ilcd')
+    converter.elem_flow_mapping = tmp_path / 'mapping.json'
+    _convert(converter)
+    fanout = get_fanout_converter(("ILCD1", "EF3.0"), [(("EcoSpold2", "ecoinvent3.7"), tmp_path / name) for name in ('a', 'b')], tmp_path / 'ilcd')
+    converter = get_converter(("ILCD1", "EF3.0"), ("EcoSpold2", "ecoinvent3.7"), tmp_path / 'ilcd', tmp_path / 'single')
+    for c in fanout.converters + [converter]:
+        c.elem_flow_mapping = tmp_path / 'mapping.json'
+    outputs = _convert(fanout) + [_convert(converter)]
+    assert 'reviewDate="2020-01-01"' in _read(outputs[2][0])
+    assert _read(outputs[0][0]) == _read(outputs[1][0]) == _read(outputs[2][0])
+
+def test_shared_items(tmp_path):
+    # Only the items of the keys are given, each one copied when read
+    converter = get_converter(("EcoSpold2", "ecoinvent3.7"), ("ILCD1", "EF3.0"), tmp_path, tmp_path)
+    converter._shared_items = [('/a', {'#text': 'a'}), ('/b', {'#text': 'b'})]
+    items = list(converter._read(None, {'/a': None}))
+    assert items == [('/a', {'#text': 'a'})] and items[0][1] is not converter._shared_items[0][1]
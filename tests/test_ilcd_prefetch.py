@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import zipfile
+import tempfile
+from pathlib import Path
+
+from .datasets import make_inputs, get_test_converter, convert
+
+def _make_packages(tmp_path, n):
+    make_inputs(tmp_path / 'ecs2', n)
+    convert(get_test_converter(tmp_path / 'ecs2', tmp_path / 'ilcd'))
+    converter = get_test_converter(tmp_path / 'ilcd', tmp_path / 'out', ("ILCD1", "EF3.0"), ("EcoSpold2", "ecoinvent3.7"))
+    converter.input_manager._prefetch = 2
+    return converter
+
+def test_order(tmp_path):
+    converter = _make_packages(tmp_path, 5)
+    inputs = list(converter.input_manager.get_inputs())
+    current = [converter.input_manager.current_input for _ in converter.input_manager.get_files()]
+    assert current == inputs
+    assert [Path(x).stem for x in convert(converter)] == [Path(x).stem for x in inputs]
+
+def test_error(tmp_path, monkeypatch):
+    # The packages extracted in advance are removed after the error of the middle one
+    converter = _make_packages(tmp_path, 5)
+    inputs = list(converter.input_manager.get_inputs())
+    with zipfile.ZipFile(inputs[2], 'w') as f:
+        f.writestr('other/a.xml', '<a/>') # Without processes
+    created = []
+    class TemporaryDirectory(tempfile.TemporaryDirectory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            created.append(Path(self.name))
+    monkeypatch.setattr(tempfile, 'TemporaryDirectory', TemporaryDirectory)
+    with pytest.raises(Exception, match='process'):
+        convert(converter)
+    assert len(created) == 4 and not any(x.exists() for x in created) # Two converted and two prefetched
+    assert len(list((tmp_path / 'out').glob('*.spold'))) == 2
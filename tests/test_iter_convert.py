@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import zipfile
+import contextvars
+from pathlib import Path
+
+from .datasets import make_inputs, get_test_converter, convert, read
+
+def test_results(tmp_path):
+    make_inputs(tmp_path / 'in', 3)
+    converter = get_test_converter(tmp_path / 'in', tmp_path / 'out')
+    files = [file for file, _ in converter.input_manager.get_files()]
+    results = contextvars.copy_context().run(list, converter.iter_convert('to_file'))
+    assert [r.input_path for r in results] == files # In the order of the inputs
+    assert [r.output_path for r in results] == converter._filenames and len(set(converter._filenames)) == 3
+    assert all(Path(r.output_path).is_file() and r.elapsed > 0 for r in results)
+    assert all(isinstance(v, int) and v >= 0 for r in results for v in r.not_converted.values())
+    serial = convert(get_test_converter(tmp_path / 'in', tmp_path / 'serial'))
+    assert [read(r.output_path) for r in results] == [read(x) for x in serial]
+
+    converter = get_test_converter(tmp_path / 'in', tmp_path / 'database')
+    results = contextvars.copy_context().run(list, converter.iter_convert('to_database'))
+    assert [(r.output_path, r.not_converted) for r in results[:-1]] == [(None, {}), (None, {})] # Written at the end
+    assert results[-1].output_path == converter._filenames[0] and Path(results[-1].output_path).is_file()
+
+def test_close(tmp_path):
+    # The iteration stopped after the first result ends the outputs already being written (without a partial package)
+    # and the converter can convert again
+    make_inputs(tmp_path / 'in', 3)
+    converter = get_test_converter(tmp_path / 'in', tmp_path / 'out')
+    results, context = converter.iter_convert('to_file'), contextvars.copy_context()
+    first = context.run(next, results).output_path
+    context.run(results.close)
+    outputs = list((tmp_path / 'out').iterdir())
+    assert Path(first) in outputs and len(outputs) < 3
+    assert all(zipfile.is_zipfile(x) and x.suffix == '.zip' for x in outputs)
+    assert not hasattr(converter, '_data') and not hasattr(converter, '_field_mapping')
+    filenames = convert(converter)
+    assert len(filenames) == 3 and read(filenames[0]) == read(first)
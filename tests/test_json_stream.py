@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import json
+import ijson
+import pytest
+
+from src.Lavoisier.formats.utils import JSONStreamIterable
+
+DOC = json.dumps({
+    'name': 'process',
+    'exchanges': [{'amount': i, 'flow': {'name': f'flow {i}', 'tags': ['a', 'b']}, 'input': i % 2 == 0}
+                  for i in range(20)],
+    'parameters': [],
+    'location': {'code': 'BR', 'position': [[1.5, 2], [3, None]]}
+    }).encode()
+
+@pytest.mark.parametrize('keys', [
+    ('name', 'exchanges.item', 'location'),
+    ('exchanges.item.flow', 'exchanges.item.flow.tags.item', 'exchanges.item.amount', 'location.position.item'),
+    ('', 'parameters', 'missing')
+    ])
+def test_single_pass(keys):
+    items = list(JSONStreamIterable(io.TextIOWrapper(io.BytesIO(DOC), encoding='utf-8'), dict.fromkeys(keys)))
+    for key in keys: # Same items as a scan of each key
+        assert [t for k, t in items if k == key] == list(ijson.items(io.BytesIO(DOC), key))
+
+def test_order():
+    items = JSONStreamIterable(io.BytesIO(DOC), dict.fromkeys(('exchanges.item', 'exchanges.item.flow.name')))
+    assert [k for k, _ in items][:3] == ['exchanges.item.flow.name', 'exchanges.item', 'exchanges.item.flow.name']
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import json
+import time
+import pytest
+
+from src.Lavoisier.manifest import ConversionManifest, ManifestRunner
+
+@pytest.fixture
+def manifest(tmp_path):
+    path = tmp_path / 'job.json'
+    path.write_text(json.dumps({'input': ['EcoSpold2', 'ecoinvent3.7'], 'output': ['ILCD1', 'EF3.0'],
+                                'path': str(tmp_path), 'save_path': str(tmp_path), 'shards': 2,
+                                'lock_dir': str(tmp_path / 'locks'), 'lock_timeout': 60}))
+    return ConversionManifest.from_file(path)
+
+def test_manifest_fields(tmp_path, manifest):
+    assert manifest.input_ == ['EcoSpold2', 'ecoinvent3.7'] and manifest.hash_ == '' and manifest.options == {}
+    path = tmp_path / 'invalid.json'
+    path.write_text(json.dumps({'input': ['EcoSpold2', 'ecoinvent3.7'], 'workers': 2}))
+    with pytest.raises(ValueError):
+        ConversionManifest.from_file(path)
+
+def test_shard_claim(manifest):
+    r1, r2 = ManifestRunner(manifest, 'n1'), ManifestRunner(manifest, 'n2')
+    r1.lock_dir.mkdir()
+    assert r1._claim('shard_0')
+    assert not r2._claim('shard_0')
+    r1._release('shard_0', 'done', {'outputs': ['a.zip']})
+    assert not r2._claim('shard_0') and r2._outputs('shard_0') == ['a.zip']
+    assert sorted(os.listdir(r1.lock_dir)) == ['shard_0.done']
+
+def test_stale_lock(manifest):
+    r1, r2 = ManifestRunner(manifest, 'n1'), ManifestRunner(manifest, 'n2')
+    r1.lock_dir.mkdir()
+    assert r1._claim('shard_1')
+    old = time.time() - 120
+    os.utime(r1._marker('shard_1', 'lock'), (old, old))
+    assert r2._claim('shard_1')
+    with open(r2._marker('shard_1', 'lock')) as f:
+        assert json.load(f)['node'] == 'n2'
+
+def test_heartbeat(manifest):
+    manifest.lock_timeout = 0.3
+    r1, r2 = ManifestRunner(manifest, 'n1'), ManifestRunner(manifest, 'n2')
+    r1.lock_dir.mkdir()
+    assert r1._claim('shard_0')
+    with r1._heartbeat('shard_0'): # Slow shard, its lock is not stale
+        for _ in range(6):
+            time.sleep(0.1)
+            assert not r2._claim('shard_0')
+    time.sleep(0.4) # The node stopped, without touching its lock
+    assert r2._claim('shard_0')
+    assert not r1._release('shard_0', 'done', {'outputs': ['a.zip']}) # Claimed by the other node
+    assert sorted(os.listdir(r1.lock_dir)) == ['shard_0.lock']
+    assert r2._release('shard_0', 'done', {'outputs': ['b.zip']}) and r1._outputs('shard_0') == ['b.zip']
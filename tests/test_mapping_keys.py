@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import re
+import zipfile
+
+from src.Lavoisier.converter import get_converter
+from src.Lavoisier.conversions.ECS2_to_ILCD1_conversion import ECS2ToILCD1FieldMapping
+from .test_fanout import DATASET, _convert
+from .datasets import make_inputs, get_test_converter, convert, read
+
+class InitMapping(ECS2ToILCD1FieldMapping):
+    # The mapping reads an attribute of the instance
+    def __init__(self):
+        super().__init__()
+        self.extra_keys = {}
+
+    def mapping(self):
+        return super().mapping() | self.extra_keys
+
+class FileInfoMapping(InitMapping):
+    # The attribute is only known with the file information
+    def __init__(self):
+        ECS2ToILCD1FieldMapping.__init__(self)
+
+    def set_file_info(self, path, save_path):
+        super().set_file_info(path, save_path)
+        self.extra_keys = {}
+
+def test_mapping_keys(tmp_path):
+    (tmp_path / 'in').mkdir()
+    (tmp_path / 'in' / 'a.spold').write_text(DATASET)
+    (tmp_path / 'mapping.json').write_text('{}')
+    outputs = []
+    for mapping_class, keys in ((None, True), (InitMapping, True), (FileInfoMapping, False)):
+        save_path = tmp_path / getattr(mapping_class, '__name__', 'default')
+        save_path.mkdir()
+        converter = get_converter(("EcoSpold2", "ecoinvent3.7"), ("ILCD1", "EF3.0"), tmp_path / 'in', save_path)
+        converter.elem_flow_mapping = tmp_path / 'mapping.json'
+        if mapping_class is not None:
+            converter.mapping = {'mapping_class': mapping_class}
+        assert (converter._get_mapping_keys() is not None) == keys # Otherwise the file is read twice
+        outputs.append(_convert(converter))
+    processes = []
+    for output, in outputs:
+        with zipfile.ZipFile(output) as z: # Without the timestamps of the conversion
+            processes.append([re.sub(rb'\d{4}-\d\d-\d\dT[\d:.+-]+', b'', z.read(x)) for x in z.namelist() if x.startswith('processes/')])
+    assert processes[0] and processes[0] == processes[1] == processes[2]
+
+def test_single_pass(tmp_path):
+    make_inputs(tmp_path / 'in', 2)
+    outputs = []
+    for single_pass in (False, True):
+        converter = get_test_converter(tmp_path / 'in', tmp_path / str(single_pass))
+        converter.single_pass = single_pass
+        parse, files = converter._parse, []
+        converter._parse = lambda file, keys: files.append(file) or parse(file, keys)
+        outputs.append(convert(converter))
+        assert len(files) == (2 if single_pass else 4) # Read again by the mapping
+    assert len(outputs[0]) == 2 and [read(x) for x in outputs[0]] == [read(x) for x in outputs[1]]
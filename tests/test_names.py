@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ProcessPoolExecutor
+
+from src.Lavoisier.formats.utils import NameRegistry
+
+def _reserve(path, n):
+    registry = NameRegistry(path)
+    return [registry.reserve('market for electricity', '.spold') for _ in range(n)]
+
+def test_reserve(tmp_path):
+    (tmp_path / 'a.spold').touch()
+    (tmp_path / 'a (2).spold').touch()
+    registry = NameRegistry(tmp_path)
+    assert [registry.reserve('a', '.spold') for _ in range(3)] == ['a (1)', 'a (3)', 'a (4)']
+    assert registry.reserve('a', '.zip') == 'a'
+    (tmp_path / 'a (1).spold').unlink()
+    registry.release('a (1).spold')
+    assert registry.reserve('a', '.spold') == 'a (1)'
+    (tmp_path / 'a (5).spold').touch() # Created by another process
+    assert registry.reserve('a', '.spold') == 'a (6)'
+
+def test_processes(tmp_path):
+    with ProcessPoolExecutor(4) as executor:
+        names = [name for names in executor.map(_reserve, [tmp_path] * 4, [50] * 4) for name in names]
+    assert len(set(names)) == 200 and len(list(tmp_path.iterdir())) == 200
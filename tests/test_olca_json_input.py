@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import json
+import zipfile
+import pytest
+
+from src.Lavoisier.formats import OLCAJSONInput, JSONStreamIterable
+
+FLOW = '7b6bb8a0-1bd5-4a56-a4e3-1b9a4f1b6e2f'
+
+def make_package(path, processes, root=''):
+    with zipfile.ZipFile(path, 'w') as z:
+        z.writestr(f'{root}flows/{FLOW}.json', json.dumps({'@id': FLOW, 'name': 'steel'}))
+        for i in range(processes):
+            z.writestr(f'{root}processes/{i}.json', json.dumps({
+                '@id': str(i), 'name': f'process {i}',
+                'exchanges': [{'internalId': j, 'amount': j, 'flow': {'@id': FLOW}} for j in range(2)]}))
+    return path
+
+@pytest.mark.parametrize('root', ['', 'export/'])
+def test_package(tmp_path, root):
+    input_ = OLCAJSONInput(make_package(tmp_path / 'a.zip', 3, root))
+    files = []
+    for file, is_last in input_.get_files():
+        with input_.open_file(file) as f:
+            items = list(JSONStreamIterable(f, dict.fromkeys(('@id', 'exchanges.item.amount'))))
+        with input_._input_file.open_document('flow', FLOW) as f:
+            assert json.load(f)['name'] == 'steel'
+        files.append((file.name, is_last, items))
+    assert files == [(f'{i}.json', i == 2, [('@id', str(i)), ('exchanges.item.amount', 0), ('exchanges.item.amount', 1)])
+                     for i in range(3)]
+    assert input_._input_file.fp is None # Closed at the end
+
+def test_directory(tmp_path):
+    for name, processes in (('a', 2), ('b', 1)):
+        make_package(tmp_path / f'{name}.zip', processes)
+    input_ = OLCAJSONInput(tmp_path)
+    assert sorted(p.name for p in input_.get_inputs()) == ['a.zip', 'b.zip']
+    assert sorted((str(f.relative_to(tmp_path)), l) for f, l in input_.get_files()) == [
+        ('a.zip/processes/0.json', False), ('a.zip/processes/1.json', True), ('b.zip/processes/0.json', True)]
+
+def test_handle_error(tmp_path):
+    make_package(tmp_path / 'a.zip', 1)
+    input_ = OLCAJSONInput(tmp_path)
+    del input_._input_file # Error raised before the input file was set
+    input_.handle_error()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from src.Lavoisier.formats.utils import PackageTemplate, DirectoryPackage, ZipPackage, OutputProfile
+from src.Lavoisier.formats.sinks import FileSink
+from src.Lavoisier.converter import get_converter
+from .test_fanout import DATASET, _convert
+from .datasets import make_inputs, get_test_converter, convert, read
+
+def _fill(package, src):
+    package.copy('ILCDLocations.xml', src)
+    with ThreadPoolExecutor(4) as executor:
+        for _ in executor.map(lambda i: _write(package, f'processes/{i % 10}.xml', str(i % 10)), range(40)):
+            pass
+    package.copy('sources/a.xml', src)
+
+def _write(package, member, text):
+    with package.open(member) as f:
+        f.write(text)
+
+def test_zip_package(tmp_path):
+    (tmp_path / 'src.xml').write_text('<a/>')
+    sink = FileSink(tmp_path)
+    package = ZipPackage(sink.create())
+    _fill(package, tmp_path / 'src.xml')
+    _fill(package, tmp_path / 'src.xml') # Members written again replace the first ones
+    assert 'processes/1.xml' in package and 'processes/10.xml' not in package
+    package.save(sink, 'ILCD.zip')
+    assert not list(tmp_path.glob('*.part'))
+
+    directory = DirectoryPackage(tmp_path / 'dir')
+    _fill(directory, tmp_path / 'src.xml')
+    directory.save(sink, 'dir.zip')
+    with zipfile.ZipFile(tmp_path / 'ILCD.zip') as a, zipfile.ZipFile(tmp_path / 'dir.zip') as b:
+        assert len(a.namelist()) == 12
+        assert sorted(a.namelist()) == sorted(b.namelist())
+        assert all(a.read(x) == b.read(x) for x in a.namelist())
+
+def test_discard(tmp_path):
+    sink = FileSink(tmp_path)
+    package = ZipPackage(sink.create())
+    _write(package, 'processes/a.xml', 'a')
+    package.discard(sink)
+    assert list(tmp_path.iterdir()) == []
+
+def test_template(tmp_path):
+    (tmp_path / 'src.xml').write_text('<a/>')
+    (tmp_path / 'other.xml').write_text('<b/>')
+    template = PackageTemplate({'ILCDLocations.xml': tmp_path / 'src.xml', 'sources/a.xml': tmp_path / 'src.xml'})
+    assert template.get_path(OutputProfile()) == template.get_path(OutputProfile()) # Built once
+    sink = FileSink(tmp_path)
+    package = ZipPackage(sink.create(), template)
+    package.copy('sources/a.xml', tmp_path / 'other.xml') # The template member is replaced
+    _write(package, 'processes/a.xml', 'a')
+    package.save(sink, 'ILCD.zip')
+    for name, replaced in (('dir_a', False), ('dir_b', True)):
+        directory = DirectoryPackage(tmp_path / name, template)
+        _write(directory, 'processes/a.xml', 'a')
+        if replaced: # The template member is replaced
+            directory.copy('sources/a.xml', tmp_path / 'other.xml')
+        directory.save(sink, name + '.zip')
+    with zipfile.ZipFile(tmp_path / 'ILCD.zip') as z, zipfile.ZipFile(tmp_path / 'dir_a.zip') as a, \
+         zipfile.ZipFile(tmp_path / 'dir_b.zip') as b:
+        assert a.read('sources/a.xml') == b'<a/>' and z.read('sources/a.xml') == b.read('sources/a.xml') == b'<b/>'
+        assert sorted(z.namelist()) == sorted(a.namelist()) == sorted(b.namelist())
+        assert z.read('processes/a.xml') == b'a'
+
+def test_profile(tmp_path):
+    (tmp_path / 'src.xml').write_text('<a/>' * 100)
+    template = PackageTemplate({'sources/a.xml': tmp_path / 'src.xml'})
+    profile = OutputProfile.get('fast')
+    sink = FileSink(tmp_path)
+    for package in (ZipPackage(sink.create(), template, profile), DirectoryPackage(tmp_path / 'dir', template, profile)):
+        package.write_xml('processes/a.xml', {'a': {'b': ['1', '2']}})
+        package.save(sink, 'ILCD.zip')
+        with zipfile.ZipFile(tmp_path / 'ILCD.zip') as z:
+            assert {x.compress_type for x in z.infolist()} == {zipfile.ZIP_DEFLATED}
+            assert z.read('processes/a.xml') == b'<?xml version="1.0" encoding="utf-8"?>\n<a><b>1</b><b>2</b></a>'
+    assert template.get_path(profile) != template.get_path(OutputProfile()) # One template for each compression
+    assert OutputProfile.get({'pretty': False, 'compression': zipfile.ZIP_DEFLATED, 'compresslevel': 9}) == OutputProfile.get('small')
+    with pytest.raises(ValueError):
+        OutputProfile(compresslevel=5) # Only for the deflate
+    with pytest.raises(ValueError):
+        OutputProfile.get('other')
+
+def test_replaced(tmp_path):
+    (tmp_path / 'src.xml').write_text('<a/>')
+    sink = FileSink(tmp_path)
+    package = ZipPackage(sink.create(), PackageTemplate({'sources/a.xml': tmp_path / 'src.xml'}))
+    for text in ('a', 'b'):
+        _write(package, 'processes/a.xml', text)
+    package.copy('sources/a.xml', tmp_path / 'src.xml')
+    package.save(sink, 'ILCD.zip')
+    with zipfile.ZipFile(tmp_path / 'ILCD.zip') as z:
+        assert sorted(z.namelist()) == ['processes/a.xml', 'sources/a.xml'] and z.read('processes/a.xml') == b'b'
+    assert not list(tmp_path.glob('*.part'))
+
+STEEL = """<intermediateExchange id="0a1b2c3d-0000-4000-8000-000000000010" unitId="0a1b2c3d-0000-4000-8000-000000000006" amount="3" intermediateExchangeId="0a1b2c3d-0000-4000-8000-000000000011">
+        <name xml:lang="en">steel</name>
+        <unitName xml:lang="en">kg</unitName>
+        {}<inputGroup>5</inputGroup>
+      </intermediateExchange>
+      <elementaryExchange"""
+
+def test_template_processes(tmp_path):
+    # The worker processes (forked) don't remove the template zip files of the parent process
+    make_inputs(tmp_path / 'in', 3)
+    outputs = [convert(get_test_converter(tmp_path / 'in', tmp_path / name), workers=workers)
+               for name, workers in (('a', 1), ('b', 2), ('c', 1))]
+    assert all(read(x) == read(y) for x, y in zip(outputs[0], outputs[2]))
+    assert all(read(x) == read(y) for x, y in zip(outputs[0], outputs[1]))
+
+def test_database(tmp_path):
+    # The flow of the exchange is written again by the second process, with its synonym
+    for name in ('in', 'directory', 'zip'):
+        (tmp_path / name).mkdir()
+    for i, synonym in enumerate(('', '<synonym xml:lang="en">iron alloy</synonym>')):
+        (tmp_path / 'in' / f'{i}.spold').write_text(DATASET.replace('<elementaryExchange', STEEL.format(synonym), 1)
+                                                    .replace('-000000000001"', f'-00000000010{i}"'))
+    (tmp_path / 'mapping.json').write_text('{}')
+    packages = []
+    for name in ('directory', 'zip'):
+        converter = get_converter(("EcoSpold2", "ecoinvent3.7"), ("ILCD1", "EF3.0"), tmp_path / 'in', tmp_path / name)
+        converter.elem_flow_mapping = tmp_path / 'mapping.json'
+        converter.write_package_directly = name == 'zip'
+        packages.append(zipfile.ZipFile(_convert(converter, 'to_database')[0]))
+    flows = [[x for x in package.namelist() if x.startswith('flows/') and b'steel' in package.read(x)] for package in packages]
+    assert len(flows[0]) == 1 and flows[0] == flows[1]
+    assert b'<common:synonyms>iron alloy</common:synonyms>' in packages[0].read(flows[0][0]) == packages[1].read(flows[0][0])
+    assert sorted(packages[0].namelist()) == sorted(packages[1].namelist())
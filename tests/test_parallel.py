@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import pytest
+import zipfile
+from pathlib import Path
+
+from src.Lavoisier.converter import Converter
+from src.Lavoisier.formats.sinks import MemorySink
+from .datasets import make_inputs, get_test_converter, convert, read
+
+def test_same_as_serial(tmp_path):
+    make_inputs(tmp_path / 'in', 5)
+    serial = convert(get_test_converter(tmp_path / 'in', tmp_path / 'serial'))
+    parallel = convert(get_test_converter(tmp_path / 'in', tmp_path / 'parallel'), workers=2)
+    assert len(serial) == 5
+    assert [Path(x).name for x in parallel] == [Path(x).name for x in serial] # In the order of the inputs
+    assert all(read(a) == read(b) for a, b in zip(serial, parallel))
+
+def test_error(tmp_path):
+    # The broken input is the first one sent to the workers, so most of the others are not converted
+    make_inputs(tmp_path / 'in', 12, broken=(5,))
+    converter = get_test_converter(tmp_path / 'in', tmp_path / 'out')
+    with pytest.raises(Exception):
+        convert(converter, workers=2)
+    assert len(list((tmp_path / 'out').glob('*.zip'))) < 11
+
+def test_save_directory(tmp_path):
+    make_inputs(tmp_path / 'in', 2)
+    converter = get_test_converter(tmp_path / 'in', tmp_path / 'out')
+    converter.save_path = MemorySink()
+    with pytest.raises(ValueError):
+        converter.convert('to_file', workers=2)
+
+def test_split_by_cost():
+    split = Converter._split_by_cost
+    assert split(list('abcd'), [1, 1, 1, 1], 2) == [['a', 'b'], ['c', 'd']]
+    assert split(list('abcd'), [10, 1, 1, 1], 2) == [['a'], ['b', 'c', 'd']]
+    for n in range(1, 6):
+        for costs in ([1, 1, 1], [100, 1, 1], [1, 1, 100], [0, 0, 0]):
+            shards = split(list('abc'), costs, min(n, 3))
+            assert [x for shard in shards for x in shard] == list('abc') # Contiguous
+            assert len(shards) == min(n, 3) and all(shards) # None empty
+
+def test_database(tmp_path):
+    make_inputs(tmp_path / 'in', 5)
+    serial, = convert(get_test_converter(tmp_path / 'in', tmp_path / 'serial'), 'to_database')
+    parallel, = convert(get_test_converter(tmp_path / 'in', tmp_path / 'parallel'), 'to_database', workers=2)
+    serial, parallel = read(serial), read(parallel)
+    assert sorted(serial) == sorted(parallel)
+    assert {k: v for k, v in serial.items() if not k.endswith('.log')} == {k: v for k, v in parallel.items() if not k.endswith('.log')}
+
+def test_merge(tmp_path):
+    packages = []
+    for i in range(2):
+        packages.append(tmp_path / f'{i}.zip')
+        with zipfile.ZipFile(packages[-1], 'w') as z:
+            for name in ('sources/a.xml', 'contacts/a.xml', 'flows/a.xml', 'processes/a.xml'):
+                z.writestr(name, f'{i}'.encode())
+            z.writestr(f'processes/{i}.xml', b'')
+            z.writestr('conversion.log', f'log {i}\n'.encode())
+    converter = get_test_converter(tmp_path, tmp_path / 'out')
+    merged = read(converter.merge(packages))
+    assert merged == {'sources/a.xml': b'0', 'contacts/a.xml': b'0', # From the first package
+                      'flows/a.xml': b'1', 'processes/a.xml': b'1', # Rewritten
+                      'processes/0.xml': b'', 'processes/1.xml': b'', 'conversion.log': b'log 0\nlog 1\n'}
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import pytest
+import sqlite3
+import tarfile
+
+from src.Lavoisier.converter import get_converter
+from src.Lavoisier.formats.sinks import FileSink, MemorySink, TarSink, SQLiteSink
+
+def _write(sink, name, data):
+    name = sink.reserve(name, '.spold')
+    with sink.open(name + '.spold') as f:
+        f.write(data)
+    return name
+
+def test_sinks(tmp_path):
+    stream = io.BytesIO()
+    sinks = [FileSink(tmp_path), MemorySink(), TarSink(stream, 'w|'), SQLiteSink(tmp_path / 'outputs.db')]
+    for sink in sinks:
+        assert [_write(sink, 'a', bytes([i])) for i in range(2)] == ['a', 'a (1)']
+        with pytest.raises(ValueError):
+            with sink.open('a (2).spold') as f:
+                raise ValueError
+        assert sink.reserve('a', '.spold') == 'a (2)' # Released after the error
+        sink.close()
+    assert (tmp_path / 'a (1).spold').read_bytes() == b'\x01' and not list(tmp_path.glob('*.part'))
+    assert sinks[1].outputs == {'a.spold': b'\x00', 'a (1).spold': b'\x01'}
+    stream.seek(0)
+    with tarfile.open(fileobj=stream) as t:
+        assert t.getnames() == ['a.spold', 'a (1).spold'] and t.extractfile('a (1).spold').read() == b'\x01'
+    connection = sqlite3.connect(tmp_path / 'outputs.db')
+    assert dict(connection.execute('SELECT name, data FROM outputs')) == sinks[1].outputs
+    connection.close()
+    sink = SQLiteSink(tmp_path / 'outputs.db')
+    assert sink.reserve('a', '.spold') == 'a (2)' # Names of the table
+    sink.close()
+
+def test_converter(tmp_path):
+    converter = get_converter(("EcoSpold2", "ecoinvent3.7"), ("ILCD1", "EF3.0"), tmp_path, MemorySink())
+    assert converter.convert('to_file') == [] # No inputs
+    with pytest.raises(ValueError):
+        converter.convert('to_file', workers=2)
+    converter.journal = tmp_path / 'journal.jsonl'
+    with pytest.raises(ValueError):
+        converter.convert('to_file')
+    assert get_converter(("EcoSpold2", "ecoinvent3.7"), ("ILCD1", "EF3.0"), tmp_path, FileSink(tmp_path)).save_path == tmp_path
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import io
+import pytest
+
+from src.Lavoisier.formats.utils import XMLStreamIterable, ExpatStreamIterable, LXMLStreamIterable, reads
+
+XML = b'''<root xmlns="ns"><items>''' + b''.join(
+    b'<item id="%d"><name lang="en">item %d</name><value>%d</value></item>' % (i, i, i) for i in range(50)
+    ) + b'''</items><end a="1"/></root>'''
+
+@pytest.mark.parametrize('keys', [
+    ('/root/items/item', '/root/items/item/@id', '/root/end/@a'),
+    ('/root/items/item/name', '/root/items/item/value', '/root/items'),
+    ('/root/items/item/value',)
+    ])
+def test_released_elements(keys, monkeypatch):
+    monkeypatch.setattr(XMLStreamIterable, 'release_elements', False)
+    expected = list(XMLStreamIterable(io.BytesIO(XML), dict.fromkeys(keys)))
+    monkeypatch.setattr(XMLStreamIterable, 'release_elements', True)
+    assert list(XMLStreamIterable(io.BytesIO(XML), dict.fromkeys(keys))) == expected
+
+def test_bounded_tree():
+    it = XMLStreamIterable(io.BytesIO(XML), dict.fromkeys(('/root/items/item', '/root/end/@a')))
+    assert len(list(it)) == 51
+    assert len(it._tree.root) == 0 # Elements are removed from the tree once parsed
+
+
+MIXED = '''<?xml version="1.0" encoding="UTF-8"?>
+<a:root xmlns:a="ns_a" xmlns="ns" xmlns:common="common">
+    <!-- comment --><?pi data?>
+    <name xml:lang="en">Name &amp; <![CDATA[<cdata>]]></name>
+    <name xml:lang="pt"/>
+    <item common:id="1" id="2">text<sub>s</sub>tail<sub/>
+        <list><v>1</v><v>2</v></list>
+    </item>
+    <item>   </item>
+    <empty/>
+</a:root>'''
+
+@pytest.mark.parametrize('iterator', [ExpatStreamIterable, LXMLStreamIterable])
+@pytest.mark.parametrize('keys', [
+    ('/root/name', '/root/item', '/root/empty', '/root/item/@id'),
+    ('/root/item/sub', '/root/item/list/v', '/root/item/@{common}id', '/root/name/@lang'),
+    ('/root/item/list', '/root/item'),
+    ('/root',)
+    ])
+def test_iterators(iterator, keys):
+    if iterator is LXMLStreamIterable:
+        pytest.importorskip('lxml')
+    expected = list(XMLStreamIterable(io.StringIO(MIXED), dict.fromkeys(keys)))
+    assert expected
+    f = io.TextIOWrapper(io.BytesIO(MIXED.encode()), encoding='utf-8') # Files are opened in text mode
+    assert list(iterator(f, dict.fromkeys(keys))) == expected
+
+@pytest.mark.parametrize('iterator', [XMLStreamIterable, ExpatStreamIterable])
+@pytest.mark.parametrize('fields', [(), ('@id',), ('#text', 'sub'), ('@lang', '#text'), ('list', '@id', 'missing')])
+def test_selected_fields(iterator, fields):
+    keys = ('/root/name', '/root/item', '/root/empty')
+    full = list(iterator(io.StringIO(MIXED), dict.fromkeys(keys)))
+    selected = list(iterator(io.StringIO(MIXED), {key: reads(*fields)(lambda x: x) for key in keys}))
+    assert selected == [(k, {f: v for f, v in t.items() if f in fields} if isinstance(t, dict) else t) for k, t in full]
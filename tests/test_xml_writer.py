@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from io import StringIO
+import xmltodict
+
+from src.Lavoisier.data_structures.main import to_dict
+from src.Lavoisier.data_structures.writer import XMLWriter
+
+TREE = {'root': {
+    '@xmlns': {'': 'http://a', 'b': 'http://b'},
+    '@version': '1.1',
+    'text': 'a < b & c > d',
+    'attr': {'@value': 'say "hi"\n\t', '@other': "it's \"x\"", '#text': 'x'},
+    'empty': [],
+    'none': None,
+    'flag': True,
+    'number': 1.5,
+    'list': ['a', {'@id': '1'}, {'nested': {'#text': 't', 'deep': 'y'}}, None],
+    }}
+
+def _unparse(tree):
+    return xmltodict.unparse(to_dict(tree), pretty=True, newl='\n', indent='  ')
+
+def test_same_as_unparse():
+    f = StringIO()
+    XMLWriter().write(TREE, f)
+    assert f.getvalue() == _unparse(TREE)
+
+def test_compact():
+    f, writer = StringIO(), XMLWriter()
+    writer.pretty = False
+    writer.write(TREE, f)
+    assert f.getvalue() == xmltodict.unparse(to_dict(TREE))